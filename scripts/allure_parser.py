@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 from benchmark_config import BenchmarkConfig, ChartTest
 
+ParsedTestCase = Tuple[Dict, List[Dict], List[Dict], List[Dict]]
+
 
 def attachment_path(benchmark_dir: Path, source: str) -> Path:
     path = benchmark_dir / 'attachments' / source
@@ -16,63 +21,107 @@ def attachment_path(benchmark_dir: Path, source: str) -> Path:
     return path
 
 
-def parse_metric_attachment(attachment_file: Path, metric_keyword: str) -> Dict:
-    if not attachment_file.exists():
+def _metric_summary(run_values: List[float], avg_value: Optional[float]) -> Dict:
+    if not run_values:
         return {}
+    return {
+        'min_value': min(run_values),
+        'max_value': max(run_values),
+        'avg_value': avg_value if avg_value is not None else sum(run_values) / len(run_values),
+        'run_count': len(run_values),
+        'all_runs': ','.join(map(str, run_values)),
+    }
+
+
+def parse_metric_attachment_keywords(
+    attachment_file: Path,
+    metric_keywords: Sequence[str],
+) -> Dict[str, Dict]:
+    """Stream one attachment and extract every keyword's runs in a single scan."""
+    results: Dict[str, Dict] = {keyword: {} for keyword in metric_keywords}
+    if not attachment_file.exists() or not results:
+        return results
 
-    keyword = metric_keyword.lower()
+    keywords = {keyword: keyword.lower() for keyword in results}
+    run_values: Dict[str, List[float]] = {keyword: [] for keyword in results}
+    avg_values: Dict[str, Optional[float]] = {keyword: None for keyword in results}
+    failed: Dict[str, Exception] = {}
     try:
-        run_values = []
-        avg_value = None
-        for line in attachment_file.read_text(encoding='utf-8').split('\n'):
-            line_lower = line.lower()
-            if keyword not in line_lower:
-                continue
-            parts = line.split(':')
-            if len(parts) <= 1:
-                continue
-            try:
-                value = float(parts[1].strip().split()[0])
-            except ValueError:
-                continue
-            if 'average' in line_lower:
-                avg_value = value
-            else:
-                run_values.append(value)
-
-        if not run_values:
-            return {}
-
-        return {
-            'min_value': min(run_values),
-            'max_value': max(run_values),
-            'avg_value': avg_value if avg_value is not None else sum(run_values) / len(run_values),
-            'run_count': len(run_values),
-            'all_runs': ','.join(map(str, run_values)),
-        }
+        with open(attachment_file, encoding='utf-8') as handle:
+            for line in handle:
+                line = line.rstrip('\n')
+                line_lower = line.lower()
+                matching = [
+                    keyword for keyword, lowered in keywords.items()
+                    if lowered in line_lower and keyword not in failed
+                ]
+                if not matching:
+                    continue
+                parts = line.split(':')
+                if len(parts) <= 1:
+                    continue
+                try:
+                    value = float(parts[1].strip().split()[0])
+                except ValueError:
+                    continue
+                except IndexError as error:
+                    for keyword in matching:
+                        failed[keyword] = error
+                    continue
+                for keyword in matching:
+                    if 'average' in line_lower:
+                        avg_values[keyword] = value
+                    else:
+                        run_values[keyword].append(value)
     except Exception as error:
-        print(f'Warning: Failed to parse {metric_keyword} attachment {attachment_file}: {error}')
-        return {}
+        failed = {keyword: error for keyword in results}
 
+    for keyword in results:
+        if keyword in failed:
+            print(
+                f'Warning: Failed to parse {keyword} attachment {attachment_file}: '
+                f'{failed[keyword]}'
+            )
+            continue
+        results[keyword] = _metric_summary(run_values[keyword], avg_values[keyword])
+    return results
 
-def find_attachment_source(test_data: Dict, keyword: str) -> Optional[str]:
-    keyword = keyword.lower()
 
-    def find_in_stage(stage: Dict) -> Optional[str]:
-        for attachment in stage.get('attachments', []):
-            if keyword in attachment.get('name', '').lower():
-                source = attachment.get('source', '')
-                if source:
-                    return source
+def parse_metric_attachment(attachment_file: Path, metric_keyword: str) -> Dict:
+    return parse_metric_attachment_keywords(attachment_file, [metric_keyword])[metric_keyword]
+
+
+AttachmentIndex = List[Tuple[str, str]]
 
-        for step in stage.get('steps', []):
-            source = find_in_stage(step)
+
+def build_attachment_index(test_data: Dict) -> AttachmentIndex:
+    """Flatten testStage attachments to (lowercased name, source) in step order.
+
+    Order matches a depth-first walk: a stage's own attachments come before
+    those of its nested steps, so the first index hit is the first tree hit.
+    """
+    index: AttachmentIndex = []
+    stack = [test_data.get('testStage', {})]
+    while stack:
+        stage = stack.pop()
+        for attachment in stage.get('attachments', []):
+            source = attachment.get('source', '')
             if source:
-                return source
+                index.append((attachment.get('name', '').lower(), source))
+        stack.extend(reversed(stage.get('steps', [])))
+    return index
 
-        return None
 
-    return find_in_stage(test_data.get('testStage', {}))
+def lookup_attachment_source(index: AttachmentIndex, keyword: str) -> Optional[str]:
+    keyword = keyword.lower()
+    for name, source in index:
+        if keyword in name:
+            return source
+    return None
+
+
+def find_attachment_source(test_data: Dict, keyword: str) -> Optional[str]:
+    return lookup_attachment_source(build_attachment_index(test_data), keyword)
 
 
 def _load_time_row(test_name: str, status: str, metric_data: Dict) -> Dict:
@@ -96,9 +145,9 @@ def _resource_row(chart: ChartTest, test_name: str, status: str, metric_data: Di
     }
 
 
-def _attachment_keyword_for_test(chart: ChartTest, test_name: str) -> str:
+def _attachment_keyword_for_test(chart: ChartTest, found_patterns: Set[str]) -> str:
     for index, pattern in enumerate(chart.historical_patterns):
-        if pattern not in test_name:
+        if pattern not in found_patterns:
             continue
         if index < len(chart.historical_attachment_keywords):
             return chart.historical_attachment_keywords[index]
@@ -110,8 +159,17 @@ def parse_test_case_json(
     json_file: Path,
     benchmark_dir: Path,
     config: BenchmarkConfig,
-) -> Tuple[Dict, List[Dict], List[Dict], List[Dict]]:
-    data = json.loads(json_file.read_text(encoding='utf-8'))
+) -> ParsedTestCase:
+    return _parse_test_case(json_file.read_bytes(), benchmark_dir, config)[0]
+
+
+def _parse_test_case(
+    raw: bytes,
+    benchmark_dir: Path,
+    config: BenchmarkConfig,
+) -> Tuple[ParsedTestCase, List[Path]]:
+    """Parse one test case; also returns the metric attachment files it read."""
+    data = json.loads(raw.decode('utf-8'))
 
     test_result = {
         'test_name': data.get('name', ''),
@@ -125,21 +183,27 @@ def parse_test_case_json(
     cpu_results: List[Dict] = []
     ram_results: List[Dict] = []
 
-    for chart in config.charts:
-        patterns = (
-            chart.source_pattern or chart.pattern,
-            *chart.historical_patterns,
-        )
-        if not any(pattern in test_name for pattern in patterns):
-            continue
-        attachment_keyword = _attachment_keyword_for_test(chart, test_name)
-        attachment_source = find_attachment_source(data, attachment_keyword)
+    matched_charts, found_patterns = config.chart_matcher.match(test_name)
+    attachment_index = build_attachment_index(data) if matched_charts else []
+    routes = []
+    keywords_by_source: Dict[str, List[str]] = {}
+    for chart in matched_charts:
+        attachment_keyword = _attachment_keyword_for_test(chart, found_patterns)
+        attachment_source = lookup_attachment_source(attachment_index, attachment_keyword)
         if not attachment_source:
             continue
-        metric_data = parse_metric_attachment(
-            attachment_path(benchmark_dir, attachment_source),
-            attachment_keyword,
-        )
+        routes.append((chart, attachment_keyword, attachment_source))
+        keywords_by_source.setdefault(attachment_source, []).append(attachment_keyword)
+
+    attachment_files = {
+        source: attachment_path(benchmark_dir, source) for source in keywords_by_source
+    }
+    metrics_by_source = {
+        source: parse_metric_attachment_keywords(attachment_files[source], keywords)
+        for source, keywords in keywords_by_source.items()
+    }
+    for chart, attachment_keyword, attachment_source in routes:
+        metric_data = metrics_by_source[attachment_source][attachment_keyword]
         if not metric_data:
             continue
 
@@ -156,4 +220,60 @@ def parse_test_case_json(
                 _resource_row(chart, chart.pattern, test_result['status'], metric_data)
             )
 
-    return test_result, performance_results, cpu_results, ram_results
+    parsed = (test_result, performance_results, cpu_results, ram_results)
+    return parsed, list(attachment_files.values())
+
+
+def _file_digest(raw: bytes, attachment_files: Sequence[Path]) -> str:
+    """SHA-256 of a test case and the metric attachments its rows came from."""
+    digest = hashlib.sha256(raw)
+    for attachment_file in sorted(attachment_files, key=lambda path: path.name):
+        if attachment_file.exists():
+            digest.update(b'\0' + attachment_file.name.encode('utf-8') + b'\0')
+            digest.update(attachment_file.read_bytes())
+    return digest.hexdigest()
+
+
+def _parse_test_case_safe(
+    json_file: Path,
+    benchmark_dir: Path,
+    config: BenchmarkConfig,
+) -> Tuple[Optional[ParsedTestCase], Optional[str], str]:
+    try:
+        raw = json_file.read_bytes()
+    except OSError as error:
+        return None, str(error), ''
+    try:
+        parsed, attachment_files = _parse_test_case(raw, benchmark_dir, config)
+    except Exception as error:
+        return None, str(error), _file_digest(raw, ())
+    return parsed, None, _file_digest(raw, attachment_files)
+
+
+def parse_test_cases(
+    json_files: Sequence[Path],
+    benchmark_dir: Path,
+    config: BenchmarkConfig,
+    *,
+    jobs: int = 1,
+) -> Iterator[Tuple[Path, Optional[ParsedTestCase], Optional[str], str]]:
+    """Yield (json_file, parsed, error, digest) in input order, fanning out to worker processes.
+
+    Results come back in the order of ``json_files`` whatever the worker count, so
+    callers that merge rows and counters sequentially produce identical CSVs.
+    ``digest`` covers the test-case JSON and the metric attachments it was parsed
+    from, hashed in the worker that already read them (see ``run_ledger.bundle_digest``).
+    """
+    parse_one = partial(_parse_test_case_safe, benchmark_dir=benchmark_dir, config=config)
+    if jobs <= 1 or len(json_files) <= 1:
+        for json_file in json_files:
+            yield (json_file, *parse_one(json_file))
+        return
+
+    workers = min(jobs, len(json_files))
+    chunksize = max(1, len(json_files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for json_file, result in zip(
+            json_files, executor.map(parse_one, json_files, chunksize=chunksize),
+        ):
+            yield (json_file, *result)
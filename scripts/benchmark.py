@@ -3,9 +3,10 @@
 import argparse
 import csv
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import pandas as pd
 
@@ -28,14 +29,49 @@ def _configure_stdio() -> None:
 
 _configure_stdio()
 
-from allure_parser import parse_test_case_json
-from benchmark_config import DEFAULT_CONFIG, BenchmarkConfig, ChartEntry, load_benchmark_config
-from chart_builder import cleanup_stale_charts, render_chart
-from environment_parser import load_run_environment, record_run_environment
-from regression_report import collect_scenario_summaries, collect_violations, write_regression_report
+from allure_parser import parse_test_cases
+from benchmark_config import (
+    CHART_WINDOW_DAYS,
+    DEFAULT_CONFIG,
+    SITE_MODES,
+    BenchmarkConfig,
+    ChartEntry,
+    ChartTest,
+    load_benchmark_config,
+    load_desktop_build_labels,
+)
+from bisect_hint import BISECT_HINTS_JSON, write_bisect_hints_json
+from chart_builder import ChartSeriesCache, cleanup_stale_charts, render_charts
+from environment_parser import RUN_ENVIRONMENT_CSV, load_run_environment, record_run_environment
+from metrics_store import (
+    QUERY_PUSHDOWN_BACKENDS,
+    STORAGE_BACKENDS,
+    ColumnarMetricsStore,
+    CsvMetricsStore,
+    MetricsQuery,
+    PartitionedMetricsStore,
+    copy_metrics,
+    open_metrics_store,
+)
+from page_budget import check_site_budget
+from regression_report import (
+    collect_bisect_hints,
+    collect_scenario_summaries,
+    collect_violations,
+    write_regression_report,
+)
+from render_cache import RenderCache
+from run_ledger import (
+    ProcessedRun,
+    bundle_digest,
+    load_run_ledger,
+    matching_runs,
+    record_processed_run,
+)
 from site_generator import write_docs_root_index, write_site
 
 CONFIG: BenchmarkConfig
+STORAGE_BACKEND = 'csv'
 
 METRICS_CSV = {
     'performance': ('performance_metrics.csv', {
@@ -48,30 +84,65 @@ METRICS_CSV = {
         'min_ram_mb': 'min_value', 'max_ram_mb': 'max_value', 'avg_ram_mb': 'avg_value',
     }),
 }
+METRICS_FILES = tuple(csv_name for csv_name, _ in METRICS_CSV.values())
+SUMMARY_CSV = 'summary_metrics.csv'
+RUN_CSV_FILES = (SUMMARY_CSV, *METRICS_FILES, RUN_ENVIRONMENT_CSV)
+
+
+def _metrics_store(data_dir: Path) -> CsvMetricsStore:
+    return open_metrics_store(STORAGE_BACKEND, data_dir)
 
 
 def _append_csv_rows(data_dir: Path, filename: str, fieldnames: List[str], rows: List[Dict]) -> None:
-    if not rows:
-        return
-    csv_path = data_dir / filename
-    file_exists = csv_path.exists()
-    with open(csv_path, 'a', newline='', encoding='utf-8') as file:
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        if not file_exists:
-            writer.writeheader()
-        writer.writerows(rows)
+    _metrics_store(data_dir).append_rows(filename, fieldnames, rows)
 
 
-def _read_metrics_csv(data_dir: Path, filename: str) -> Optional[pd.DataFrame]:
-    path = data_dir / filename
-    if not path.exists():
-        return None
-    return pd.read_csv(path, parse_dates=['date']).sort_values('date')
+def _remove_run_rows(data_dir: Path, filename: str, runs: List[ProcessedRun]) -> int:
+    """Drop rows written by earlier parses of the given runs; returns rows removed."""
+    store = _metrics_store(data_dir) if filename in METRICS_FILES else CsvMetricsStore(data_dir)
+    return store.remove_runs(filename, {(run.commit_hash, run.date) for run in runs})
+
+
+def _read_metrics_csv(
+    data_dir: Path,
+    filename: str,
+    query: Optional[MetricsQuery] = None,
+) -> Optional[pd.DataFrame]:
+    return _metrics_store(data_dir).read(filename, query=query)
+
+
+def chart_window_query(charts: Sequence[ChartTest]) -> MetricsQuery:
+    """Rows any of these charts can show: the chart window, pinned baselines, their patterns."""
+    return MetricsQuery(
+        since=pd.Timestamp.now().normalize() - pd.Timedelta(days=CHART_WINDOW_DAYS),
+        baselines=tuple(sorted({
+            commit_hash for chart in charts for commit_hash in chart.baselines if commit_hash
+        })),
+        patterns=tuple(sorted({
+            pattern for chart in charts
+            for pattern in (chart.pattern, *chart.historical_patterns)
+        })),
+    )
 
 
-def load_metrics(data_dir: Path) -> Dict[str, Optional[pd.DataFrame]]:
+def load_metrics(
+    data_dir: Path,
+    charts: Optional[Sequence[ChartTest]] = None,
+) -> Dict[str, Optional[pd.DataFrame]]:
+    """Load each metrics kind.
+
+    With charts and a sqlite or partitioned store, only rows those charts can use
+    are read; csv and columnar stores load whole files, as filtering them would
+    not save any I/O.
+    """
+    push_down = charts is not None and STORAGE_BACKEND in QUERY_PUSHDOWN_BACKENDS
     return {
-        kind: _read_metrics_csv(data_dir, csv_name)
+        kind: _read_metrics_csv(
+            data_dir,
+            csv_name,
+            chart_window_query([c for c in charts if c.metrics_kind == kind])
+            if push_down else None,
+        )
         for kind, (csv_name, _) in METRICS_CSV.items()
     }
 
@@ -83,6 +154,8 @@ def process_benchmark_run(
     date: str,
     *,
     machine_info_file: Optional[Path] = None,
+    jobs: int = 1,
+    force: bool = False,
 ):
     print(f'\nProcessing benchmark: {benchmark_dir}')
 
@@ -110,11 +183,18 @@ def process_benchmark_run(
         'total_retries': 0, 'flaky_tests': 0,
     }
 
-    for json_file in json_files:
+    if jobs > 1:
+        print(f'Parsing with {jobs} workers')
+    file_digests: Dict[str, str] = {}
+    for json_file, parsed, error, digest in parse_test_cases(
+        json_files, benchmark_dir, CONFIG, jobs=jobs,
+    ):
+        file_digests[json_file.name] = digest
+        if parsed is None:
+            print(f'Error parsing {json_file.name}: {error}')
+            continue
         try:
-            test_result, performance_metrics, cpu_metrics, ram_metrics = parse_test_case_json(
-                json_file, benchmark_dir, CONFIG,
-            )
+            test_result, performance_metrics, cpu_metrics, ram_metrics = parsed
             aggregate['total_tests'] += 1
             aggregate[test_result['status']] = aggregate.get(test_result['status'], 0) + 1
             aggregate['total_duration_ms'] += test_result['duration_ms']
@@ -129,6 +209,14 @@ def process_benchmark_run(
         except Exception as error:
             print(f'Error parsing {json_file.name}: {error}')
 
+    # Hashed from the parse workers' per-file digests, so the ledger check costs no
+    # extra pass over the bundle; a skipped bundle has written nothing yet.
+    bundle_hash = bundle_digest(file_digests)
+    superseded = matching_runs(load_run_ledger(data_dir), commit_hash, date, bundle_hash)
+    if not force and any(run.bundle_hash == bundle_hash for run in superseded):
+        print(f'Skipping: bundle {bundle_hash[:12]} already processed for {commit_hash}')
+        return
+
     if aggregate['total_tests'] == 0:
         print('Error: No test results found')
         return
@@ -142,7 +230,11 @@ def process_benchmark_run(
 
     data_dir.mkdir(parents=True, exist_ok=True)
 
-    summary_csv = data_dir / 'summary_metrics.csv'
+    if superseded:
+        removed = sum(_remove_run_rows(data_dir, filename, superseded) for filename in RUN_CSV_FILES)
+        print(f'Replacing {len(superseded)} earlier parse(s) of {commit_hash} ({removed} rows)')
+
+    summary_csv = data_dir / SUMMARY_CSV
     file_exists = summary_csv.exists()
     with open(summary_csv, 'a', newline='', encoding='utf-8') as handle:
         fieldnames = [
@@ -185,6 +277,16 @@ def process_benchmark_run(
     record_run_environment(
         data_dir, commit_hash, date, machine_info_file=machine_info_file,
     )
+    record_processed_run(
+        data_dir,
+        ProcessedRun(
+            commit_hash=commit_hash,
+            date=date,
+            bundle_hash=bundle_hash,
+            test_cases=aggregate['total_tests'],
+        ),
+        replaces=superseded,
+    )
 
     print(f"Processed {aggregate['total_tests']} tests")
     if performance_results:
@@ -197,35 +299,47 @@ def process_benchmark_run(
     print(f"Total duration: {aggregate['total_duration_ms']}ms")
 
 
-def generate_graphs(data_dir: Path, output_dir: Path):
+def generate_graphs(
+    data_dir: Path,
+    output_dir: Path,
+    *,
+    render_jobs: int = 1,
+    force_render: bool = False,
+    site_mode: str = 'iframe',
+) -> List[str]:
+    """Render charts and the site; return the site budget overruns."""
+    started = time.perf_counter()
     graph_filenames = [chart.graph_filename for chart in CONFIG.charts]
     output_dir.mkdir(parents=True, exist_ok=True)
     cleanup_stale_charts(output_dir, graph_filenames)
 
     print(f'\nLoading data from {data_dir}...')
-    metrics = load_metrics(data_dir)
+    metrics = load_metrics(data_dir, CONFIG.charts)
     run_environment = load_run_environment(data_dir)
 
-    charts_by_test_id: Dict[str, ChartEntry] = {}
+    series_cache = ChartSeriesCache(metrics, CONFIG.charts, load_desktop_build_labels())
+    charts_to_render = [
+        chart for chart in CONFIG.charts
+        if metrics.get(chart.metrics_kind) is not None
+        and not metrics[chart.metrics_kind].empty
+    ]
 
     print(f'\nGenerating charts in {output_dir}...')
-    for chart in CONFIG.charts:
-        frame = metrics.get(chart.metrics_kind)
-        if frame is None or frame.empty:
-            continue
-        try:
-            entry = render_chart(chart, frame, output_dir, CONFIG.defaults)
-            if entry is not None:
-                charts_by_test_id[chart.test_id] = entry
-        except Exception as error:
-            print(f'Error generating chart for {chart.test_id}: {error}')
+    if render_jobs > 1:
+        print(f'Rendering with {render_jobs} workers')
+    render_cache = RenderCache(output_dir) if force_render else RenderCache.load(output_dir)
+    charts_by_test_id: Dict[str, ChartEntry] = render_charts(
+        charts_to_render, output_dir, CONFIG.defaults, series_cache,
+        jobs=render_jobs, render_cache=render_cache, site_mode=site_mode,
+    )
 
     print('\nGenerating GitHub Pages site...')
-    summaries = collect_scenario_summaries(metrics, CONFIG)
+    summaries = collect_scenario_summaries(metrics, CONFIG, series_cache=series_cache)
     performance = metrics.get('performance')
     violations = []
     if performance is not None and not performance.empty:
-        violations = collect_violations(performance, CONFIG)
+        violations = collect_violations(performance, CONFIG, series_cache=series_cache)
+    bisect_hints = collect_bisect_hints(violations, CONFIG, series_cache)
     write_site(
         output_dir, CONFIG.pages, charts_by_test_id,
         chart_tests=CONFIG.charts,
@@ -233,14 +347,26 @@ def generate_graphs(data_dir: Path, output_dir: Path):
         run_environment=run_environment,
         violations=violations,
         flag_tickets=CONFIG.flag_tickets,
+        bisect_hints=bisect_hints,
+        defaults=CONFIG.defaults,
+        site_mode=site_mode,
     )
     write_docs_root_index(output_dir.parent)
 
     report_path = output_dir / 'regression_report.md'
     if performance is not None and not performance.empty:
-        write_regression_report(performance, CONFIG, report_path, violations=violations)
+        write_regression_report(
+            performance, CONFIG, report_path,
+            violations=violations, series_cache=series_cache, bisect_hints=bisect_hints,
+        )
 
+    budget_problems = check_site_budget(
+        output_dir, CONFIG.site_budget, elapsed_s=time.perf_counter() - started,
+    )
+    for problem in budget_problems:
+        print(f'Warning: {problem}')
     print(f'\nDone: {output_dir.absolute()}')
+    return budget_problems
 
 
 def cmd_parse(args):
@@ -249,24 +375,119 @@ def cmd_parse(args):
     except ValueError:
         print(f'Error: Date must be YYYY-MM-DDTHH:MM:SS, got: {args.date}')
         sys.exit(1)
+    if args.jobs < 1:
+        print(f'Error: --jobs must be at least 1, got: {args.jobs}')
+        sys.exit(1)
     process_benchmark_run(
         args.benchmark_dir, args.data_dir, args.commit_hash, args.date,
         machine_info_file=args.machine_info,
+        jobs=args.jobs,
+        force=args.force,
     )
     print(f'\nCSV files updated in {args.data_dir.absolute()}')
 
 
 def cmd_graphs(args):
-    generate_graphs(args.data_dir, args.output_dir)
+    if args.render_jobs < 1:
+        print(f'Error: --render-jobs must be at least 1, got: {args.render_jobs}')
+        sys.exit(1)
+    budget_problems = generate_graphs(
+        args.data_dir, args.output_dir,
+        render_jobs=args.render_jobs,
+        force_render=args.force_render,
+        site_mode=args.site_mode,
+    )
+    if budget_problems and args.strict_budget:
+        print(f'Error: {len(budget_problems)} site budget(s) exceeded')
+        sys.exit(1)
 
 
 def cmd_report(args):
-    metrics = load_metrics(args.data_dir)
+    metrics = load_metrics(args.data_dir, CONFIG.charts)
+    performance = metrics.get('performance')
+    if performance is None or performance.empty:
+        print('Error: no performance metrics found')
+        sys.exit(1)
+    write_regression_report(
+        performance, CONFIG, args.output,
+        series_cache=ChartSeriesCache(metrics, CONFIG.charts),
+    )
+
+
+def cmd_bisect_hint(args):
+    metrics = load_metrics(args.data_dir, CONFIG.charts)
     performance = metrics.get('performance')
     if performance is None or performance.empty:
         print('Error: no performance metrics found')
         sys.exit(1)
-    write_regression_report(performance, CONFIG, args.output)
+    known_ids = {chart.test_id for chart in CONFIG.charts}
+    unknown_ids = [test_id for test_id in args.test_id or [] if test_id not in known_ids]
+    if unknown_ids:
+        print(f'Error: unknown test IDs: {", ".join(unknown_ids)}')
+        sys.exit(1)
+
+    series_cache = ChartSeriesCache(metrics, CONFIG.charts, load_desktop_build_labels())
+    violations = collect_violations(performance, CONFIG, series_cache=series_cache)
+    hints = collect_bisect_hints(violations, CONFIG, series_cache, test_ids=args.test_id)
+    if hints:
+        print(f'\nSuspect ranges ({len(hints)} charts):')
+        for hint in hints:
+            print(f'  {hint.test_id} ({hint.variant}): {hint.describe()}')
+            print(f'    git rev-list {hint.git_range}')
+    else:
+        print('No level shift found around any flagged chart.')
+    hinted = {hint.test_id for hint in hints}
+    for test_id in args.test_id or []:
+        if test_id not in hinted:
+            print(f'  {test_id}: no confident upward level shift in the chart window')
+    write_bisect_hints_json(hints, args.output)
+    print(f'Wrote {args.output}')
+
+
+def _require_non_csv_storage(command: str) -> None:
+    if STORAGE_BACKEND == 'csv':
+        print(f'Error: {command} needs --storage {" or ".join(STORAGE_BACKENDS[1:])}')
+        sys.exit(1)
+
+
+def cmd_export_csv(args):
+    _require_non_csv_storage('export-csv')
+    output_dir = args.output_dir or args.data_dir
+    copied = copy_metrics(
+        _metrics_store(args.data_dir),
+        CsvMetricsStore(output_dir),
+        METRICS_FILES,
+    )
+    print(f'Exported {copied} metrics files to {output_dir.absolute()}')
+
+
+def cmd_import_csv(args):
+    _require_non_csv_storage('import-csv')
+    copied = copy_metrics(
+        CsvMetricsStore(args.data_dir),
+        _metrics_store(args.data_dir),
+        METRICS_FILES,
+    )
+    print(f'Imported {copied} metrics files into {STORAGE_BACKEND} storage')
+
+
+def cmd_compact(args):
+    store = _metrics_store(args.data_dir)
+    if not isinstance(store, (PartitionedMetricsStore, ColumnarMetricsStore)):
+        print('Error: compact needs --storage partitioned or --storage columnar')
+        sys.exit(1)
+    for filename in METRICS_FILES:
+        if not store.exists(filename):
+            continue
+        if isinstance(store, ColumnarMetricsStore):
+            merged = store.compact(filename)
+            print(f'Compacted {filename}: merged {merged} delta archives')
+            continue
+        before, after = store.compact(filename)
+        print(
+            f'Compacted {filename}: {len(store.partitions(filename))} partitions, '
+            f'{before} -> {after} rows'
+        )
 
 
 def cmd_list_tests(_args):
@@ -282,6 +503,10 @@ def cmd_list_tests(_args):
 def main():
     parser = argparse.ArgumentParser(description='Parse Allure benchmark results and publish charts to GitHub Pages')
     parser.add_argument('--config', type=Path, default=DEFAULT_CONFIG, help=f'Config file (default: {DEFAULT_CONFIG})')
+    parser.add_argument(
+        '--storage', choices=STORAGE_BACKENDS, default='csv',
+        help='Metrics storage backend (default: csv)',
+    )
     subparsers = parser.add_subparsers(dest='command')
 
     parse_parser = subparsers.add_parser('parse', help='Parse Allure results into CSV')
@@ -293,11 +518,36 @@ def main():
         '--machine-info', type=Path,
         help='JSON file with system metadata (hostname, windows_version, os_build, cpu, ram_gb)',
     )
+    parse_parser.add_argument(
+        '--jobs', type=int, default=1,
+        help='Worker processes for parsing test-case files (default: 1, serial)',
+    )
+    parse_parser.add_argument(
+        '--force', action='store_true',
+        help='Re-parse a bundle already in the processed-runs ledger, replacing its rows',
+    )
     parse_parser.set_defaults(func=cmd_parse)
 
     graphs_parser = subparsers.add_parser('graphs', help='Generate charts and GitHub Pages site')
     graphs_parser.add_argument('--data-dir', type=Path, default=Path('data'))
     graphs_parser.add_argument('--output-dir', type=Path, default=Path('docs/desktop'))
+    graphs_parser.add_argument(
+        '--render-jobs', type=int, default=1,
+        help='Worker processes for building and exporting charts (default: 1, serial)',
+    )
+    graphs_parser.add_argument(
+        '--force-render', action='store_true',
+        help='Re-render every chart even when its inputs match the render manifest',
+    )
+    graphs_parser.add_argument(
+        '--site-mode', choices=SITE_MODES, default='iframe',
+        help="'iframe': one Plotly HTML per chart; 'bundle': one JSON bundle per page "
+             'drawn lazily by a shared renderer script',
+    )
+    graphs_parser.add_argument(
+        '--strict-budget', action='store_true',
+        help='Exit with an error when a page or the run exceeds [site_budget] in the config',
+    )
     graphs_parser.set_defaults(func=cmd_graphs)
 
     report_parser = subparsers.add_parser('report', help='Write regression report from CSV data')
@@ -305,6 +555,41 @@ def main():
     report_parser.add_argument('--output', type=Path, default=Path('docs/desktop/regression_report.md'))
     report_parser.set_defaults(func=cmd_report)
 
+    bisect_parser = subparsers.add_parser(
+        'bisect-hint',
+        help='Print the last good / first bad builds around flagged regressions',
+    )
+    bisect_parser.add_argument('--data-dir', type=Path, default=Path('data'))
+    bisect_parser.add_argument(
+        '--output', type=Path, default=Path('docs/desktop') / BISECT_HINTS_JSON,
+        help=f'JSON output (default: docs/desktop/{BISECT_HINTS_JSON})',
+    )
+    bisect_parser.add_argument(
+        '--test-id', action='append',
+        help='Also bisect this chart even if it is not flagged (repeatable; flagged charts are always included)',
+    )
+    bisect_parser.set_defaults(func=cmd_bisect_hint)
+
+    export_parser = subparsers.add_parser(
+        'export-csv', help='Write --storage metrics back to the CSV layout',
+    )
+    export_parser.add_argument('--data-dir', type=Path, default=Path('data'))
+    export_parser.add_argument('--output-dir', type=Path, help='CSV destination (default: --data-dir)')
+    export_parser.set_defaults(func=cmd_export_csv)
+
+    import_parser = subparsers.add_parser(
+        'import-csv', help='Seed --storage metrics from the CSV files',
+    )
+    import_parser.add_argument('--data-dir', type=Path, default=Path('data'))
+    import_parser.set_defaults(func=cmd_import_csv)
+
+    compact_parser = subparsers.add_parser(
+        'compact',
+        help='Sort and de-duplicate monthly metrics partitions, or merge columnar delta archives',
+    )
+    compact_parser.add_argument('--data-dir', type=Path, default=Path('data'))
+    compact_parser.set_defaults(func=cmd_compact)
+
     subparsers.add_parser('list-tests', help='List configured charts and pages').set_defaults(func=cmd_list_tests)
 
     args = parser.parse_args()
@@ -312,7 +597,8 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    global CONFIG
+    global CONFIG, STORAGE_BACKEND
+    STORAGE_BACKEND = args.storage
     try:
         CONFIG = load_benchmark_config(args.config)
     except (FileNotFoundError, ValueError) as error:
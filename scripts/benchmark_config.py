@@ -3,16 +3,26 @@
 from __future__ import annotations
 
 import csv
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal, Optional
 
 import tomli as tomllib
 
+from pattern_matcher import SubstringMatcher
+
 CHART_WINDOW_DAYS = 30
 DEFAULT_CONFIG = Path('scripts/tests_config.toml')
 LOAD_TIME_FOOTNOTE = 'Each point = average of 5 runs on that build.'
 DESKTOP_BUILD_LABELS = Path('data/desktop/build_labels.csv')
+# 'iframe': one Plotly HTML document per chart; 'bundle': one JSON bundle per page
+# drawn by a shared client-side renderer.
+SITE_MODES = ('iframe', 'bundle')
+# Plotly layout template shared by every bundle-mode figure, stored once under charts/.
+LAYOUT_TEMPLATE_JSON = 'layout_template.json'
+# What rule 2.5 tests the latest build's runs against: the runs of the preceding
+# significance_window builds, or the runs of the chart's reference build.
+SIGNIFICANCE_BASELINES = ('window', 'reference')
 
 MetricsKind = Literal['performance', 'cpu', 'ram']
 ProductArea = Literal['wallet', 'messenger', 'communities', 'browser']
@@ -28,6 +38,24 @@ class ChartDefaults:
     rolling_window: int = 5
     backlog_slow_of_last_n: int = 5
     backlog_slow_min_count: int = 3
+    change_point_min_pct: float = 0.10
+    change_point_min_builds: int = 3
+    change_point_confidence: float = 0.95
+    significance_compare_to: str = 'window'
+    significance_window: int = 5
+    significance_alpha: float = 0.01
+    significance_min_pct: float = 0.10
+    adaptive_thresholds: bool = True
+    noise_window: int = 10
+    noise_multiplier: float = 3.0
+    regression_pct_min: float = 0.05
+    regression_pct_max: float = 0.30
+    ram_growth_mb: float = 100.0
+    ram_ceiling_mb: float = 2048.0
+    ram_slope_mb_per_build: float = 10.0
+    cpu_growth_pct: float = 15.0
+    cpu_slope_pct_per_build: float = 2.0
+    resource_slope_window: int = 10
     baselines: tuple[str, ...] = ()
     reference_build: Optional[str] = None
 
@@ -51,6 +79,7 @@ class ChartTest:
     show_rolling_average: bool = False
     reference_build: Optional[str] = None
     inherit_reference_build: bool = True
+    regression_pct: Optional[float] = None
     baselines: tuple[str, ...] = ()
     historical_patterns: tuple[str, ...] = ()
     historical_attachment_keywords: tuple[str, ...] = ()
@@ -78,6 +107,16 @@ class ChartEntry:
     display_name: str
     html_filename: str
     footnote: str = ''
+    # Compact figure JSON under charts/ when the site is built in 'bundle' mode.
+    data_filename: str = ''
+
+
+@dataclass(frozen=True)
+class SiteBudget:
+    """Limits checked after `graphs`; page weight assumes a full scroll with a cold cache."""
+    max_page_kb: float = 8192
+    max_page_requests: int = 128
+    max_graphs_seconds: float = 900
 
 
 @dataclass(frozen=True)
@@ -87,12 +126,42 @@ class FlagTicket:
     url: str
 
 
+def chart_source_patterns(chart: ChartTest) -> tuple[str, ...]:
+    """Test-name substrings that route an Allure test case to this chart."""
+    return (chart.source_pattern or chart.pattern, *chart.historical_patterns)
+
+
+class ChartMatcher:
+    """Precompiled chart routing: which charts does a test name feed?"""
+
+    def __init__(self, charts: tuple[ChartTest, ...]):
+        self._charts = charts
+        self._routes: dict[str, list[int]] = {}
+        for index, chart in enumerate(charts):
+            for pattern in chart_source_patterns(chart):
+                self._routes.setdefault(pattern, []).append(index)
+        self._matcher = SubstringMatcher(self._routes)
+
+    def match(self, test_name: str) -> tuple[list[ChartTest], set[str]]:
+        """Return matching charts in config order plus the patterns found in test_name."""
+        found = self._matcher.find(test_name)
+        indices = sorted({
+            index for pattern in found for index in self._routes[pattern]
+        })
+        return [self._charts[index] for index in indices], found
+
+
 @dataclass(frozen=True)
 class BenchmarkConfig:
     pages: tuple[BenchmarkPage, ...]
     charts: tuple[ChartTest, ...]
     defaults: ChartDefaults
     flag_tickets: dict[str, FlagTicket]
+    site_budget: SiteBudget = SiteBudget()
+    chart_matcher: ChartMatcher = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'chart_matcher', ChartMatcher(self.charts))
 
 
 def _require_fields(raw: dict, *fields: str, context: str = 'config') -> None:
@@ -147,6 +216,12 @@ def _reference_build_from_entry(
 def _load_defaults(raw: dict) -> ChartDefaults:
     entry = raw.get('defaults', {})
     baselines = entry.get('baselines', [])
+    compare_to = entry.get('significance_compare_to', 'window')
+    if compare_to not in SIGNIFICANCE_BASELINES:
+        raise ValueError(
+            f'significance_compare_to must be one of {", ".join(SIGNIFICANCE_BASELINES)}, '
+            f'got {compare_to!r}'
+        )
     return ChartDefaults(
         slow_threshold_s=entry.get('slow_threshold_s', 1.0),
         fast_threshold_s=entry.get('fast_threshold_s', 0.5),
@@ -156,6 +231,24 @@ def _load_defaults(raw: dict) -> ChartDefaults:
         rolling_window=entry.get('rolling_window', 5),
         backlog_slow_of_last_n=entry.get('backlog_slow_of_last_n', 5),
         backlog_slow_min_count=entry.get('backlog_slow_min_count', 3),
+        change_point_min_pct=entry.get('change_point_min_pct', 0.10),
+        change_point_min_builds=entry.get('change_point_min_builds', 3),
+        change_point_confidence=entry.get('change_point_confidence', 0.95),
+        significance_compare_to=compare_to,
+        significance_window=entry.get('significance_window', 5),
+        significance_alpha=entry.get('significance_alpha', 0.01),
+        significance_min_pct=entry.get('significance_min_pct', 0.10),
+        adaptive_thresholds=entry.get('adaptive_thresholds', True),
+        noise_window=entry.get('noise_window', 10),
+        noise_multiplier=entry.get('noise_multiplier', 3.0),
+        regression_pct_min=entry.get('regression_pct_min', 0.05),
+        regression_pct_max=entry.get('regression_pct_max', 0.30),
+        ram_growth_mb=entry.get('ram_growth_mb', 100.0),
+        ram_ceiling_mb=entry.get('ram_ceiling_mb', 2048.0),
+        ram_slope_mb_per_build=entry.get('ram_slope_mb_per_build', 10.0),
+        cpu_growth_pct=entry.get('cpu_growth_pct', 15.0),
+        cpu_slope_pct_per_build=entry.get('cpu_slope_pct_per_build', 2.0),
+        resource_slope_window=entry.get('resource_slope_window', 10),
         baselines=tuple(baselines),
         reference_build=entry.get('reference_build'),
     )
@@ -210,6 +303,7 @@ def _load_chart_tests(
             show_rolling_average=entry.get('show_rolling_average', default_show_rolling_average),
             reference_build=reference_build,
             inherit_reference_build=inherit_reference_build,
+            regression_pct=entry.get('regression_pct'),
             baselines=baselines,
             historical_patterns=tuple(entry.get('historical_patterns', [])),
             historical_attachment_keywords=tuple(
@@ -283,6 +377,8 @@ def _expand_wallet_scenarios(
             }
             if 'reference_build' in scenario:
                 base_entry['reference_build'] = scenario['reference_build']
+            if 'regression_pct' in scenario:
+                base_entry['regression_pct'] = scenario['regression_pct']
             metric_entries = (
                 (
                     performance_entries,
@@ -460,6 +556,16 @@ def _load_flag_tickets(raw_entries: list) -> dict[str, FlagTicket]:
     return tickets
 
 
+def _load_site_budget(raw: dict) -> SiteBudget:
+    entry = raw.get('site_budget', {})
+    fallback = SiteBudget()
+    return SiteBudget(
+        max_page_kb=float(entry.get('max_page_kb', fallback.max_page_kb)),
+        max_page_requests=int(entry.get('max_page_requests', fallback.max_page_requests)),
+        max_graphs_seconds=float(entry.get('max_graphs_seconds', fallback.max_graphs_seconds)),
+    )
+
+
 def load_benchmark_config(config_file: Path) -> BenchmarkConfig:
     if not config_file.exists():
         raise FileNotFoundError(f'Config file not found: {config_file}')
@@ -527,4 +633,5 @@ def load_benchmark_config(config_file: Path) -> BenchmarkConfig:
         charts=tuple(charts),
         defaults=defaults,
         flag_tickets=flag_tickets,
+        site_budget=_load_site_budget(raw),
     )
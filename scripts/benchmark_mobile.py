@@ -4,14 +4,27 @@
 Deliberately separate from benchmark.py (desktop charts, plotly): this module
 imports only matplotlib + seaborn + pandas + tomli and never plotly/kaleido, which
 do not build on the Raspberry Pi that generates the mobile charts. Loaded by
-android_perf_publish.py; the two charting paths share no dependencies.
+android_perf_publish.py; the two charting paths share no dependencies. Ingest does
+share code: `benchmark_mobile.py parse` appends through the same CSV store and
+processed-runs ledger as `benchmark.py parse` (metrics_store, run_ledger — both
+plotly-free).
 """
 from __future__ import annotations
 
+import argparse
 import csv as _csv
-from dataclasses import dataclass
+import json
+import multiprocessing as mp
+import os
+import statistics
+import sys
+from collections import deque
+from dataclasses import dataclass, replace
+from datetime import datetime
+from functools import lru_cache
+from multiprocessing.connection import wait
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 import pandas as pd
 import tomli as tomllib
@@ -21,6 +34,11 @@ matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from metrics_store import CsvMetricsStore
+from render_cache import RenderCache, render_key
+from run_ledger import (
+    ProcessedRun, bundle_content_hash, load_run_ledger, matching_runs, record_processed_run)
+
 sns.set_theme(style="darkgrid", palette="muted")
 plt.rcParams.update({
     "figure.dpi": 200, "savefig.bbox": "tight", "font.size": 11,
@@ -48,11 +66,38 @@ class PerformanceTest:
     band: bool = False        # shade a +/-15% normal range behind the line
     series: str = "response_time"
     device: str = ""
+    first_open: bool = True   # overlay the *_first_open companion when there is one
+    # Release settings, from [defaults] unless the [[tests]] entry sets its own.
+    baselines: tuple = ()
+    reference_build: Optional[str] = None
+    reference_label: str = ""
+    max_recent: int = 28
+    band_pct: float = 0.15
+
+
+@dataclass
+class MobileDefaults:
+    """[defaults] of tests_config_android.toml — what changes from one release to the next."""
+    baselines: tuple = ()                  # pinned as fixed left columns, in this order
+    reference_build: Optional[str] = None  # last release -> the reference level
+    reference_label: str = ""              # its name on the chart (default: the hash)
+    max_recent: int = 28                   # live builds shown after the baselines
+    band_pct: float = 0.15                 # normal-range half-width around the reference
+
+
+def _load_defaults(config) -> MobileDefaults:
+    entry = config.get('defaults', {})
+    return MobileDefaults(
+        baselines=tuple(entry.get('baselines', [])),
+        reference_build=entry.get('reference_build'),
+        reference_label=entry.get('reference_label', ''),
+        max_recent=entry.get('max_recent', 28), band_pct=entry.get('band_pct', 0.15))
 
 
 def load_config(config_file: Path) -> List[PerformanceTest]:
     with open(config_file, 'rb') as f:
         config = tomllib.load(f)
+    defaults = _load_defaults(config)
     tests = []
     for tc in config.get('tests', []):
         tests.append(PerformanceTest(
@@ -63,71 +108,161 @@ def load_config(config_file: Path) -> List[PerformanceTest]:
             x_axis=tc.get('x_axis', 'date'), description=tc.get('description', ''),
             footnote=tc.get('footnote', ''), target=tc.get('target'),
             band=tc.get('band', False), series=tc.get('series', 'response_time'),
-            device=tc.get('device', '')))
+            device=tc.get('device', ''), first_open=tc.get('first_open', True),
+            baselines=tuple(tc.get('baselines', defaults.baselines)),
+            reference_build=tc.get('reference_build', defaults.reference_build),
+            reference_label=tc.get('reference_label', defaults.reference_label),
+            max_recent=tc.get('max_recent', defaults.max_recent),
+            band_pct=tc.get('band_pct', defaults.band_pct)))
     return tests
 
 
-def _build_labels():
-    """Optional commit_hash -> display label map (data-trend/build_labels.csv),
-    so the mobile x-axis shows real build names. '|' in a label becomes a line
-    break. Falls back to date+hash when a build is not listed."""
-    import csv as _csv
-    p = Path(__file__).resolve().parent.parent / 'data' / 'android' / 'build_labels.csv'
-    out = {}
-    if p.exists():
-        for row in _csv.DictReader(open(p, encoding='utf-8')):
-            out[row['commit_hash']] = row['label'].replace('|', '\n')
-    return out
-
-
-def _excluded_builds():
-    """Build hashes hidden from the published charts (an optional `exclude` column
-    in build_labels.csv). The raw rows stay in performance_metrics.csv — this only
-    keeps a build off the trend, e.g. a pre-final build that muddies the release
-    story. Missing column => nothing excluded (back-compatible)."""
-    import csv as _csv
-    p = Path(__file__).resolve().parent.parent / 'data' / 'android' / 'build_labels.csv'
-    out = set()
-    if p.exists():
-        for row in _csv.DictReader(open(p, encoding='utf-8')):
-            if str(row.get('exclude') or '').strip().lower() in ('1', 'true', 'yes', 'y'):
-                out.add(row['commit_hash'])
-    return out
-
-
-def _run_environments():
-    """commit_hash -> device OS fingerprint (data/android/run_environment.csv).
-    Used to draw a divider where the device software changed, so a baseline step
-    that is really an OS/One UI update isn't misread as an app change. Builds with
-    no recorded environment are treated as one earlier 'legacy' regime."""
-    import csv as _csv
-    p = Path(__file__).resolve().parent.parent / 'data' / 'android' / 'run_environment.csv'
-    out = {}
-    if p.exists():
-        for row in _csv.DictReader(open(p, encoding='utf-8')):
-            out[row['commit_hash']] = row.get('fingerprint') or row.get('oneui') or 'recorded'
-    return out
-
-
-def _android16_builds():
-    """Build hashes measured on the gate OS regime — Android 16 (One UI 8). Volo asked to
-    'stick with Android 16 One UI 8', so the trend charts show only this regime: it drops the
-    pre-update legacy points and the OS-divider clutter, and keeps one comparable timeline. A
-    build with no recorded environment is treated as pre-regime and left off."""
-    import csv as _csv
-    p = Path(__file__).resolve().parent.parent / 'data' / 'android' / 'run_environment.csv'
-    out = set()
-    if p.exists():
-        for row in _csv.DictReader(open(p, encoding='utf-8')):
-            if str(row.get('android', '')).strip() == '16':
-                out.add(row['commit_hash'])
-    return out
-
-
-def _os_boundary_indices(order):
+ANDROID_DATA_DIR = Path(__file__).resolve().parent.parent / 'data' / 'android'
+BUILD_LABELS_CSV = 'build_labels.csv'
+RUN_ENVIRONMENT_CSV = 'run_environment.csv'
+PERFORMANCE_CSV = 'performance_metrics.csv'
+PERFORMANCE_FIELDS = ['commit_hash', 'date', 'device', 'test_name', 'status', 'metric', 'unit',
+                      'min_time', 'max_time', 'avg_time', 'median_time', 'run_count', 'attempted',
+                      'all_runs']
+ENVIRONMENT_FIELDS = ['commit_hash', 'device', 'android', 'sdk', 'oneui', 'sem', 'security_patch',
+                      'build_incremental', 'fingerprint']
+
+
+class AndroidContext:
+    """Build labels, exclusions and device-OS regimes for the mobile charts, parsed once.
+
+    Each CSV under data_dir is read the first time one of its views is asked for and
+    again only when its mtime or size changes, so one context can serve every chart of
+    a run (and a long-lived publisher across runs) without re-parsing the files per chart.
+    """
+
+    def __init__(self, data_dir: Path = ANDROID_DATA_DIR):
+        self.data_dir = Path(data_dir)
+        self._views = {}     # (filename, view) -> (file stamp, parsed value)
+
+    def _stamp(self, filename):
+        try:
+            st = (self.data_dir / filename).stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _view(self, filename, view, parse):
+        stamp = self._stamp(filename)
+        cached = self._views.get((filename, view))
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        rows = []
+        if stamp is not None:
+            with open(self.data_dir / filename, newline='', encoding='utf-8') as f:
+                rows = list(_csv.DictReader(f))
+        value = parse(rows)
+        self._views[(filename, view)] = (stamp, value)
+        return value
+
+    @property
+    def build_labels(self):
+        """Optional commit_hash -> display label map (build_labels.csv), so the mobile
+        x-axis shows real build names. '|' in a label becomes a line break. Falls back
+        to date+hash when a build is not listed."""
+        return self._view(BUILD_LABELS_CSV, 'labels', lambda rows: {
+            row['commit_hash']: row['label'].replace('|', '\n') for row in rows})
+
+    @property
+    def excluded_builds(self):
+        """Build hashes hidden from the published charts (an optional `exclude` column
+        in build_labels.csv). The raw rows stay in performance_metrics.csv — this only
+        keeps a build off the trend, e.g. a pre-final build that muddies the release
+        story. Missing column => nothing excluded (back-compatible)."""
+        return self._view(BUILD_LABELS_CSV, 'excluded', lambda rows: {
+            row['commit_hash'] for row in rows
+            if str(row.get('exclude') or '').strip().lower() in ('1', 'true', 'yes', 'y')})
+
+    @property
+    def run_environments(self):
+        """commit_hash -> device OS fingerprint (run_environment.csv).
+        Used to draw a divider where the device software changed, so a baseline step
+        that is really an OS/One UI update isn't misread as an app change. Builds with
+        no recorded environment are treated as one earlier 'legacy' regime."""
+        return self._view(RUN_ENVIRONMENT_CSV, 'fingerprints', lambda rows: {
+            row['commit_hash']: row.get('fingerprint') or row.get('oneui') or 'recorded'
+            for row in rows})
+
+    @property
+    def android16_builds(self):
+        """Build hashes measured on the gate OS regime — Android 16 (One UI 8). Volo asked to
+        'stick with Android 16 One UI 8', so the trend charts show only this regime: it drops the
+        pre-update legacy points and the OS-divider clutter, and keeps one comparable timeline. A
+        build with no recorded environment is treated as pre-regime and left off."""
+        return self._view(RUN_ENVIRONMENT_CSV, 'android16', lambda rows: {
+            row['commit_hash'] for row in rows if str(row.get('android', '')).strip() == '16'})
+
+
+_SHARED_CONTEXT: Optional[AndroidContext] = None
+
+
+def shared_context() -> AndroidContext:
+    """Process-wide context for callers that do not pass one (mtime checks keep it fresh)."""
+    global _SHARED_CONTEXT
+    if _SHARED_CONTEXT is None:
+        _SHARED_CONTEXT = AndroidContext()
+    return _SHARED_CONTEXT
+
+
+class AndroidPerformance:
+    """The Android performance frame filtered once for charting and grouped for O(1) lookups.
+
+    Excluded builds and builds off the Android 16 regime are dropped up front, and the rest
+    is split by (test_name, metric, device), so a chart reads its rows and its first-open
+    companion from a few groups instead of scanning the whole frame. Slices keep the CSV
+    row order, so charts come out exactly as they did from the raw frame.
+    """
+
+    def __init__(self, performance, context=None):
+        context = context or shared_context()
+        data = performance
+        excluded = context.excluded_builds
+        if excluded:
+            data = data[~data['commit_hash'].isin(excluded)]
+        a16 = context.android16_builds      # Volo: Android 16 / One UI 8 only — drop legacy-OS points
+        if a16:
+            data = data[data['commit_hash'].isin(a16)]
+        self.frame = data = data.reset_index(drop=True)
+        # A frame without a metric/device column is not filtered on it.
+        self._by_metric, self._by_device = 'metric' in data.columns, 'device' in data.columns
+        blank = pd.Series('', index=data.index)
+        keys = [data['test_name'], data['metric'] if self._by_metric else blank,
+                data['device'] if self._by_device else blank]
+        self._groups = dict(iter(data.groupby(keys, sort=False, dropna=False)))
+        self._keys_by_pattern = {}   # name before any '[variant]' -> its group keys
+        for key in self._groups:
+            self._keys_by_pattern.setdefault(str(key[0]).split('[', 1)[0], []).append(key)
+
+    def _rows(self, keys):
+        parts = [self._groups[key] for key in keys]
+        if not parts:
+            return self.frame.iloc[:0]
+        return parts[0] if len(parts) == 1 else pd.concat(parts).sort_index(kind='stable')
+
+    def chart_rows(self, test):
+        """Rows named test.pattern or test.pattern[variant], of test.series and test.device."""
+        return self._rows([
+            key for key in self._keys_by_pattern.get(test.pattern, ())
+            if (not self._by_metric or key[1] == test.series)
+            and (not test.device or not self._by_device or key[2] == test.device)])
+
+    def first_open_rows(self, test):
+        """Response rows of the *_first_open series paired with a nav-tab chart, any device."""
+        name = test.pattern.replace('_response_time', '_first_open')
+        return self._rows([
+            key for key in self._keys_by_pattern.get(name, ())
+            if key[0] == name and (not self._by_metric or key[1] == 'response_time')])
+
+
+def _os_boundary_indices(order, context):
     """Indices i (in the date-ordered build list) where the device OS regime changes
     from build i-1 to build i — i.e. where to draw a 'device OS update' divider."""
-    env = _run_environments()
+    env = context.run_environments
     regimes = [env.get(h, 'legacy') for h in order['commit_hash']]
     return [i for i in range(1, len(regimes)) if regimes[i] != regimes[i - 1]]
 
@@ -140,42 +275,33 @@ def _fmt(v, unit):
     return f"{v:.1f} {unit}" if v < 10 else f"{v:.0f} {unit}"
 
 
-def plot_performance_mobile(performance, test, output_dir):
+def plot_performance_mobile(performance, test, output_dir, context=None):
     """Mobile response chart: seconds axis, build-name x-axis. Android 16 / One UI 8 only.
-    The release baselines (2.37.1, 2.38.0, 2.38.2) are pinned as fixed LEFT columns so every chart
-    'starts' with them, and a faint dashed line marks the last-release level. For a nav-tab
+    The release baselines (test.baselines, from [defaults] in tests_config_android.toml) are pinned
+    as fixed LEFT columns so every chart 'starts' with them, and a faint line marks the level of
+    the last release (test.reference_build). For a nav-tab
     surface the FIRST-open series is overlaid as a second (dashed) line, each first-open point
     annotated with how much slower it is than its repeat-open counterpart, e.g. 1.40s (+50%).
-    Separate from plot_performance so desktop charts are unaffected."""
-    name_match = (performance['test_name'] == test.pattern) | \
-        performance['test_name'].str.startswith(test.pattern + '[', na=False)
-    data = performance[name_match].copy()
-    if 'metric' in data.columns:
-        data = data[data['metric'] == test.series]
-    if test.device and 'device' in data.columns:
-        data = data[data['device'] == test.device]
-    excluded = _excluded_builds()
-    if excluded:
-        data = data[~data['commit_hash'].isin(excluded)]
-    a16 = _android16_builds()          # Volo: Android 16 / One UI 8 only — drop legacy-OS points
-    if a16:
-        data = data[data['commit_hash'].isin(a16)]
+    Separate from plot_performance so desktop charts are unaffected. Pass one AndroidContext
+    and one AndroidPerformance for the whole chart set so labels and OS regimes are parsed,
+    and the frame filtered and grouped, once; a raw DataFrame is grouped per call."""
+    context = context or shared_context()
+    if not isinstance(performance, AndroidPerformance):
+        performance = AndroidPerformance(performance, context)
+    data = performance.chart_rows(test)
     if data.empty:
         print(f"Warning: No data for {test.pattern}")
         return
     value_col = {"min": "min_time", "mean": "avg_time"}.get(test.metric, "median_time")
     scale = 1000.0 if test.unit == 'ms' else 1.0
-    labels = _build_labels()
+    labels = context.build_labels
 
-    # Pin the release baselines as fixed LEFT columns, then up to MAX_RECENT recent builds by
+    # Pin the release baselines as fixed LEFT columns, then up to max_recent recent builds by
     # date (Volo: 'two baselines should start every chart' + 'keep up to ~30 data points').
-    BASELINES = ["760417N", "5f66deN", "3ef171"]   # 2.37.1 / 2.38.0 (re-measured on Android 16) / 2.38.2
-    GA_BUILD = "3ef171"                   # last release (2.38.2) -> the reference level
-    MAX_RECENT = 28
     allb = data.drop_duplicates('commit_hash').sort_values('date')
     present = list(allb['commit_hash'])
-    base_order = [h for h in BASELINES if h in present]
-    recent = [h for h in present if h not in BASELINES][-MAX_RECENT:]
+    base_order = [h for h in test.baselines if h in present]
+    recent = [h for h in present if h not in test.baselines][-test.max_recent:]
     order_hashes = base_order + recent
     data = data[data['commit_hash'].isin(order_hashes)]
     build_index = {h: i for i, h in enumerate(order_hashes)}
@@ -185,23 +311,18 @@ def plot_performance_mobile(performance, test, output_dir):
     fig, ax = plt.subplots(figsize=(min(18.0, max(8.2, n_builds * 0.8)), 5.4))
 
     # First-open companion (nav tabs have a *_first_open series) -> overlay as a 2nd line.
-    fo = performance[performance['test_name'] == test.pattern.replace('_response_time', '_first_open')].copy()
-    if 'metric' in fo.columns:
-        fo = fo[fo['metric'] == 'response_time']
+    fo = performance.first_open_rows(test)
     fo = fo[fo['commit_hash'].isin(order_hashes)].copy()
     fo['_pos'] = fo['commit_hash'].map(build_index)
     fo = fo.sort_values('_pos')
-    # Wallet is the post-login landing screen, so its 'first open' is already warm — an
-    # artifact (first < repeat), not a cold open; omit the overlay like the first-vs-returning chart.
-    FO_SKIP = {"test_android_wallet_response_time"}
-    has_fo = test.pattern.endswith('_response_time') and len(fo) > 0 and test.pattern not in FO_SKIP
+    has_fo = test.pattern.endswith('_response_time') and len(fo) > 0 and test.first_open
 
     names = list(data['test_name'].unique())
     any_low = False
     drew_ma = False
     warm_by_build = {}
-    for idx, test_name in enumerate(names):
-        vd = data[data['test_name'] == test_name].copy()
+    for idx, (test_name, vd) in enumerate(data.groupby('test_name', sort=False)):
+        vd = vd.copy()
         vd['_pos'] = vd['commit_hash'].map(build_index)
         vd = vd.sort_values('_pos')
         color = PERFORMANCE_COLORS[idx % len(PERFORMANCE_COLORS)]
@@ -273,8 +394,8 @@ def plot_performance_mobile(performance, test, output_dir):
                 ha='center', va='bottom', fontsize=7, color='#999999')
 
     is_nav = 'navigation' in (test.display_name or '')
-    BAND = 0.15                          # 2.38.2 normal-range half-width (matches the ±15% drift threshold)
-    gv = data[(data['commit_hash'] == GA_BUILD) & (data['test_name'] == test.pattern)]
+    ref_label = test.reference_label or (test.reference_build or '')[:6]
+    gv = data[(data['commit_hash'] == test.reference_build) & (data['test_name'] == test.pattern)]
     lvl = float(gv[value_col].iloc[0]) * scale if len(gv) else None
 
     ax.set_ylabel(test.ylabel, fontsize=11)
@@ -300,9 +421,9 @@ def plot_performance_mobile(performance, test, output_dir):
         ax.axhline(1.0 * scale, ls='--', lw=1, color='#c0392b', alpha=0.5)
         ax.text(len(xt) - 1, 1.0 * scale, ' 1.0s · slow', va='bottom', ha='right', fontsize=8, color='#c0392b')
 
-    if (not is_nav) and lvl is not None:         # normal-range channel = 2.38.2 +/- noise (sub-actions only)
-        ax.axhline(lvl * (1 - BAND), ls=':', lw=0.9, color='#555555', alpha=0.55, zorder=1)
-        ax.axhline(lvl * (1 + BAND), ls=':', lw=0.9, color='#555555', alpha=0.55, zorder=1)
+    if (not is_nav) and lvl is not None:         # normal-range channel = reference +/- noise (sub-actions only)
+        ax.axhline(lvl * (1 - test.band_pct), ls=':', lw=0.9, color='#555555', alpha=0.55, zorder=1)
+        ax.axhline(lvl * (1 + test.band_pct), ls=':', lw=0.9, color='#555555', alpha=0.55, zorder=1)
     elif test.target:
         ax.axhline(test.target, ls='--', lw=1, color='#c0392b', alpha=0.6)
         ax.text(len(xt) - 1, test.target, f' {_fmt(test.target, test.unit)} target',
@@ -310,7 +431,7 @@ def plot_performance_mobile(performance, test, output_dir):
 
     if lvl is not None:                          # last-release reference level, over the zones / channel
         ax.axhline(lvl, ls='-', lw=1.1, color='#333333', alpha=0.85, zorder=1)
-        ax.text(len(xt) - 1, lvl, ' 2.38.2', va='bottom', ha='right', fontsize=7.5, color='#333333')
+        ax.text(len(xt) - 1, lvl, f' {ref_label}', va='bottom', ha='right', fontsize=7.5, color='#333333')
     ax.grid(axis='y', alpha=0.3)
     ax.set_axisbelow(True)
     fig.suptitle(test.display_name, fontweight='bold', fontsize=13, y=0.98)
@@ -325,7 +446,7 @@ def plot_performance_mobile(performance, test, output_dir):
     if show_zones:
         parts.append('zones: <0.5s fast · 0.5–1.0s ok · >1.0s slow')
     if (not is_nav) and lvl is not None:
-        parts.append('dotted = 2.38.2 ±15% (normal range)')
+        parts.append(f'dotted = {ref_label} ±{test.band_pct:.0%} (normal range)')
     if parts:
         fig.text(0.5, 0.05, '   ·   '.join(parts), ha='center', va='bottom', fontsize=7.5, color='gray')
     if test.footnote:
@@ -334,3 +455,393 @@ def plot_performance_mobile(performance, test, output_dir):
     fig.savefig(output_dir / test.graph_filename, dpi=160)
     plt.close()
     print(f"Generated {test.graph_filename} (mobile)")
+
+
+# Charts a render worker draws before it is replaced: pyplot keeps font, text-layout and
+# path caches alive across figures, so a long-lived worker only ever grows.
+CHARTS_PER_WORKER = 8
+
+
+def _rss_mb():
+    """Resident set size of this process in MB (peak RSS where /proc is not available)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 2 ** 10
+
+
+def _render_worker(conn, performance, tests, output_dir, data_dir, charts_per_worker, max_rss_mb):
+    """Draw the charts whose indices arrive on conn until told to stop or due for recycling.
+    Each chart is answered with (error, retire); retire means the worker has drawn its
+    quota or grown past max_rss_mb and exits after this reply."""
+    context = AndroidContext(data_dir)
+    for drawn in range(1, charts_per_worker + 1):
+        index = conn.recv()
+        if index is None:
+            break
+        error = None
+        try:
+            plot_performance_mobile(performance, tests[index], output_dir, context)
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+        plt.close('all')
+        retire = drawn == charts_per_worker or (max_rss_mb is not None and _rss_mb() > max_rss_mb)
+        conn.send((error, retire))
+        if retire:
+            break
+    conn.close()
+
+
+@lru_cache(maxsize=1)
+def _renderer_version():
+    """matplotlib/seaborn versions plus this module's source, which together draw a chart."""
+    return render_key([matplotlib.__version__, sns.__version__, Path(__file__).read_text(encoding='utf-8')])
+
+
+def mobile_render_key(performance, test, context):
+    """Hash of everything a chart's PNG is drawn from, or None when it has no data.
+
+    Release settings count only where the chart has data for them: a baseline or reference
+    build it never measured changes nothing on it, so bumping [defaults] for a release keys
+    just the charts whose pinned columns or reference level actually move.
+    """
+    data = performance.chart_rows(test)
+    if data.empty:
+        return None
+    present = set(data['commit_hash'])
+    has_reference = test.reference_build in present
+    fo = performance.first_open_rows(test)
+    labels = context.build_labels
+    return render_key([
+        _renderer_version(),
+        repr(replace(test, baselines=tuple(h for h in test.baselines if h in present),
+                     reference_build=test.reference_build if has_reference else None,
+                     reference_label=test.reference_label if has_reference else '')),
+        json.dumps({h: labels[h] for h in sorted(present) if h in labels}),
+        data.to_csv(index=False),
+        fo[fo['commit_hash'].isin(present)].to_csv(index=False),
+    ])
+
+
+def render_mobile_charts(performance, tests, output_dir, *, jobs=1,
+                         charts_per_worker=CHARTS_PER_WORKER, max_rss_mb=None,
+                         data_dir=ANDROID_DATA_DIR,
+                         render_cache: Optional[RenderCache] = None) -> Dict[str, str]:
+    """Render every chart in tests with at most `jobs` worker processes; returns
+    test_id -> error for the charts that failed.
+
+    With jobs=1 the charts are drawn in this process. Otherwise a worker is replaced after
+    charts_per_worker charts, or as soon as its RSS passes max_rss_mb after a chart, so the
+    Pi's memory use stays bounded by jobs x ceiling.
+    Charts are handed out one at a time and each writes only its own PNG, which is drawn
+    exactly as plot_performance_mobile draws it in-process, so the files are byte-identical
+    whatever the worker count. A worker that dies mid-chart (e.g. OOM-killed) fails only
+    that chart. The frame is grouped once (AndroidPerformance) before the workers are
+    forked, so they share the grouped rows instead of each filtering its own copy.
+
+    With a render_cache (RenderCache.load(output_dir)), charts whose mobile_render_key
+    matches the manifest keep their PNG and only the rest are drawn.
+    """
+    if jobs < 1 or charts_per_worker < 1:
+        raise ValueError(f"jobs and charts_per_worker must be at least 1, got {jobs}, {charts_per_worker}")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    context = AndroidContext(data_dir)
+    if not isinstance(performance, AndroidPerformance):
+        performance = AndroidPerformance(performance, context)
+    keys = {}
+    pending = list(tests)
+    if render_cache is not None:
+        pending = []
+        for test in tests:
+            key = mobile_render_key(performance, test, context)
+            if key is not None and render_cache.is_fresh(test.graph_filename, key):
+                continue
+            if key is not None:
+                keys[test.graph_filename] = key
+            pending.append(test)
+        print(f"Reusing {len(tests) - len(pending)} unchanged charts, rendering {len(pending)}")
+
+    if jobs == 1:
+        errors = _render_in_process(performance, pending, output_dir, context)
+    else:
+        errors = _render_in_workers(performance, pending, output_dir, jobs=jobs,
+                                    charts_per_worker=charts_per_worker, max_rss_mb=max_rss_mb,
+                                    data_dir=data_dir)
+    if render_cache is not None:
+        for test in pending:
+            if test.test_id not in errors and test.graph_filename in keys:
+                render_cache.store(test.graph_filename, keys[test.graph_filename])
+            else:
+                render_cache.discard(test.graph_filename)
+        render_cache.save()
+    for test in pending:
+        if test.test_id in errors:
+            print(f"Error generating chart for {test.test_id}: {errors[test.test_id]}")
+    return errors
+
+
+def _render_in_process(performance, tests, output_dir, context):
+    """test_id -> error for the charts of tests drawn one after another in this process."""
+    errors = {}
+    for test in tests:
+        try:
+            plot_performance_mobile(performance, test, output_dir, context)
+        except Exception as exc:
+            errors[test.test_id] = f"{type(exc).__name__}: {exc}"
+        plt.close('all')
+    return errors
+
+
+def _render_in_workers(performance, tests, output_dir, *, jobs, charts_per_worker, max_rss_mb,
+                       data_dir):
+    """test_id -> error for the charts of tests drawn by a recycling pool of `jobs` workers."""
+    ctx = mp.get_context('fork' if 'fork' in mp.get_all_start_methods() else 'spawn')
+    pending = deque(range(len(tests)))
+    busy = {}       # parent end of a worker's pipe -> (process, index of the chart it draws)
+    errors = {}
+
+    def start_worker():
+        parent_conn, child_conn = ctx.Pipe()
+        proc = ctx.Process(target=_render_worker, daemon=True, args=(
+            child_conn, performance, tests, output_dir, data_dir, charts_per_worker, max_rss_mb))
+        proc.start()
+        child_conn.close()                 # so a dead worker reads as EOF on parent_conn
+        return proc, parent_conn
+
+    def dispatch(proc, conn):
+        if pending:
+            index = pending.popleft()
+            conn.send(index)
+            busy[conn] = (proc, index)
+        else:
+            conn.send(None)
+            conn.close()
+            proc.join()
+
+    for _ in range(min(jobs, len(tests))):
+        dispatch(*start_worker())
+    while busy:
+        for conn in wait(list(busy)):
+            proc, index = busy.pop(conn)
+            try:
+                error, retire = conn.recv()
+            except EOFError:
+                proc.join()
+                error, retire = f"render worker exited with code {proc.exitcode}", True
+            if error is not None:
+                errors[tests[index].test_id] = error
+            if retire:
+                conn.close()
+                proc.join()
+                if not pending:
+                    continue
+                proc, conn = start_worker()
+            dispatch(proc, conn)
+    return errors
+
+
+def _dump_files(paths: Iterable[Path]) -> List[Path]:
+    files = []
+    for path in paths:
+        files.extend(sorted(path.glob('*.csv')) if path.is_dir() else [path])
+    return files
+
+
+def aggregate_runs(dump_files: Iterable[Path], device: str = "") -> List[Dict]:
+    """One performance_metrics.csv row per (device, test_name, metric) in the timing dumps.
+
+    A dump is a CSV with one row per attempt: test_name and value, plus optional metric
+    (default response_time), unit (default s) and device (default `device`). An empty or
+    non-numeric value is a failed attempt: it counts toward `attempted` only. Rows are read
+    one at a time; per key only the run values are kept, in dump order, for the median and
+    all_runs. Keys with no successful run are left out.
+    """
+    runs = {}      # (device, test_name, metric) -> [unit, attempted, [value tokens]]
+    for dump in dump_files:
+        with open(dump, newline='', encoding='utf-8-sig') as f:
+            reader = _csv.DictReader(f)
+            if not {'test_name', 'value'} <= set(reader.fieldnames or ()):
+                raise ValueError(f"{dump.name}: needs test_name and value columns")
+            for row in reader:
+                key = ((row.get('device') or device).strip(), row['test_name'].strip(),
+                       (row.get('metric') or 'response_time').strip())
+                entry = runs.setdefault(key, [(row.get('unit') or 's').strip(), 0, []])
+                entry[1] += 1
+                token = (row['value'] or '').strip()
+                try:
+                    float(token)
+                except ValueError:
+                    continue
+                entry[2].append(token)
+    rows = []
+    for (dev, test_name, metric), (unit, attempted, tokens) in runs.items():
+        if not tokens:
+            print(f"Warning: No successful runs for {test_name} ({metric}, {dev or 'no device'})")
+            continue
+        values = [float(t) for t in tokens]
+        rows.append({
+            'device': dev, 'test_name': test_name, 'status': 'passed', 'metric': metric,
+            'unit': unit, 'min_time': round(min(values), 3), 'max_time': round(max(values), 3),
+            'avg_time': round(sum(values) / len(values), 3),
+            'median_time': round(statistics.median(values), 3),
+            'run_count': len(values), 'attempted': attempted, 'all_runs': ','.join(tokens)})
+    return rows
+
+
+def record_device_environment(data_dir: Path, commit_hash: str, device_info: Path) -> bool:
+    """Set the run_environment.csv row of (commit, device) from a device-info JSON
+    (the ENVIRONMENT_FIELDS, e.g. from getprop), so the build lands in its OS regime."""
+    info = json.loads(device_info.read_text(encoding='utf-8-sig'))
+    if not isinstance(info, dict) or not info.get('device'):
+        print(f"Warning: {device_info} has no device; run environment not recorded")
+        return False
+    row = {field: str(info.get(field, '')).strip() for field in ENVIRONMENT_FIELDS}
+    row['commit_hash'] = commit_hash
+    path = data_dir / RUN_ENVIRONMENT_CSV
+    fieldnames, rows = CsvMetricsStore(data_dir).read_rows(RUN_ENVIRONMENT_CSV)
+    rows = [r for r in rows if (r.get('commit_hash'), r.get('device')) != (commit_hash, row['device'])]
+    data_dir.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', newline='', encoding='utf-8') as f:   # LF, as the file is kept in git
+        writer = _csv.DictWriter(f, fieldnames=fieldnames or ENVIRONMENT_FIELDS, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows + [row])
+    print(f"Recorded Android {row['android'] or '?'} environment for {row['device']}")
+    return True
+
+
+def process_android_run(dumps: Iterable[Path], data_dir: Path, commit_hash: str, date: str, *,
+                        device: str = "", device_info: Optional[Path] = None,
+                        force: bool = False) -> bool:
+    """Append one build's aggregated timings to performance_metrics.csv, idempotently.
+
+    Uses the desktop run ledger, keyed on the devices the dumps cover: the same dumps
+    for the same commit and devices are skipped, and changed dumps for the same commit,
+    date and devices replace the rows those devices wrote before. Other devices' rows
+    for the same commit and date are kept.
+    """
+    files = _dump_files(dumps)
+    if not files:
+        print("Error: No timing dumps found")
+        return False
+    rows = aggregate_runs(files, device)
+    if not rows:
+        print("Error: No timing results found")
+        return False
+    devices = sorted({row['device'] for row in rows})
+    run_device = ','.join(devices)
+    bundle_hash = bundle_content_hash(files)
+    superseded = matching_runs(load_run_ledger(data_dir), commit_hash, date, bundle_hash, run_device)
+    if not force and any(run.bundle_hash == bundle_hash for run in superseded):
+        print(f"Skipping: dumps {bundle_hash[:12]} already processed for {commit_hash} ({run_device})")
+        return True
+    store = CsvMetricsStore(data_dir)
+    if superseded:
+        stale = {(run.commit_hash, run.date) for run in superseded}
+        fieldnames, existing = store.read_rows(PERFORMANCE_CSV)
+        kept = [r for r in existing
+                if (r.get('commit_hash'), r.get('date')) not in stale or r.get('device') not in devices]
+        if len(kept) != len(existing):
+            store.write_rows(PERFORMANCE_CSV, fieldnames, kept)
+        print(f"Replacing {len(superseded)} earlier parse(s) of {commit_hash} on {run_device} "
+              f"({len(existing) - len(kept)} rows)")
+    store.append_rows(PERFORMANCE_CSV, PERFORMANCE_FIELDS, [
+        {'commit_hash': commit_hash, 'date': date, **row} for row in rows])
+    if device_info is not None:
+        record_device_environment(data_dir, commit_hash, device_info)
+    record_processed_run(data_dir, ProcessedRun(
+        commit_hash=commit_hash, date=date, bundle_hash=bundle_hash, test_cases=len(rows),
+        device=run_device),
+        replaces=superseded)
+    print(f"Processed {len(rows)} timing results from {len(files)} dump(s)")
+    return True
+
+
+def cmd_parse(args):
+    try:
+        datetime.strptime(args.date, '%Y-%m-%dT%H:%M:%S')
+    except ValueError:
+        print(f"Error: Date must be YYYY-MM-DDTHH:MM:SS, got: {args.date}")
+        sys.exit(1)
+    try:
+        ok = process_android_run(args.dumps, args.data_dir, args.commit_hash, args.date,
+                                 device=args.device, device_info=args.device_info, force=args.force)
+    except (OSError, ValueError) as exc:
+        print(f"Error: {exc}")
+        sys.exit(1)
+    if not ok:
+        sys.exit(1)
+    print(f"\nCSV files updated in {args.data_dir.absolute()}")
+
+
+def cmd_charts(args):
+    tests = load_config(args.config)
+    performance_csv = args.data_dir / PERFORMANCE_CSV
+    if not performance_csv.exists():
+        print(f"Error: {performance_csv} not found")
+        sys.exit(1)
+    performance = pd.read_csv(performance_csv, parse_dates=['date'])
+    render_cache = None if args.force_render else RenderCache.load(args.output_dir)
+    try:
+        errors = render_mobile_charts(
+            performance, tests, args.output_dir, jobs=args.render_jobs,
+            charts_per_worker=args.charts_per_worker, max_rss_mb=args.max_worker_rss_mb,
+            data_dir=args.data_dir, render_cache=render_cache)
+    except ValueError as exc:
+        print(f"Error: {exc}")
+        sys.exit(1)
+    if errors:
+        sys.exit(1)
+    print(f"\nCharts written to {args.output_dir.absolute()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Android benchmark ingest and charts')
+    subparsers = parser.add_subparsers(dest='command')
+
+    parse_parser = subparsers.add_parser('parse', help='Aggregate raw per-run timing dumps into CSV')
+    parse_parser.add_argument('dumps', type=Path, nargs='+', help='Dump CSVs, or directories of them')
+    parse_parser.add_argument('--commit-hash', required=True)
+    parse_parser.add_argument('--date', required=True)
+    parse_parser.add_argument('--data-dir', type=Path, default=Path('data/android'))
+    parse_parser.add_argument('--device', default='', help='Device model for dumps without a device column')
+    parse_parser.add_argument(
+        '--device-info', type=Path,
+        help='JSON with the device OS (device, android, sdk, oneui, ..., fingerprint) for run_environment.csv',
+    )
+    parse_parser.add_argument(
+        '--force', action='store_true',
+        help='Re-parse dumps already in the processed-runs ledger, replacing their rows',
+    )
+    parse_parser.set_defaults(func=cmd_parse)
+
+    charts_parser = subparsers.add_parser('charts', help='Render the Android PNG charts')
+    charts_parser.add_argument('--config', type=Path,
+                               default=Path(__file__).resolve().parent / 'tests_config_android.toml')
+    charts_parser.add_argument('--data-dir', type=Path, default=Path('data/android'))
+    charts_parser.add_argument('--output-dir', type=Path, default=Path('docs/android'))
+    charts_parser.add_argument(
+        '--render-jobs', type=int, default=1,
+        help='Worker processes drawing charts (default: 1, in this process)')
+    charts_parser.add_argument(
+        '--charts-per-worker', type=int, default=CHARTS_PER_WORKER,
+        help=f'Charts a worker draws before it is replaced (default: {CHARTS_PER_WORKER})')
+    charts_parser.add_argument(
+        '--max-worker-rss-mb', type=float,
+        help='Replace a worker once its resident memory passes this many MB after a chart')
+    charts_parser.add_argument('--force-render', action='store_true',
+                               help='Redraw every chart, ignoring the render manifest')
+    charts_parser.set_defaults(func=cmd_charts)
+
+    args = parser.parse_args()
+    if not hasattr(args, 'func'):
+        parser.print_help()
+        sys.exit(1)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
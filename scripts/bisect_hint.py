@@ -0,0 +1,126 @@
+"""Last good and first bad build around a flagged chart's most recent level shift.
+
+The pair bounds the commits a regression can come from; ``git_range`` is the
+``good..bad`` range CI can hand to ``git rev-list`` to queue re-runs of the
+commits in between.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import pandas as pd
+
+from benchmark_config import ChartDefaults, ChartTest
+from change_point import latest_level_shift
+from chart_builder import variant_name
+
+BISECT_HINTS_JSON = 'bisect_hints.json'
+UNIT_BY_KIND = {'performance': 's', 'cpu': '%', 'ram': 'MB'}
+
+
+def format_metric_value(value: float, unit: str, *, signed: bool = False) -> str:
+    sign = '+' if signed else ''
+    if unit == 'MB':
+        return f'{value:{sign}.0f} MB'
+    if unit == '%':
+        return f'{value:{sign}.1f}%'
+    return f'{value:{sign}.3f}s'
+
+
+@dataclass(frozen=True)
+class BisectHint:
+    test_id: str
+    variant: str
+    rules: tuple[str, ...]
+    last_good_commit: str
+    last_good_date: str
+    first_bad_commit: str
+    first_bad_date: str
+    before: float
+    after: float
+    unit: str
+    confidence: float
+
+    @property
+    def effect(self) -> float:
+        return self.after - self.before
+
+    @property
+    def effect_pct(self) -> Optional[float]:
+        return self.effect / self.before if self.before > 0 else None
+
+    @property
+    def git_range(self) -> str:
+        return f'{self.last_good_commit}..{self.first_bad_commit}'
+
+    def describe(self) -> str:
+        pct = f', {self.effect_pct:+.0%}' if self.effect_pct is not None else ''
+        return (
+            f'good {self.last_good_commit[:10]} ({self.last_good_date}) .. '
+            f'bad {self.first_bad_commit[:10]} ({self.first_bad_date}): '
+            f'{format_metric_value(self.before, self.unit)} -> '
+            f'{format_metric_value(self.after, self.unit)} '
+            f'({format_metric_value(self.effect, self.unit, signed=True)}{pct}), '
+            f'confidence {self.confidence:.0%}'
+        )
+
+
+def bisect_hint(
+    chart: ChartTest,
+    trend: pd.DataFrame,
+    defaults: ChartDefaults,
+    rules: Iterable[str] = (),
+) -> Optional[BisectHint]:
+    """Builds either side of the latest upward shift in ``trend``, or None.
+
+    The shift must pass the same bar as rule 2.4: held for change_point_min_builds
+    builds, at least change_point_min_pct above the level before it, at
+    change_point_confidence. Anything weaker is noise, not a range worth bisecting.
+    """
+    values = trend[chart.value_column].to_numpy(dtype=float)
+    shift = latest_level_shift(values, min_size=defaults.change_point_min_builds)
+    if (
+        shift is None
+        or shift.before <= 0
+        or shift.magnitude / shift.before < defaults.change_point_min_pct
+        or shift.confidence < defaults.change_point_confidence
+    ):
+        return None
+    good = trend.iloc[shift.index - 1]
+    bad = trend.iloc[shift.index]
+    return BisectHint(
+        test_id=chart.test_id,
+        variant=variant_name(bad['test_name']),
+        rules=tuple(rules),
+        last_good_commit=str(good['commit_hash']),
+        last_good_date=good['date'].strftime('%Y-%m-%d %H:%M'),
+        first_bad_commit=str(bad['commit_hash']),
+        first_bad_date=bad['date'].strftime('%Y-%m-%d %H:%M'),
+        before=shift.before,
+        after=shift.after,
+        unit=UNIT_BY_KIND.get(chart.metrics_kind, ''),
+        confidence=shift.confidence,
+    )
+
+
+def write_bisect_hints_json(hints: List[BisectHint], output_path: Path) -> None:
+    payload = {
+        'generated': datetime.now().strftime('%Y-%m-%dT%H:%M:%S'),
+        'hints': [
+            {
+                **asdict(hint),
+                'rules': list(hint.rules),
+                'effect': round(hint.effect, 6),
+                'effect_pct': None if hint.effect_pct is None else round(hint.effect_pct, 6),
+                'git_range': hint.git_range,
+            }
+            for hint in hints
+        ],
+    }
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(payload, indent=2) + '\n', encoding='utf-8')
@@ -0,0 +1,113 @@
+"""Level-shift detection on a chart's per-build trend series.
+
+PELT over a squared-error (mean shift) cost finds the segmentation; the most
+recent boundary is then scored with a CUSUM bootstrap: the share of shuffled
+orderings whose cumulative-sum range is smaller than the observed one.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+BOOTSTRAP_SHUFFLES = 1000
+# Fixed so a report regenerated from the same data flags the same shifts.
+BOOTSTRAP_SEED = 0
+
+
+@dataclass(frozen=True)
+class LevelShift:
+    index: int
+    before: float
+    after: float
+    confidence: float
+
+    @property
+    def magnitude(self) -> float:
+        return self.after - self.before
+
+
+def _noise_sigma(values: np.ndarray) -> float:
+    """Robust build-to-build noise: MAD of first differences, which a single step barely moves."""
+    diffs = np.diff(values)
+    sigma = 1.4826 * float(np.median(np.abs(diffs - np.median(diffs)))) / np.sqrt(2.0)
+    floor = max(1e-3 * float(np.median(np.abs(values))), 1e-9)
+    return max(sigma, floor)
+
+
+def pelt_change_points(values: np.ndarray, *, penalty: float, min_size: int) -> List[int]:
+    """Start index of every segment after the first, by PELT with a mean-shift cost."""
+    n = len(values)
+    sums = np.concatenate(([0.0], np.cumsum(values)))
+    squares = np.concatenate(([0.0], np.cumsum(values * values)))
+
+    def cost(starts: np.ndarray, end: int) -> np.ndarray:
+        lengths = end - starts
+        segment_sums = sums[end] - sums[starts]
+        return squares[end] - squares[starts] - segment_sums * segment_sums / lengths
+
+    best = np.full(n + 1, np.inf)
+    best[0] = -penalty
+    previous = np.zeros(n + 1, dtype=int)
+    candidates = np.array([0])
+    for end in range(min_size, n + 1):
+        admissible = candidates[end - candidates >= min_size]
+        if admissible.size:
+            totals = best[admissible] + cost(admissible, end) + penalty
+            choice = int(np.argmin(totals))
+            best[end] = totals[choice]
+            previous[end] = admissible[choice]
+            # PELT pruning: a start that cannot beat best[end] now never will.
+            keep = best[admissible] + cost(admissible, end) <= best[end]
+            candidates = np.concatenate((
+                candidates[end - candidates < min_size], admissible[keep],
+            ))
+        candidates = np.append(candidates, end - min_size + 1)
+
+    points = []
+    end = n
+    while end > 0:
+        end = int(previous[end])
+        if end > 0:
+            points.append(end)
+    return points[::-1]
+
+
+def _cusum_range(values: np.ndarray) -> np.ndarray:
+    deviations = np.cumsum(values - values.mean(axis=-1, keepdims=True), axis=-1)
+    return deviations.max(axis=-1) - deviations.min(axis=-1)
+
+
+def shift_confidence(values: np.ndarray, *, shuffles: int = BOOTSTRAP_SHUFFLES) -> float:
+    """Share of shuffles whose CUSUM range is below the observed one (Taylor's bootstrap)."""
+    rng = np.random.default_rng(BOOTSTRAP_SEED)
+    shuffled = rng.permuted(np.tile(values, (shuffles, 1)), axis=1)
+    return float(np.mean(_cusum_range(shuffled) < _cusum_range(values)))
+
+
+def latest_level_shift(values: np.ndarray, *, min_size: int) -> Optional[LevelShift]:
+    """The most recent change point, compared with the segment before it.
+
+    Every segment, including the one running to the latest build, spans at
+    least ``min_size`` builds, and levels are segment medians, so a single
+    noisy build cannot pass for a shift.
+    """
+    values = np.asarray(values, dtype=float)
+    min_size = max(min_size, 1)
+    if len(values) < 2 * min_size or not np.isfinite(values).all():
+        return None
+    sigma = _noise_sigma(values)
+    penalty = 2.0 * sigma * sigma * np.log(len(values))
+    points = pelt_change_points(values, penalty=penalty, min_size=min_size)
+    if not points:
+        return None
+    index = points[-1]
+    start = points[-2] if len(points) > 1 else 0
+    return LevelShift(
+        index=index,
+        before=float(np.median(values[start:index])),
+        after=float(np.median(values[index:])),
+        confidence=shift_confidence(values[start:]),
+    )
@@ -2,22 +2,32 @@
 
 from __future__ import annotations
 
+import json
+import multiprocessing.util
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
 import numpy as np
 import pandas as pd
+import plotly
 import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs
 
 from benchmark_config import (
     CHART_WINDOW_DAYS,
+    LAYOUT_TEMPLATE_JSON,
+    SITE_MODES,
     ChartDefaults,
     ChartEntry,
     ChartTest,
     effective_reference_build,
     load_desktop_build_labels,
 )
+from noise_model import NoiseModel, chart_noise_model
+from render_cache import RenderCache, render_key
 
 PERFORMANCE_COLORS = ['#10AC84', '#2E86DE', '#F79F1F', '#54A0FF']
 PRIMARY_LOAD_TIME_COLOR = '#10AC84'
@@ -29,6 +39,8 @@ BASELINE_REFERENCE_COLORS = {
 }
 BASELINE_REFERENCE_COLOR_FALLBACK = ['#2E86DE', '#1e8449', '#F79F1F', '#9b59b6']
 
+CHART_TEMPLATE = 'plotly_white'
+
 CHART_WIDTH = 1200
 CHART_HEIGHT = 600
 CHART_SCALE = 1
@@ -77,19 +89,22 @@ def aggregate_by_build(
     """One point per commit_hash (latest run), ordered by date — avoids same-day overlap."""
     keys = ['commit_hash', *(group_cols or [])]
     aggregated = (
-        df.groupby(keys, as_index=False)
+        df.groupby(keys, as_index=False, observed=True)
         .agg(**{value_col: (value_col, 'mean'), 'date': ('date', 'max')})
         .sort_values('date')
         .reset_index(drop=True)
     )
     aggregated['x_index'] = range(len(aggregated))
-    aggregated['tick_label'] = aggregated.apply(
-        lambda row: f"{row['date'].strftime('%b %d')}\n{str(row['commit_hash'])[:7]}",
-        axis=1,
-    )
+    aggregated['tick_label'] = _build_tick_labels(aggregated)
     return aggregated
 
 
+def _build_tick_labels(points: pd.DataFrame) -> pd.Series:
+    """'Mon DD' + newline + short hash per point, without a row-wise apply."""
+    commits = points['commit_hash'].astype(str)
+    return points['date'].dt.strftime('%b %d') + '\n' + commits.str[:7]
+
+
 def _select_x_ticks(points: pd.DataFrame, max_ticks: int = 14) -> pd.DataFrame:
     if len(points) <= max_ticks:
         return points
@@ -127,24 +142,19 @@ def _point_label_texts(
         stride = 2
     else:
         stride = 3
-    ref_levels = ref_levels or []
     y_tol = 0.04 if metrics_kind == 'performance' else 0.5
-    texts = []
-    for index, value in enumerate(values):
-        if index < n_baselines:
-            texts.append('')
-            continue
-        near_ref = any(abs(value - level) < y_tol for level in ref_levels)
-        if near_ref:
-            texts.append('')
-        elif index % stride == 0 or index == count - 1:
-            texts.append(_format_point_label(value, metrics_kind))
-        else:
-            texts.append('')
-    positions = [
-        'top center' if index % 2 == 0 else 'bottom center'
-        for index in range(count)
+    indices = np.arange(count)
+    labelled = (indices >= n_baselines) & ((indices % stride == 0) | (indices == count - 1))
+    if ref_levels:
+        distances = np.abs(
+            np.asarray(values, dtype=float)[:, None] - np.asarray(ref_levels, dtype=float)[None, :]
+        )
+        labelled &= ~(distances < y_tol).any(axis=1)
+    texts = [
+        _format_point_label(value, metrics_kind) if show else ''
+        for value, show in zip(values, labelled.tolist())
     ]
+    positions = np.where(indices % 2 == 0, 'top center', 'bottom center').tolist()
     return texts, positions
 
 
@@ -188,8 +198,22 @@ def series_for_chart(
 
     Returns (series, n_baselines). n_baselines is 0 when pinning is inactive.
     """
+    return _series_from_rows(chart_rows_for(metrics, chart), chart, build_labels)
+
+
+def chart_rows_for(metrics: pd.DataFrame, chart: ChartTest) -> pd.DataFrame:
+    """One chart's rows in the chart window (plus pinned baselines), before aggregation."""
     filtered = metrics_in_chart_window(metrics, chart.baselines)
-    test_data = filtered[match_chart_patterns(filtered['test_name'], chart)].copy()
+    return filtered[match_chart_patterns(filtered['test_name'], chart)]
+
+
+def _series_from_rows(
+    test_data: pd.DataFrame,
+    chart: ChartTest,
+    build_labels: Optional[dict[str, str]] = None,
+) -> Optional[tuple[pd.DataFrame, int]]:
+    """Aggregate one chart's windowed, pattern-matched rows to one point per build."""
+    test_data = test_data.copy()
     if test_data.empty:
         return None
     test_data['test_name'] = chart.pattern
@@ -220,16 +244,94 @@ def series_for_chart(
             )
             aggregated['x_index'] = range(len(aggregated))
             n_baselines = len(base_order)
+            # Baselines lead the frame (x_index 0..n_baselines-1) and use release labels.
+            tick_labels = _build_tick_labels(aggregated)
+            tick_labels.iloc[:n_baselines] = [
+                _baseline_tick_label(labels, commit_hash) for commit_hash in base_order
+            ]
+            aggregated['tick_label'] = tick_labels
 
-            def tick_label(row: pd.Series) -> str:
-                commit_hash = str(row['commit_hash'])
-                if int(row['x_index']) < n_baselines:
-                    return _baseline_tick_label(labels, commit_hash)
-                return f"{row['date'].strftime('%b %d')}\n{commit_hash[:7]}"
+    return aggregated, n_baselines
 
-            aggregated['tick_label'] = aggregated.apply(tick_label, axis=1)
 
-    return aggregated, n_baselines
+class ChartSeriesCache:
+    """Window the metrics once and share per-chart series across renderers and reports.
+
+    Each metrics kind is cut to the chart window plus every configured baseline
+    commit, then indexed by test name. A chart's rows are looked up through the
+    names its patterns match instead of regex-scanning the whole frame, and the
+    aggregated series is memoized so charts, summaries and regression rules reuse it.
+    Results match series_for_chart on the full frame.
+    """
+
+    def __init__(
+        self,
+        metrics: dict[str, Optional[pd.DataFrame]],
+        charts: Iterable[ChartTest],
+        build_labels: Optional[dict[str, str]] = None,
+        days: int = CHART_WINDOW_DAYS,
+    ):
+        self.build_labels = build_labels if build_labels is not None else {}
+        self._cutoff = pd.Timestamp.now().normalize() - pd.Timedelta(days=days)
+        baselines = {
+            str(commit_hash) for chart in charts for commit_hash in chart.baselines if commit_hash
+        }
+        self._frames: dict[str, pd.DataFrame] = {}
+        self._rows_by_name: dict[str, dict[str, np.ndarray]] = {}
+        self._baseline_commits: dict[str, set[str]] = {}
+        for kind, frame in metrics.items():
+            if frame is None or frame.empty:
+                continue
+            commits = frame['commit_hash'].astype(str)
+            windowed = frame[(frame['date'] >= self._cutoff) | commits.isin(baselines)]
+            self._frames[kind] = windowed
+            self._rows_by_name[kind] = windowed.groupby('test_name', sort=False, observed=True).indices
+            self._baseline_commits[kind] = set(commits[commits.isin(baselines)])
+        self._series: dict[str, Optional[tuple[pd.DataFrame, int]]] = {}
+        self._noise: dict[tuple[str, ChartDefaults], NoiseModel] = {}
+
+    def chart_rows(self, chart: ChartTest) -> Optional[pd.DataFrame]:
+        """Windowed rows for one chart, in the order metrics_in_chart_window yields them."""
+        frame = self._frames.get(chart.metrics_kind)
+        if frame is None:
+            return None
+        rows_by_name = self._rows_by_name[chart.metrics_kind]
+        names = pd.Series(list(rows_by_name), dtype=object)
+        matched = names[match_chart_patterns(names, chart)].tolist()
+        if not matched:
+            return frame.iloc[0:0]
+        positions = np.sort(np.concatenate([rows_by_name[name] for name in matched]))
+        rows = frame.iloc[positions]
+        recent = rows[rows['date'] >= self._cutoff]
+        baseline_hashes = {str(commit_hash) for commit_hash in chart.baselines if commit_hash}
+        if not baseline_hashes & self._baseline_commits[chart.metrics_kind]:
+            return recent
+        return (
+            pd.concat([
+                recent,
+                rows[rows['commit_hash'].astype(str).isin(baseline_hashes)],
+            ], ignore_index=True)
+            .drop_duplicates(subset=['commit_hash', 'test_name', 'date'], keep='last')
+            .reset_index(drop=True)
+        )
+
+    def series(self, chart: ChartTest) -> Optional[tuple[pd.DataFrame, int]]:
+        if chart.test_id not in self._series:
+            rows = self.chart_rows(chart)
+            self._series[chart.test_id] = (
+                None if rows is None else _series_from_rows(rows, chart, self.build_labels)
+            )
+        return self._series[chart.test_id]
+
+    def noise_model(self, chart: ChartTest, defaults: ChartDefaults) -> NoiseModel:
+        key = (chart.test_id, defaults)
+        if key not in self._noise:
+            result = self.series(chart)
+            self._noise[key] = chart_noise_model(
+                chart, defaults, self.chart_rows(chart),
+                None if result is None else result[0],
+            )
+        return self._noise[key]
 
 
 def _rolling_mean(values: List[float], window: int) -> List[float]:
@@ -455,6 +557,7 @@ def _add_normal_range(
     chart: ChartTest,
     defaults: ChartDefaults,
     build_labels: dict[str, str],
+    regression_pct: float,
 ) -> str:
     if chart.metrics_kind != 'performance':
         return ''
@@ -467,8 +570,8 @@ def _add_normal_range(
 
     reference_value = float(reference_rows[chart.value_column].iloc[0])
     for level in (
-        reference_value * (1 - defaults.regression_pct),
-        reference_value * (1 + defaults.regression_pct),
+        reference_value * (1 - regression_pct),
+        reference_value * (1 + regression_pct),
     ):
         fig.add_hline(
             y=level,
@@ -480,7 +583,7 @@ def _add_normal_range(
         )
     raw_label = build_labels.get(reference_build, '')
     version = _version_from_label(raw_label) if raw_label else reference_build[:8]
-    return f'{version} ±{defaults.regression_pct:.0%}'
+    return f'{version} ±{regression_pct:.0%}'
 
 
 def _add_baseline_separator(fig: go.Figure, n_baselines: int, n_points: int) -> None:
@@ -528,7 +631,7 @@ def _apply_layout(
     title_pad = dict(b=12)
 
     layout = dict(
-        template='plotly_white',
+        template=CHART_TEMPLATE,
         title=dict(
             text=_build_title(chart),
             x=0.05, xanchor='left', pad=title_pad,
@@ -589,20 +692,35 @@ def _disconnected_trace_series(
     n_baselines: int = 0,
 ) -> tuple[list, list]:
     """Break lines between pinned baseline columns and before trend."""
-    x_out: list = []
-    y_out: list = []
-    rows = points.reset_index(drop=True)
-    for pos in range(len(rows)):
-        row = rows.iloc[pos]
-        if x_out and n_baselines > 0:
-            prev_x = int(rows.iloc[pos - 1]['x_index'])
-            curr_x = int(row['x_index'])
-            if prev_x < n_baselines or curr_x < n_baselines:
-                x_out.append(None)
-                y_out.append(None)
-        x_out.append(int(row['x_index']))
-        y_out.append(row[value_col])
-    return x_out, y_out
+    x_index = points['x_index'].to_numpy(dtype=int)
+    gaps = _gap_positions(x_index, n_baselines)
+    return (
+        _insert_gaps(x_index.tolist(), gaps, None),
+        _insert_gaps(points[value_col].tolist(), gaps, None),
+    )
+
+
+def _gap_positions(x_index: np.ndarray, n_baselines: int) -> np.ndarray:
+    """Point positions that get a None slot before them (either neighbour is a baseline)."""
+    if n_baselines <= 0 or len(x_index) < 2:
+        return np.empty(0, dtype=int)
+    breaks = (x_index[:-1] < n_baselines) | (x_index[1:] < n_baselines)
+    return np.flatnonzero(breaks) + 1
+
+
+def _insert_gaps(values: list, gaps: np.ndarray, filler) -> list:
+    """Insert ``filler`` before each position in ``gaps`` by splicing slices.
+
+    Only the gaps (at most one per baseline) are iterated, not the points.
+    """
+    out: list = []
+    start = 0
+    for gap in gaps.tolist():
+        out.extend(values[start:gap])
+        out.append(filler)
+        start = gap
+    out.extend(values[start:])
+    return out
 
 
 def _add_build_trace(
@@ -622,33 +740,19 @@ def _add_build_trace(
     x_col = 'x_index' if 'x_index' in points.columns else 'date'
     values = points[value_col].tolist()
     if x_col == 'x_index' and n_baselines > 0:
+        points = points.reset_index(drop=True)
+        gaps = _gap_positions(points['x_index'].to_numpy(dtype=int), n_baselines)
         x_values, y_values = _disconnected_trace_series(
-            points.reset_index(drop=True), value_col, n_baselines=n_baselines,
+            points, value_col, n_baselines=n_baselines,
         )
-        full_cd = _trace_customdata(points)
-        customdata: list = []
-        value_idx = 0
-        for x in x_values:
-            if x is None:
-                customdata.append(['', ''])
-            else:
-                customdata.append(full_cd[value_idx])
-                value_idx += 1
-        # Map disconnected indices back to text labels (skip None slots).
+        customdata = _insert_gaps(_trace_customdata(points), gaps, ['', ''])
+        # Gap slots get blank labels so text stays aligned with the points.
         if show_point_labels:
             full_text, full_pos = _point_label_texts(
                 values, metrics_kind, n_baselines=n_baselines, ref_levels=ref_levels,
             )
-            text, textposition = [], []
-            value_idx = 0
-            for x in x_values:
-                if x is None:
-                    text.append('')
-                    textposition.append('top center')
-                else:
-                    text.append(full_text[value_idx])
-                    textposition.append(full_pos[value_idx])
-                    value_idx += 1
+            text = _insert_gaps(full_text, gaps, '')
+            textposition = _insert_gaps(full_pos, gaps, 'top center')
             mode = 'lines+markers+text'
         else:
             text, textposition = None, None
@@ -727,11 +831,53 @@ def _add_rolling_average_trace_trend_only(
     )
 
 
-def save_chart_assets(fig: go.Figure, output_dir: Path, graph_filename: str) -> str:
+def chart_asset_filename(graph_filename: str, site_mode: str = 'iframe') -> str:
+    """Name of the per-chart file under charts/ that the site loads."""
+    suffix = '.json' if site_mode == 'bundle' else '.html'
+    return Path(graph_filename).with_suffix(suffix).name
+
+
+def compact_figure_json(fig: go.Figure) -> dict:
+    """Figure data + layout without the shared template, sized by its container."""
+    figure = json.loads(fig.to_json())
+    layout = figure.get('layout', {})
+    layout.pop('template', None)
+    layout.pop('width', None)
+    layout.pop('height', None)
+    layout['autosize'] = True
+    return {'data': figure.get('data', []), 'layout': layout}
+
+
+def write_layout_template(output_dir: Path) -> None:
+    charts_dir = output_dir / 'charts'
+    charts_dir.mkdir(parents=True, exist_ok=True)
+    template = json.loads(go.Figure(layout=dict(template=CHART_TEMPLATE)).to_json())
+    (charts_dir / LAYOUT_TEMPLATE_JSON).write_text(
+        json.dumps(template['layout']['template'], separators=(',', ':')),
+        encoding='utf-8',
+    )
+
+
+def save_chart_assets(
+    fig: go.Figure,
+    output_dir: Path,
+    graph_filename: str,
+    *,
+    site_mode: str = 'iframe',
+) -> str:
     charts_dir = output_dir / 'charts'
     charts_dir.mkdir(parents=True, exist_ok=True)
-    html_filename = Path(graph_filename).with_suffix('.html').name
     fig.write_image(output_dir / graph_filename, scale=CHART_SCALE)
+    if site_mode == 'bundle':
+        data_filename = chart_asset_filename(graph_filename, site_mode)
+        (charts_dir / data_filename).write_text(
+            json.dumps(compact_figure_json(fig), separators=(',', ':')),
+            encoding='utf-8',
+        )
+        print(f'Generated {graph_filename} and charts/{data_filename}')
+        return data_filename
+
+    html_filename = chart_asset_filename(graph_filename)
     html_figure = go.Figure(fig)
     html_figure.update_layout(width=None, height=None, autosize=True)
     html_path = charts_dir / html_filename
@@ -758,18 +904,27 @@ def save_chart_assets(fig: go.Figure, output_dir: Path, graph_filename: str) ->
 
 def build_chart_figure(
     chart: ChartTest,
-    metrics: pd.DataFrame,
+    metrics: Optional[pd.DataFrame],
     defaults: ChartDefaults,
     *,
     footnote: str = '',
     build_labels: Optional[dict[str, str]] = None,
+    series_cache: Optional[ChartSeriesCache] = None,
 ) -> Optional[go.Figure]:
-    labels = build_labels if build_labels is not None else load_desktop_build_labels()
-    result = series_for_chart(metrics, chart, labels)
+    if series_cache is not None:
+        labels = series_cache.build_labels
+        result = series_cache.series(chart)
+    else:
+        labels = build_labels if build_labels is not None else load_desktop_build_labels()
+        result = series_for_chart(metrics, chart, labels)
     if result is None:
         print(f'Warning: No data for {chart.test_id} in the last {CHART_WINDOW_DAYS} days')
         return None
     series, n_baselines = result
+    noise = (
+        series_cache.noise_model(chart, defaults) if series_cache is not None
+        else chart_noise_model(chart, defaults, chart_rows_for(metrics, chart), series)
+    )
 
     fig = go.Figure()
     value_format = _hover_value_format(chart.metrics_kind)
@@ -816,7 +971,9 @@ def build_chart_figure(
         fig, series, chart.value_column, ref_builds, labels,
         ymax=ymax, metrics_kind=chart.metrics_kind,
     )
-    normal_range_label = _add_normal_range(fig, series, chart, defaults, labels)
+    normal_range_label = _add_normal_range(
+        fig, series, chart, defaults, labels, noise.regression_pct,
+    )
     _add_baseline_separator(fig, n_baselines, len(series))
 
     n_points = len(series)
@@ -833,24 +990,241 @@ def build_chart_figure(
 
 def render_chart(
     chart: ChartTest,
-    metrics: pd.DataFrame,
+    metrics: Optional[pd.DataFrame],
     output_dir: Path,
     defaults: ChartDefaults,
+    *,
+    series_cache: Optional[ChartSeriesCache] = None,
+    site_mode: str = 'iframe',
 ) -> Optional[ChartEntry]:
     footnote = compose_chart_footnote(chart)
-    fig = build_chart_figure(chart, metrics, defaults, footnote=footnote)
+    fig = build_chart_figure(
+        chart, metrics, defaults, footnote=footnote, series_cache=series_cache,
+    )
     if fig is None:
         return None
-    html_filename = save_chart_assets(fig, output_dir, chart.graph_filename)
+    save_chart_assets(fig, output_dir, chart.graph_filename, site_mode=site_mode)
+    return _chart_entry(chart, site_mode)
+
+
+def _chart_entry(chart: ChartTest, site_mode: str) -> ChartEntry:
     return ChartEntry(
         display_name=chart.display_name,
-        html_filename=html_filename,
-        footnote=footnote,
+        html_filename=chart_asset_filename(chart.graph_filename),
+        footnote=compose_chart_footnote(chart),
+        data_filename=(
+            chart_asset_filename(chart.graph_filename, site_mode) if site_mode == 'bundle' else ''
+        ),
+    )
+
+
+def start_image_renderer() -> None:
+    """Keep one Kaleido renderer warm for every write_image in this process.
+
+    Kaleido 1.x otherwise launches a fresh Chrome per image; 0.2.x already keeps
+    its subprocess alive between calls, so there is nothing to start.
+    """
+    try:
+        import kaleido
+    except ImportError:
+        return
+    start_server = getattr(kaleido, 'start_sync_server', None)
+    if start_server is None:
+        return
+    try:
+        # The server thread dies silently without Chrome and later calls would
+        # block; probe first and leave write_image to report the missing browser.
+        kaleido.Kaleido()
+    except Exception:
+        return
+    start_server(silence_warnings=True)
+
+
+def stop_image_renderer() -> None:
+    try:
+        import kaleido
+    except ImportError:
+        return
+    stop_server = getattr(kaleido, 'stop_sync_server', None)
+    if stop_server is not None:
+        stop_server(silence_warnings=True)
+
+
+# Per-process render inputs, set once by the pool initializer instead of per chart.
+_RENDER_WORKER_STATE: dict = {}
+
+
+def _init_render_worker(
+    series_cache: ChartSeriesCache,
+    output_dir: Path,
+    defaults: ChartDefaults,
+    site_mode: str,
+) -> None:
+    _RENDER_WORKER_STATE.update(
+        series_cache=series_cache, output_dir=output_dir, defaults=defaults,
+        site_mode=site_mode,
     )
+    start_image_renderer()
+    # Pool workers leave through os._exit, so atexit hooks never close Chrome.
+    multiprocessing.util.Finalize(None, stop_image_renderer, exitpriority=10)
+
+
+def _render_chart_safe(chart: ChartTest) -> tuple[Optional[ChartEntry], Optional[str]]:
+    state = _RENDER_WORKER_STATE
+    try:
+        entry = render_chart(
+            chart, None, state['output_dir'], state['defaults'],
+            series_cache=state['series_cache'],
+            site_mode=state['site_mode'],
+        )
+        return entry, None
+    except Exception as error:
+        return None, str(error)
+
+
+@lru_cache(maxsize=1)
+def _renderer_version() -> str:
+    """Plotly version plus the source of the modules that shape a chart."""
+    sources = (Path(__file__), Path(__file__).with_name('benchmark_config.py'))
+    return render_key([plotly.__version__, *(path.read_text(encoding='utf-8') for path in sources)])
+
+
+def chart_render_key(
+    chart: ChartTest,
+    defaults: ChartDefaults,
+    series_cache: ChartSeriesCache,
+    site_mode: str = 'iframe',
+) -> Optional[str]:
+    """Hash of every input to a chart's PNG + site asset, or None when it has no data."""
+    result = series_cache.series(chart)
+    if result is None:
+        return None
+    series, n_baselines = result
+    return render_key([
+        _renderer_version(),
+        site_mode,
+        repr(chart),
+        repr(defaults),
+        repr(series_cache.noise_model(chart, defaults)),
+        json.dumps(series_cache.build_labels, sort_keys=True),
+        str(n_baselines),
+        series.to_csv(index=False),
+    ])
+
+
+def render_charts(
+    charts: Sequence[ChartTest],
+    output_dir: Path,
+    defaults: ChartDefaults,
+    series_cache: ChartSeriesCache,
+    *,
+    jobs: int = 1,
+    render_cache: Optional[RenderCache] = None,
+    site_mode: str = 'iframe',
+) -> Dict[str, ChartEntry]:
+    """Render PNG + HTML assets for ``charts`` and return entries keyed by test id.
+
+    With ``jobs > 1`` figures are built and exported in worker processes, each
+    holding its own warm Kaleido renderer. Every chart writes only its own files
+    and results are collected in ``charts`` order, so the output does not depend
+    on which worker finishes first.
+
+    With a ``render_cache``, charts whose render key matches the manifest keep
+    their existing files and only changed charts are rendered.
+
+    ``site_mode='bundle'`` writes compact figure JSON for the client-side
+    renderer instead of a Plotly HTML document per chart.
+    """
+    # Both site modes load charts/plotly.min.js. write_html would copy it on demand,
+    # but bundle mode never calls it and pool workers would race on the same file.
+    # Rewritten when it differs, so a Plotly upgrade reaches pages with cached charts.
+    charts_dir = output_dir / 'charts'
+    charts_dir.mkdir(parents=True, exist_ok=True)
+    plotlyjs_path = charts_dir / 'plotly.min.js'
+    plotlyjs = get_plotlyjs()
+    if not plotlyjs_path.exists() or plotlyjs_path.read_text(encoding='utf-8') != plotlyjs:
+        plotlyjs_path.write_text(plotlyjs, encoding='utf-8')
+    if site_mode == 'bundle':
+        write_layout_template(output_dir)
+    results_by_id: Dict[str, tuple[Optional[ChartEntry], Optional[str]]] = {}
+    keys: Dict[str, str] = {}
+    pending: List[ChartTest] = []
+    for chart in charts:
+        key = chart_render_key(chart, defaults, series_cache, site_mode) if render_cache else None
+        if key is not None and render_cache.is_fresh(
+            chart.graph_filename, key, chart_asset_filename(chart.graph_filename, site_mode),
+        ):
+            results_by_id[chart.test_id] = (_chart_entry(chart, site_mode), None)
+            continue
+        if key is not None:
+            keys[chart.test_id] = key
+        pending.append(chart)
+    if render_cache is not None:
+        print(f'Reusing {len(charts) - len(pending)} unchanged charts, rendering {len(pending)}')
+
+    for chart, result in zip(pending, _render_pending_charts(
+        pending, output_dir, defaults, series_cache, jobs=jobs, site_mode=site_mode,
+    )):
+        results_by_id[chart.test_id] = result
+        if render_cache is None:
+            continue
+        entry, error = result
+        if entry is not None and error is None and chart.test_id in keys:
+            render_cache.store(chart.graph_filename, keys[chart.test_id])
+        else:
+            render_cache.discard(chart.graph_filename)
+    if render_cache is not None:
+        render_cache.save()
+
+    entries: Dict[str, ChartEntry] = {}
+    for chart in charts:
+        entry, error = results_by_id[chart.test_id]
+        if error is not None:
+            print(f'Error generating chart for {chart.test_id}: {error}')
+        elif entry is not None:
+            entries[chart.test_id] = entry
+    return entries
+
+
+def _render_pending_charts(
+    charts: Sequence[ChartTest],
+    output_dir: Path,
+    defaults: ChartDefaults,
+    series_cache: ChartSeriesCache,
+    *,
+    jobs: int,
+    site_mode: str,
+) -> List[tuple[Optional[ChartEntry], Optional[str]]]:
+    if not charts:
+        return []
+
+    init_args = (series_cache, output_dir, defaults, site_mode)
+    workers = min(jobs, len(charts))
+    if workers <= 1:
+        _RENDER_WORKER_STATE.update(
+            series_cache=series_cache, output_dir=output_dir, defaults=defaults,
+            site_mode=site_mode,
+        )
+        start_image_renderer()
+        try:
+            return [_render_chart_safe(chart) for chart in charts]
+        finally:
+            stop_image_renderer()
+            _RENDER_WORKER_STATE.clear()
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_render_worker,
+            initargs=init_args,
+        ) as executor:
+            return list(executor.map(_render_chart_safe, charts))
 
 
 def cleanup_stale_charts(output_dir: Path, graph_filenames: Iterable[str]):
     expected_png = set(graph_filenames)
+    render_cache = RenderCache.load(output_dir)
+    if render_cache.retain(expected_png):
+        render_cache.save()
     for png in output_dir.glob('*.png'):
         if png.name not in expected_png:
             png.unlink()
@@ -859,8 +1233,12 @@ def cleanup_stale_charts(output_dir: Path, graph_filenames: Iterable[str]):
     charts_dir = output_dir / 'charts'
     if not charts_dir.exists():
         return
-    expected_html = {Path(name).with_suffix('.html').name for name in expected_png}
-    for html_file in charts_dir.glob('*.html'):
-        if html_file.name not in expected_html:
-            html_file.unlink()
-            print(f'Removed stale chart: charts/{html_file.name}')
+    for site_mode in SITE_MODES:
+        expected_assets = {chart_asset_filename(name, site_mode) for name in expected_png}
+        if site_mode == 'bundle':
+            expected_assets.add(LAYOUT_TEMPLATE_JSON)
+        suffix = Path(chart_asset_filename('chart.png', site_mode)).suffix
+        for asset_file in charts_dir.glob(f'*{suffix}'):
+            if asset_file.name not in expected_assets:
+                asset_file.unlink()
+                print(f'Removed stale chart: charts/{asset_file.name}')
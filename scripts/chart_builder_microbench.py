@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Microbenchmark: vectorized chart_builder helpers vs the row-wise versions they replaced.
+
+Builds a synthetic series of --builds points (two pinned baselines plus trend)
+and times tick labels, point labels and the gap-inserted x/y/customdata/text
+arrays of the build trace. Each pair is checked for identical output first.
+
+    python scripts/chart_builder_microbench.py --builds 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from chart_builder import (
+    _baseline_tick_label,
+    _build_tick_labels,
+    _disconnected_trace_series,
+    _format_point_label,
+    _gap_positions,
+    _insert_gaps,
+    _point_label_texts,
+    _trace_customdata,
+)
+
+N_BASELINES = 2
+BUILD_LABELS = {'base000': '2.37.0|GA', 'base001': '2.38.0|GA'}
+REF_LEVELS = [0.5, 0.8]
+
+
+def synthetic_series(builds: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    hashes = [f'base{index:03d}' for index in range(N_BASELINES)] + [
+        f'{value:010x}' for value in rng.integers(0, 16 ** 10, builds - N_BASELINES)
+    ]
+    return pd.DataFrame({
+        'commit_hash': hashes,
+        'date': pd.date_range('2020-01-01 05:30', periods=builds, freq='7h'),
+        'avg_time': rng.normal(0.7, 0.15, builds).round(3),
+        'x_index': range(builds),
+    })
+
+
+# --- Row-wise implementations, as they were before vectorization ---
+
+def legacy_tick_labels(points: pd.DataFrame) -> pd.Series:
+    def tick_label(row: pd.Series) -> str:
+        commit_hash = str(row['commit_hash'])
+        if int(row['x_index']) < N_BASELINES:
+            return _baseline_tick_label(BUILD_LABELS, commit_hash)
+        return f"{row['date'].strftime('%b %d')}\n{commit_hash[:7]}"
+
+    return points.apply(tick_label, axis=1)
+
+
+def legacy_point_label_texts(
+    values: List[float],
+    metrics_kind: str,
+    *,
+    n_baselines: int = 0,
+    ref_levels: Optional[List[float]] = None,
+) -> tuple[List[str], List[str]]:
+    count = len(values)
+    stride = 1 if count <= 16 else 2 if count <= 28 else 3
+    ref_levels = ref_levels or []
+    y_tol = 0.04 if metrics_kind == 'performance' else 0.5
+    texts = []
+    for index, value in enumerate(values):
+        if index < n_baselines:
+            texts.append('')
+            continue
+        if any(abs(value - level) < y_tol for level in ref_levels):
+            texts.append('')
+        elif index % stride == 0 or index == count - 1:
+            texts.append(_format_point_label(value, metrics_kind))
+        else:
+            texts.append('')
+    positions = ['top center' if index % 2 == 0 else 'bottom center' for index in range(count)]
+    return texts, positions
+
+
+def legacy_trace_arrays(points: pd.DataFrame) -> tuple:
+    x_out: list = []
+    y_out: list = []
+    rows = points.reset_index(drop=True)
+    for pos in range(len(rows)):
+        row = rows.iloc[pos]
+        if x_out:
+            prev_x = int(rows.iloc[pos - 1]['x_index'])
+            curr_x = int(row['x_index'])
+            if prev_x < N_BASELINES or curr_x < N_BASELINES:
+                x_out.append(None)
+                y_out.append(None)
+        x_out.append(int(row['x_index']))
+        y_out.append(row['avg_time'])
+    full_cd = _trace_customdata(points)
+    full_text, full_pos = legacy_point_label_texts(
+        points['avg_time'].tolist(), 'performance',
+        n_baselines=N_BASELINES, ref_levels=REF_LEVELS,
+    )
+    customdata, text, textposition = [], [], []
+    value_idx = 0
+    for x in x_out:
+        if x is None:
+            customdata.append(['', ''])
+            text.append('')
+            textposition.append('top center')
+        else:
+            customdata.append(full_cd[value_idx])
+            text.append(full_text[value_idx])
+            textposition.append(full_pos[value_idx])
+            value_idx += 1
+    return x_out, y_out, customdata, text, textposition
+
+
+# --- Current implementations ---
+
+def current_tick_labels(points: pd.DataFrame) -> pd.Series:
+    labels = _build_tick_labels(points)
+    labels.iloc[:N_BASELINES] = [
+        _baseline_tick_label(BUILD_LABELS, commit_hash)
+        for commit_hash in points['commit_hash'].iloc[:N_BASELINES]
+    ]
+    return labels
+
+
+def current_point_label_texts(points: pd.DataFrame) -> tuple[List[str], List[str]]:
+    return _point_label_texts(
+        points['avg_time'].tolist(), 'performance',
+        n_baselines=N_BASELINES, ref_levels=REF_LEVELS,
+    )
+
+
+def current_trace_arrays(points: pd.DataFrame) -> tuple:
+    gaps = _gap_positions(points['x_index'].to_numpy(dtype=int), N_BASELINES)
+    x_values, y_values = _disconnected_trace_series(points, 'avg_time', n_baselines=N_BASELINES)
+    full_text, full_pos = current_point_label_texts(points)
+    return (
+        x_values,
+        y_values,
+        _insert_gaps(_trace_customdata(points), gaps, ['', '']),
+        _insert_gaps(full_text, gaps, ''),
+        _insert_gaps(full_pos, gaps, 'top center'),
+    )
+
+
+def _best_of(func: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--builds', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    points = synthetic_series(args.builds)
+    values = points['avg_time'].tolist()
+    cases = [
+        (
+            'tick labels',
+            lambda: legacy_tick_labels(points),
+            lambda: current_tick_labels(points),
+        ),
+        (
+            'point labels',
+            lambda: legacy_point_label_texts(
+                values, 'performance', n_baselines=N_BASELINES, ref_levels=REF_LEVELS,
+            ),
+            lambda: current_point_label_texts(points),
+        ),
+        (
+            'trace arrays',
+            lambda: legacy_trace_arrays(points),
+            lambda: current_trace_arrays(points),
+        ),
+    ]
+
+    print(f'{args.builds:,} builds, best of {args.repeat}')
+    print(f'{"step":<14} {"row-wise":>10} {"vectorized":>11} {"speedup":>8}')
+    for name, legacy, current in cases:
+        legacy_result, current_result = legacy(), current()
+        if isinstance(legacy_result, pd.Series):
+            same = legacy_result.tolist() == current_result.tolist()
+        else:
+            same = legacy_result == current_result
+        if not same:
+            raise SystemExit(f'Error: {name} output differs from the row-wise version')
+        legacy_s = _best_of(legacy, args.repeat)
+        current_s = _best_of(current, args.repeat)
+        print(
+            f'{name:<14} {legacy_s * 1000:>8.1f}ms {current_s * 1000:>9.1f}ms '
+            f'{legacy_s / current_s:>7.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
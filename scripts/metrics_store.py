@@ -0,0 +1,663 @@
+"""Pluggable storage for the metrics history: plain CSV, a compact columnar format or SQLite.
+
+The CSV backend is the layout committed under ``data/``. The columnar backend keeps
+one compressed ``.npz`` archive per metrics file under ``data/columnar/``: dates as
+int64 nanoseconds, string columns as dictionary-encoded categoricals, numbers as
+typed arrays and ``all_runs`` as a flat float array plus row offsets. Archive members
+are decompressed only when a column is read, so callers that ask for a few columns
+never touch the rest. Appends go to a small per-run delta archive next to the base
+one, so a parse costs the size of that run rather than of the history; reads
+concatenate base and deltas, and ``compact`` folds the deltas back into the base
+archive. ``copy_metrics`` (the ``export-csv`` command) writes the
+columnar history back to the CSV layout so the repository copy stays human-readable.
+
+The SQLite backend keeps every metrics file as a table in ``data/metrics.sqlite``
+indexed on ``(test_name, date)``, ``commit_hash`` and ``metric_id``; a
+``MetricsQuery`` (chart window, pinned baselines, chart patterns) is pushed down
+into the SQL so only the rows charts and reports can use are loaded.
+
+The partitioned backend splits every metrics file into monthly CSVs under
+``data/partitions/<file>/YYYY-MM.csv`` with a ``manifest.json`` recording each
+partition's date range, row count and commits. Reads with a ``MetricsQuery`` open
+only partitions that overlap the chart window or hold a pinned baseline commit;
+``compact`` rewrites partitions sorted and de-duplicated.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import re
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+STORAGE_BACKENDS = ('csv', 'columnar', 'sqlite', 'partitioned')
+# Backends that read less when given a MetricsQuery; csv and columnar load everything anyway.
+QUERY_PUSHDOWN_BACKENDS = ('sqlite', 'partitioned')
+COLUMNAR_DIR = 'columnar'
+SQLITE_DB = 'metrics.sqlite'
+PARTITIONS_DIR = 'partitions'
+PARTITION_MANIFEST = 'manifest.json'
+DATE_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+CATEGORICAL_COLUMNS = frozenset({
+    'commit_hash', 'test_name', 'metric_id', 'status', 'device', 'metric', 'unit',
+})
+INTEGER_COLUMNS = frozenset({'run_count', 'attempted'})
+DATE_COLUMN = 'date'
+RUNS_COLUMN = 'all_runs'
+
+RunKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class MetricsQuery:
+    """Rows a reader needs: recent window or pinned baselines, limited to chart patterns.
+
+    This only narrows what is loaded; consumers still apply their own filters, so
+    every backend returns a superset of the rows any chart will use.
+    """
+
+    since: Optional[pd.Timestamp] = None
+    baselines: Tuple[str, ...] = ()
+    patterns: Optional[Tuple[str, ...]] = None
+
+    def matching_names(self, names: Iterable[str]) -> List[str]:
+        # Same rule as chart_builder.match_test_pattern: pattern then '[' or end.
+        if self.patterns is None:
+            return list(names)
+        regex = re.compile('|'.join(
+            rf'{re.escape(pattern)}(?:\[|$)' for pattern in self.patterns
+        ) or r'(?!)')
+        return [name for name in names if regex.search(name)]
+
+
+def _is_missing(value) -> bool:
+    return value is None or value == '' or (isinstance(value, float) and np.isnan(value))
+
+
+def _apply_query(frame: pd.DataFrame, query: Optional[MetricsQuery]) -> pd.DataFrame:
+    if query is None:
+        return frame
+    mask = pd.Series(True, index=frame.index)
+    if query.since is not None:
+        in_window = frame[DATE_COLUMN] >= query.since
+        if query.baselines:
+            in_window |= frame['commit_hash'].astype(str).isin(query.baselines)
+        mask &= in_window
+    if query.patterns is not None:
+        names = frame['test_name'].dropna().astype(str).unique()
+        mask &= frame['test_name'].astype(str).isin(query.matching_names(names))
+    return frame[mask]
+
+
+class CsvMetricsStore:
+    """Append-only CSV files, one per metrics kind (the repository layout)."""
+
+    backend = 'csv'
+
+    def __init__(self, data_dir: Path):
+        self.data_dir = data_dir
+
+    def exists(self, filename: str) -> bool:
+        return (self.data_dir / filename).exists()
+
+    def append_rows(self, filename: str, fieldnames: List[str], rows: List[Dict]) -> None:
+        if not rows:
+            return
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        csv_path = self.data_dir / filename
+        file_exists = csv_path.exists()
+        with open(csv_path, 'a', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            if not file_exists:
+                writer.writeheader()
+            writer.writerows(rows)
+
+    def read(
+        self,
+        filename: str,
+        columns: Optional[Sequence[str]] = None,
+        query: Optional[MetricsQuery] = None,
+    ) -> Optional[pd.DataFrame]:
+        path = self.data_dir / filename
+        if not path.exists():
+            return None
+        if columns is None:
+            frame = pd.read_csv(path, parse_dates=[DATE_COLUMN])
+            return _apply_query(frame, query).sort_values(DATE_COLUMN)
+        frame = pd.read_csv(
+            path,
+            usecols=lambda name: name in columns,
+            parse_dates=[DATE_COLUMN] if DATE_COLUMN in columns else False,
+        )
+        return frame.sort_values(DATE_COLUMN) if DATE_COLUMN in frame.columns else frame
+
+    def read_rows(self, filename: str) -> Tuple[List[str], List[Dict]]:
+        path = self.data_dir / filename
+        if not path.exists():
+            return [], []
+        with open(path, newline='', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            return list(reader.fieldnames or []), list(reader)
+
+    def write_rows(self, filename: str, fieldnames: List[str], rows: List[Dict]) -> None:
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.data_dir / filename, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def remove_runs(self, filename: str, keys: Set[RunKey]) -> int:
+        """Drop rows whose (commit_hash, date) is in keys; returns rows removed."""
+        if not keys or not self.exists(filename):
+            return 0
+        fieldnames, rows = self.read_rows(filename)
+        kept = [row for row in rows if (row.get('commit_hash'), row.get('date')) not in keys]
+        if len(kept) == len(rows):
+            return 0
+        self.write_rows(filename, fieldnames, kept)
+        return len(rows) - len(kept)
+
+
+class ColumnarMetricsStore(CsvMetricsStore):
+    """Typed, dictionary-encoded columns in one compressed .npz archive per file."""
+
+    backend = 'columnar'
+
+    def _path(self, filename: str) -> Path:
+        return self.data_dir / COLUMNAR_DIR / Path(filename).with_suffix('.npz').name
+
+    def deltas(self, filename: str) -> List[Path]:
+        """Delta archives appended since the last full write, oldest first."""
+        stem = Path(filename).stem
+        return sorted((self.data_dir / COLUMNAR_DIR).glob(f'{stem}.delta-??????.npz'))
+
+    def exists(self, filename: str) -> bool:
+        return self._path(filename).exists()
+
+    def append_rows(self, filename: str, fieldnames: List[str], rows: List[Dict]) -> None:
+        if not rows:
+            return
+        if not self.exists(filename):
+            self.write_rows(filename, fieldnames, rows)
+            return
+        deltas = self.deltas(filename)
+        number = int(deltas[-1].stem.rsplit('-', 1)[1]) + 1 if deltas else 1
+        base = self._path(filename)
+        _write_archive(base.with_name(f'{base.stem}.delta-{number:06d}.npz'), fieldnames, rows)
+
+    def read(
+        self,
+        filename: str,
+        columns: Optional[Sequence[str]] = None,
+        query: Optional[MetricsQuery] = None,
+    ) -> Optional[pd.DataFrame]:
+        path = self._path(filename)
+        if not path.exists():
+            return None
+        frames = [_read_archive(archive, columns) for archive in [path, *self.deltas(filename)]]
+        frame = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        for name in CATEGORICAL_COLUMNS & set(frame.columns):
+            if not isinstance(frame[name].dtype, pd.CategoricalDtype):
+                frame[name] = frame[name].astype('category')
+        if columns is None:
+            frame = _apply_query(frame, query)
+        if DATE_COLUMN in frame.columns:
+            frame = frame.sort_values(DATE_COLUMN)
+        return frame
+
+    def read_rows(self, filename: str) -> Tuple[List[str], List[Dict]]:
+        frame = self.read(filename)
+        if frame is None:
+            return [], []
+        frame = frame.sort_index()
+        records = []
+        columns = list(frame.columns)
+        for values in zip(*(_csv_values(frame[name], name) for name in columns)):
+            records.append(dict(zip(columns, values)))
+        return columns, records
+
+    def write_rows(self, filename: str, fieldnames: List[str], rows: List[Dict]) -> None:
+        _write_archive(self._path(filename), fieldnames, rows)
+        for delta in self.deltas(filename):
+            delta.unlink()
+
+    def compact(self, filename: str) -> int:
+        """Fold the delta archives into the base archive; returns deltas merged."""
+        merged = len(self.deltas(filename))
+        if merged:
+            fieldnames, rows = self.read_rows(filename)
+            self.write_rows(filename, fieldnames, rows)
+        return merged
+
+
+class SqliteMetricsStore(CsvMetricsStore):
+    """One indexed table per metrics file in data/metrics.sqlite, with query pushdown."""
+
+    backend = 'sqlite'
+
+    @property
+    def db_path(self) -> Path:
+        return self.data_dir / SQLITE_DB
+
+    @staticmethod
+    def _table(filename: str) -> str:
+        return Path(filename).stem
+
+    def _connect(self) -> sqlite3.Connection:
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        return sqlite3.connect(self.db_path)
+
+    def _columns(self, connection: sqlite3.Connection, table: str) -> List[str]:
+        return [row[1] for row in connection.execute(f'PRAGMA table_info("{table}")')]
+
+    def exists(self, filename: str) -> bool:
+        if not self.db_path.exists():
+            return False
+        with closing(self._connect()) as connection:
+            return bool(self._columns(connection, self._table(filename)))
+
+    def _ensure_table(
+        self,
+        connection: sqlite3.Connection,
+        table: str,
+        fieldnames: Sequence[str],
+    ) -> None:
+        existing = self._columns(connection, table)
+        missing = [name for name in fieldnames if name not in existing]
+        if not existing:
+            definitions = ', '.join(f'"{name}" {_sql_type(name)}' for name in fieldnames)
+            connection.execute(f'CREATE TABLE "{table}" ({definitions})')
+        else:
+            for name in missing:
+                connection.execute(f'ALTER TABLE "{table}" ADD COLUMN "{name}" {_sql_type(name)}')
+        columns = set(existing) | set(fieldnames)
+        for suffix, indexed in (
+            ('test_date', ('test_name', DATE_COLUMN)),
+            ('commit', ('commit_hash',)),
+            ('metric', ('metric_id',)),
+        ):
+            if set(indexed) <= columns:
+                connection.execute(
+                    f'CREATE INDEX IF NOT EXISTS "idx_{table}_{suffix}" ON "{table}" '
+                    f'({", ".join(indexed)})'
+                )
+
+    def _insert(
+        self,
+        connection: sqlite3.Connection,
+        table: str,
+        fieldnames: Sequence[str],
+        rows: List[Dict],
+    ) -> None:
+        self._ensure_table(connection, table, fieldnames)
+        quoted = ', '.join(f'"{name}"' for name in fieldnames)
+        placeholders = ', '.join('?' for _ in fieldnames)
+        connection.executemany(
+            f'INSERT INTO "{table}" ({quoted}) VALUES ({placeholders})',
+            [
+                tuple(None if _is_missing(row.get(name)) else row.get(name) for name in fieldnames)
+                for row in rows
+            ],
+        )
+
+    def append_rows(self, filename: str, fieldnames: List[str], rows: List[Dict]) -> None:
+        if not rows:
+            return
+        with closing(self._connect()) as connection, connection:
+            self._insert(connection, self._table(filename), fieldnames, rows)
+
+    def read(
+        self,
+        filename: str,
+        columns: Optional[Sequence[str]] = None,
+        query: Optional[MetricsQuery] = None,
+    ) -> Optional[pd.DataFrame]:
+        if not self.exists(filename):
+            return None
+        table = self._table(filename)
+        with closing(self._connect()) as connection:
+            names = self._columns(connection, table)
+            quoted = ', '.join(f'"{name}"' for name in names if columns is None or name in columns)
+            where, params = self._where(connection, table, query)
+            frame = pd.read_sql_query(
+                f'SELECT {quoted} FROM "{table}"{where} ORDER BY rowid',
+                connection,
+                params=params,
+            )
+        if DATE_COLUMN in frame.columns:
+            frame[DATE_COLUMN] = pd.to_datetime(frame[DATE_COLUMN], format='ISO8601')
+            frame = frame.sort_values(DATE_COLUMN)
+        return frame
+
+    def _where(
+        self,
+        connection: sqlite3.Connection,
+        table: str,
+        query: Optional[MetricsQuery],
+    ) -> Tuple[str, List]:
+        if query is None:
+            return '', []
+        clauses: List[str] = []
+        params: List = []
+        if query.since is not None:
+            window = '"date" >= ?'
+            params.append(query.since.strftime(DATE_FORMAT))
+            if query.baselines:
+                window += f' OR commit_hash IN ({", ".join("?" for _ in query.baselines)})'
+                params.extend(query.baselines)
+            clauses.append(f'({window})')
+        if query.patterns is not None:
+            # Resolve patterns against the distinct names (an index-only scan) so the
+            # row lookup is an IN list on the (test_name, date) index.
+            names = [row[0] for row in connection.execute(
+                f'SELECT DISTINCT test_name FROM "{table}" WHERE test_name IS NOT NULL'
+            )]
+            matched = query.matching_names(names)
+            clauses.append(f'test_name IN ({", ".join("?" for _ in matched)})')
+            params.extend(matched)
+        return (f' WHERE {" AND ".join(clauses)}' if clauses else ''), params
+
+    def read_rows(self, filename: str) -> Tuple[List[str], List[Dict]]:
+        if not self.exists(filename):
+            return [], []
+        table = self._table(filename)
+        with closing(self._connect()) as connection:
+            cursor = connection.execute(f'SELECT * FROM "{table}" ORDER BY rowid')
+            fieldnames = [description[0] for description in cursor.description]
+            rows = [
+                {name: '' if value is None else value for name, value in zip(fieldnames, row)}
+                for row in cursor
+            ]
+        return fieldnames, rows
+
+    def write_rows(self, filename: str, fieldnames: List[str], rows: List[Dict]) -> None:
+        table = self._table(filename)
+        with closing(self._connect()) as connection, connection:
+            connection.execute(f'DROP TABLE IF EXISTS "{table}"')
+            self._insert(connection, table, fieldnames, rows)
+
+    def remove_runs(self, filename: str, keys: Set[RunKey]) -> int:
+        if not keys or not self.exists(filename):
+            return 0
+        with closing(self._connect()) as connection, connection:
+            removed = 0
+            for commit_hash, date in keys:
+                removed += connection.execute(
+                    f'DELETE FROM "{self._table(filename)}" WHERE commit_hash = ? AND "date" = ?',
+                    (commit_hash, date),
+                ).rowcount
+        return removed
+
+
+class PartitionedMetricsStore(CsvMetricsStore):
+    """Monthly CSV partitions per metrics file plus a manifest of their date ranges."""
+
+    backend = 'partitioned'
+
+    @property
+    def root(self) -> Path:
+        return self.data_dir / PARTITIONS_DIR
+
+    def _partition_dir(self, filename: str) -> Path:
+        return self.root / Path(filename).stem
+
+    def load_manifest(self) -> Dict[str, Dict[str, Dict]]:
+        path = self.root / PARTITION_MANIFEST
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text(encoding='utf-8'))
+
+    def _save_manifest(self, manifest: Dict[str, Dict[str, Dict]]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / PARTITION_MANIFEST).write_text(
+            json.dumps(manifest, indent=2, sort_keys=True) + '\n', encoding='utf-8',
+        )
+
+    def _partition_csv(self, filename: str, month: str) -> Tuple[CsvMetricsStore, str]:
+        return CsvMetricsStore(self._partition_dir(filename)), f'{month}.csv'
+
+    @staticmethod
+    def _partition_stats(rows: List[Dict]) -> Dict:
+        dates = [str(row[DATE_COLUMN]) for row in rows]
+        return {
+            'min_date': min(dates),
+            'max_date': max(dates),
+            'rows': len(rows),
+            'commits': sorted({str(row.get('commit_hash', '')) for row in rows}),
+        }
+
+    def exists(self, filename: str) -> bool:
+        return bool(self.load_manifest().get(filename))
+
+    def partitions(self, filename: str, query: Optional[MetricsQuery] = None) -> List[str]:
+        """Months to open for a query: overlapping the window or holding a baseline."""
+        entries = self.load_manifest().get(filename, {})
+        if query is None or query.since is None:
+            return sorted(entries)
+        since = query.since.strftime(DATE_FORMAT)
+        baselines = set(query.baselines)
+        return sorted(
+            month for month, entry in entries.items()
+            if entry['max_date'] >= since or baselines & set(entry['commits'])
+        )
+
+    def append_rows(self, filename: str, fieldnames: List[str], rows: List[Dict]) -> None:
+        if not rows:
+            return
+        by_month: Dict[str, List[Dict]] = {}
+        for row in rows:
+            by_month.setdefault(str(row[DATE_COLUMN])[:7], []).append(row)
+        manifest = self.load_manifest()
+        entries = manifest.setdefault(filename, {})
+        for month, month_rows in by_month.items():
+            store, name = self._partition_csv(filename, month)
+            store.append_rows(name, fieldnames, month_rows)
+            stats = self._partition_stats(month_rows)
+            entry = entries.get(month)
+            if entry is not None:
+                stats = {
+                    'min_date': min(entry['min_date'], stats['min_date']),
+                    'max_date': max(entry['max_date'], stats['max_date']),
+                    'rows': entry['rows'] + stats['rows'],
+                    'commits': sorted(set(entry['commits']) | set(stats['commits'])),
+                }
+            entries[month] = {'path': f'{Path(filename).stem}/{name}', **stats}
+        self._save_manifest(manifest)
+
+    def read(
+        self,
+        filename: str,
+        columns: Optional[Sequence[str]] = None,
+        query: Optional[MetricsQuery] = None,
+    ) -> Optional[pd.DataFrame]:
+        if not self.exists(filename):
+            return None
+        frames = []
+        for month in self.partitions(filename, query):
+            store, name = self._partition_csv(filename, month)
+            frame = store.read(name, columns=columns, query=query)
+            if frame is not None:
+                frames.append(frame)
+        if not frames:
+            return None
+        frame = pd.concat(frames, ignore_index=True)
+        return frame.sort_values(DATE_COLUMN) if DATE_COLUMN in frame.columns else frame
+
+    def read_rows(self, filename: str) -> Tuple[List[str], List[Dict]]:
+        fieldnames: List[str] = []
+        rows: List[Dict] = []
+        for month in self.partitions(filename):
+            store, name = self._partition_csv(filename, month)
+            month_fields, month_rows = store.read_rows(name)
+            fieldnames = fieldnames or month_fields
+            rows.extend(month_rows)
+        return fieldnames, rows
+
+    def write_rows(self, filename: str, fieldnames: List[str], rows: List[Dict]) -> None:
+        partition_dir = self._partition_dir(filename)
+        if partition_dir.exists():
+            for stale in partition_dir.glob('*.csv'):
+                stale.unlink()
+        manifest = self.load_manifest()
+        manifest[filename] = {}
+        self._save_manifest(manifest)
+        self.append_rows(filename, fieldnames, rows)
+
+    def remove_runs(self, filename: str, keys: Set[RunKey]) -> int:
+        if not keys or not self.exists(filename):
+            return 0
+        manifest = self.load_manifest()
+        entries = manifest[filename]
+        removed = 0
+        for month in sorted({date[:7] for _, date in keys} & set(entries)):
+            store, name = self._partition_csv(filename, month)
+            month_removed = store.remove_runs(name, keys)
+            if not month_removed:
+                continue
+            removed += month_removed
+            _, month_rows = store.read_rows(name)
+            if month_rows:
+                entries[month] = {**entries[month], **self._partition_stats(month_rows)}
+            else:
+                (self._partition_dir(filename) / name).unlink()
+                del entries[month]
+        self._save_manifest(manifest)
+        return removed
+
+    def compact(self, filename: str) -> Tuple[int, int]:
+        """Rewrite partitions sorted by date with exact duplicate rows dropped.
+
+        Returns (rows before, rows after).
+        """
+        fieldnames, rows = self.read_rows(filename)
+        seen: Set[tuple] = set()
+        compacted = []
+        for row in rows:
+            key = tuple(row.get(name) for name in fieldnames)
+            if key not in seen:
+                seen.add(key)
+                compacted.append(row)
+        compacted.sort(key=lambda row: str(row[DATE_COLUMN]))
+        self.write_rows(filename, fieldnames, compacted)
+        return len(rows), len(compacted)
+
+
+def _sql_type(name: str) -> str:
+    if name in CATEGORICAL_COLUMNS or name in (DATE_COLUMN, RUNS_COLUMN):
+        return 'TEXT'
+    if name in INTEGER_COLUMNS:
+        return 'INTEGER'
+    return 'REAL'
+
+
+def _encode_column(name: str, values: List) -> Tuple[str, Dict[str, np.ndarray]]:
+    if name == DATE_COLUMN:
+        stamps = pd.to_datetime(pd.Series(values, dtype=object), format='ISO8601')
+        return 'date', {f'{name}.ns': stamps.to_numpy(dtype='datetime64[ns]').view('int64')}
+    if name == RUNS_COLUMN:
+        offsets = [0]
+        flat: List[float] = []
+        for value in values:
+            if not _is_missing(value):
+                flat.extend(float(item) for item in str(value).split(',') if item.strip())
+            offsets.append(len(flat))
+        return 'runs', {
+            f'{name}.values': np.array(flat, dtype=np.float64),
+            f'{name}.offsets': np.array(offsets, dtype=np.int64),
+        }
+    if name not in CATEGORICAL_COLUMNS:
+        numeric = pd.to_numeric(
+            pd.Series([None if _is_missing(value) else value for value in values], dtype=object),
+            errors='coerce',
+        )
+        provided = sum(not _is_missing(value) for value in values)
+        if numeric.notna().sum() == provided:
+            if name in INTEGER_COLUMNS and numeric.notna().all():
+                return 'int', {f'{name}.data': numeric.to_numpy(dtype=np.int64)}
+            return 'float', {f'{name}.data': numeric.to_numpy(dtype=np.float64)}
+    categorical = pd.Categorical([None if _is_missing(value) else str(value) for value in values])
+    return 'category', {
+        f'{name}.codes': categorical.codes.astype(np.int32),
+        f'{name}.categories': np.array(categorical.categories, dtype=str),
+    }
+
+
+def _write_archive(path: Path, fieldnames: List[str], rows: List[Dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    arrays: Dict[str, np.ndarray] = {}
+    kinds = []
+    for name in fieldnames:
+        kind, encoded = _encode_column(name, [row.get(name) for row in rows])
+        kinds.append(kind)
+        arrays.update(encoded)
+    tmp_path = path.with_suffix('.tmp.npz')
+    np.savez_compressed(
+        tmp_path,
+        __columns__=np.array(fieldnames, dtype=str),
+        __kinds__=np.array(kinds, dtype=str),
+        **arrays,
+    )
+    tmp_path.replace(path)
+
+
+def _read_archive(path: Path, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+    with np.load(path, allow_pickle=False) as archive:
+        names = [str(name) for name in archive['__columns__']]
+        kinds = dict(zip(names, (str(kind) for kind in archive['__kinds__'])))
+        wanted = [name for name in names if columns is None or name in columns]
+        return pd.DataFrame({
+            name: _decode_column(archive, name, kinds[name]) for name in wanted
+        })
+
+
+def _decode_column(archive, name: str, kind: str):
+    if kind == 'date':
+        return pd.to_datetime(archive[f'{name}.ns'].view('datetime64[ns]'))
+    if kind == 'category':
+        return pd.Categorical.from_codes(archive[f'{name}.codes'], archive[f'{name}.categories'])
+    if kind == 'runs':
+        values = archive[f'{name}.values']
+        offsets = archive[f'{name}.offsets']
+        return pd.Series([
+            ','.join(map(str, values[start:end].tolist())) if end > start else np.nan
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ], dtype=object)
+    return archive[f'{name}.data']
+
+
+def _csv_values(column: pd.Series, name: str) -> Iterable:
+    if name == DATE_COLUMN:
+        return column.dt.strftime(DATE_FORMAT).tolist()
+    return ['' if _is_missing(value) else value for value in column.astype(object).tolist()]
+
+
+def open_metrics_store(backend: str, data_dir: Path) -> CsvMetricsStore:
+    if backend == 'columnar':
+        return ColumnarMetricsStore(data_dir)
+    if backend == 'sqlite':
+        return SqliteMetricsStore(data_dir)
+    if backend == 'partitioned':
+        return PartitionedMetricsStore(data_dir)
+    if backend == 'csv':
+        return CsvMetricsStore(data_dir)
+    raise ValueError(f'Unknown storage backend {backend!r} (expected one of {STORAGE_BACKENDS})')
+
+
+def copy_metrics(source: CsvMetricsStore, target: CsvMetricsStore, filenames: Iterable[str]) -> int:
+    """Rewrite each metrics file from one backend into another; returns files copied."""
+    copied = 0
+    for filename in filenames:
+        if not source.exists(filename):
+            continue
+        fieldnames, rows = source.read_rows(filename)
+        target.write_rows(filename, fieldnames, rows)
+        copied += 1
+    return copied
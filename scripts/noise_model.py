@@ -0,0 +1,101 @@
+"""Per-chart run-to-run noise and the regression threshold sized from it.
+
+Noise is the median, over a chart's recent trend builds, of each build's
+robust coefficient of variation (1.4826 * MAD / median of its ``all_runs``).
+The threshold is that noise times ``noise_multiplier``, clamped to
+``[regression_pct_min, regression_pct_max]``; a chart's own ``regression_pct``
+in tests_config.toml overrides it, and ``adaptive_thresholds = false`` falls
+back to the global ``regression_pct`` everywhere.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from benchmark_config import ChartDefaults, ChartTest
+from run_significance import MIN_RUNS, runs_by_build
+
+MAD_TO_SIGMA = 1.4826
+# Fewer builds than this with enough runs and the estimate is not trusted.
+MIN_NOISE_BUILDS = 3
+
+
+@dataclass(frozen=True)
+class NoiseModel:
+    regression_pct: float
+    source: str
+    noise_cv: Optional[float] = None
+    builds: int = 0
+
+    def describe(self) -> str:
+        if self.source == 'adaptive':
+            return (
+                f'±{self.regression_pct:.0%} from run noise '
+                f'(CV {self.noise_cv:.1%} over {self.builds} builds)'
+            )
+        if self.source == 'override':
+            return f'±{self.regression_pct:.0%} set for this chart'
+        return f'±{self.regression_pct:.0%}'
+
+
+def robust_cv(runs: np.ndarray) -> Optional[float]:
+    median = float(np.median(runs))
+    if median <= 0:
+        return None
+    return MAD_TO_SIGMA * float(np.median(np.abs(runs - median))) / median
+
+
+def estimate_noise_cv(
+    runs: Dict[str, np.ndarray],
+    commits: Iterable[str],
+) -> tuple[Optional[float], int]:
+    """Median robust CV over ``commits`` that have enough runs, and how many did."""
+    cvs = [
+        cv for cv in (
+            robust_cv(runs[commit_hash]) for commit_hash in commits
+            if len(runs.get(commit_hash, ())) >= MIN_RUNS
+        )
+        if cv is not None
+    ]
+    if not cvs:
+        return None, 0
+    return float(np.median(cvs)), len(cvs)
+
+
+def chart_noise_model(
+    chart: ChartTest,
+    defaults: ChartDefaults,
+    rows: Optional[pd.DataFrame],
+    series: Optional[pd.DataFrame],
+) -> NoiseModel:
+    """Regression threshold for one chart from its windowed rows and build series."""
+    if chart.regression_pct is not None:
+        return NoiseModel(regression_pct=chart.regression_pct, source='override')
+    fallback = NoiseModel(regression_pct=defaults.regression_pct, source='global')
+    if (
+        not defaults.adaptive_thresholds
+        or chart.metrics_kind != 'performance'
+        or rows is None
+        or series is None
+    ):
+        return fallback
+    commits = series['commit_hash'].astype(str)
+    trend = commits[~commits.isin(chart.baselines)].tail(defaults.noise_window)
+    noise_cv, builds = estimate_noise_cv(runs_by_build(rows), trend)
+    if noise_cv is None or builds < MIN_NOISE_BUILDS:
+        return fallback
+    regression_pct = float(np.clip(
+        defaults.noise_multiplier * noise_cv,
+        defaults.regression_pct_min,
+        defaults.regression_pct_max,
+    ))
+    return NoiseModel(
+        regression_pct=round(regression_pct, 2),
+        source='adaptive',
+        noise_cv=noise_cv,
+        builds=builds,
+    )
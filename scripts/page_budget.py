@@ -0,0 +1,99 @@
+"""Page-weight and timing budget for the generated dashboard."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from benchmark_config import SiteBudget
+
+_NOSCRIPT = re.compile(r'<noscript>.*?</noscript>', re.DOTALL | re.IGNORECASE)
+_SRC = re.compile(r'<(?:script|img|iframe)\b[^>]*?\ssrc="([^"]+)"', re.IGNORECASE)
+_CHART_BUNDLE = re.compile(r'\sdata-chart-bundle="([^"]+)"')
+# Iframe-mode charts: chart_activation.js creates the iframe once the chart has
+# been on screen for about a second, so a full scroll loads every one of them.
+_CHART_SRC = re.compile(r'\sdata-chart-src="([^"]+)"')
+# chart_renderer.js pulls Plotly in on demand, so a bundle page pays for it too.
+_BUNDLE_RENDERER_DEPS = ('charts/plotly.min.js',)
+
+
+@dataclass(frozen=True)
+class PageWeight:
+    page: str
+    bytes: int
+    requests: int
+
+
+def _local_resources(document: Path) -> list[Path]:
+    html = _NOSCRIPT.sub('', document.read_text(encoding='utf-8'))
+    references = _SRC.findall(html) + _CHART_SRC.findall(html)
+    bundles = _CHART_BUNDLE.findall(html)
+    references.extend(bundles)
+    if bundles:
+        references.extend(_BUNDLE_RENDERER_DEPS)
+    return [
+        document.parent / reference
+        for reference in references
+        if '://' not in reference and not reference.startswith(('data:', '//'))
+    ]
+
+
+def measure_page_weight(output_dir: Path, page_filename: str) -> PageWeight:
+    """Bytes and requests to load a page and scroll through it with a cold cache.
+
+    Counts the page, every script, image and iframe it references (iframes
+    recursively), the interactive chart iframes behind iframe-mode previews, and
+    for bundle pages the JSON bundle plus Plotly. Each file counts once, as the
+    browser caches repeats; <noscript> fallbacks are skipped.
+    """
+    page = output_dir / page_filename
+    seen: set[Path] = set()
+    pending = [page]
+    total = 0
+    while pending:
+        path = pending.pop().resolve()
+        if path in seen or not path.exists():
+            continue
+        seen.add(path)
+        total += path.stat().st_size
+        if path.suffix == '.html':
+            pending.extend(_local_resources(path))
+    return PageWeight(page=page_filename, bytes=total, requests=len(seen))
+
+
+def check_site_budget(
+    output_dir: Path,
+    budget: SiteBudget,
+    *,
+    elapsed_s: Optional[float] = None,
+    page_filenames: Optional[Iterable[str]] = None,
+) -> list[str]:
+    """Print each page's weight and return one message per exceeded budget."""
+    names = (
+        sorted(page_filenames) if page_filenames is not None
+        else sorted(path.name for path in output_dir.glob('*.html'))
+    )
+    problems = []
+    print('\nPage weight (full scroll, cold cache):')
+    for name in names:
+        weight = measure_page_weight(output_dir, name)
+        size_kb = weight.bytes / 1024
+        print(f'  {name}: {size_kb:,.0f} KB in {weight.requests} requests')
+        if size_kb > budget.max_page_kb:
+            problems.append(
+                f'{name} weighs {size_kb:,.0f} KB, over the {budget.max_page_kb:,.0f} KB budget'
+            )
+        if weight.requests > budget.max_page_requests:
+            problems.append(
+                f'{name} makes {weight.requests} requests, '
+                f'over the {budget.max_page_requests} request budget'
+            )
+    if elapsed_s is not None:
+        print(f'graphs took {elapsed_s:.1f}s (budget {budget.max_graphs_seconds:.0f}s)')
+        if elapsed_s > budget.max_graphs_seconds:
+            problems.append(
+                f'graphs took {elapsed_s:.1f}s, over the {budget.max_graphs_seconds:.0f}s budget'
+            )
+    return problems
@@ -0,0 +1,63 @@
+"""Multi-pattern substring search (Aho-Corasick) for routing test names to charts."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable
+
+
+class SubstringMatcher:
+    """Report every pattern that occurs in a text, in a single pass over the text.
+
+    Same semantics as ``any(pattern in text ...)`` per pattern, but the work is
+    O(len(text) + matches) instead of O(len(text) × patterns).
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[frozenset[str]] = [frozenset()]
+        for pattern in patterns:
+            self._add(pattern)
+        self._link()
+
+    def _add(self, pattern: str) -> None:
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(frozenset())
+            node = next_node
+        self._output[node] = self._output[node] | {pattern}
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] | self._output[self._fail[child]]
+                queue.append(child)
+
+    def find(self, text: str) -> set[str]:
+        """Return the set of patterns that are substrings of ``text``."""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found = set(output[0])
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if output[node]:
+                found.update(output[node])
+        return found
@@ -5,12 +5,22 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from benchmark_config import BenchmarkConfig, ChartDefaults, ChartTest, effective_reference_build
-from chart_builder import series_for_chart, variant_name
+from bisect_hint import BisectHint, bisect_hint, format_metric_value
+from change_point import latest_level_shift
+from chart_builder import ChartSeriesCache, chart_rows_for, series_for_chart, variant_name
+from noise_model import NoiseModel, chart_noise_model
+from run_significance import RunComparison, compare_runs, runs_by_build
+
+
+RESOURCE_KINDS = ('cpu', 'ram')
+# A slope over fewer builds than this is mostly noise.
+RESOURCE_SLOPE_MIN_BUILDS = 5
 
 
 @dataclass(frozen=True)
@@ -22,6 +32,7 @@ class Violation:
     commit_hash: str
     date: str
     detail: str
+    unit: str = 's'
 
 
 @dataclass(frozen=True)
@@ -35,83 +46,365 @@ class ScenarioSummary:
     detail: str
 
 
-def _check_regression(
-    series: pd.DataFrame,
-    chart: ChartTest,
-    defaults: ChartDefaults,
-) -> Optional[Violation]:
-    values = series[chart.value_column].tolist()
-    commits = series['commit_hash'].astype(str).tolist()
-    dates = series['date'].dt.strftime('%Y-%m-%d %H:%M').tolist()
-    test_name = series['test_name'].iloc[0]
-    needed = defaults.regression_consecutive
-    if len(values) < needed + 1:
-        return None
-    threshold = 1.0 + defaults.regression_pct
-    end = len(values) - 1
-    ok = True
-    for offset in range(needed):
-        idx = end - needed + 1 + offset
-        if values[idx] < values[idx - 1] * threshold:
-            ok = False
-            break
-    if not ok:
-        return None
-    return Violation(
-        rule='2.1 Regression',
-        test_id=chart.test_id,
-        variant=variant_name(test_name),
-        value=values[end],
-        commit_hash=commits[end],
-        date=dates[end],
-        detail=(
-            f'{needed} consecutive builds each >={defaults.regression_pct:.0%} above previous '
-            f'({values[end - needed]:.3f}s -> {values[end]:.3f}s)'
-        ),
-    )
+def _trend_batch(trends: List[tuple[ChartTest, pd.DataFrame]]) -> pd.DataFrame:
+    """Stack every chart's trend series into one frame; ``group`` is the index into ``trends``."""
+    frames = [series for _, series in trends]
 
+    def stacked(column: str) -> np.ndarray:
+        return np.concatenate([frame[column].to_numpy() for frame in frames])
 
-def _check_slow_latest(series: pd.DataFrame, chart: ChartTest, defaults: ChartDefaults) -> Optional[Violation]:
-    latest = series.iloc[-1]
-    value = float(latest[chart.value_column])
-    if value <= defaults.slow_threshold_s:
-        return None
-    test_name = latest['test_name']
-    return Violation(
-        rule='2.2 Slow build',
-        test_id=chart.test_id,
-        variant=variant_name(test_name),
-        value=value,
-        commit_hash=str(latest['commit_hash']),
-        date=latest['date'].strftime('%Y-%m-%d %H:%M'),
-        detail=f'Latest value {value:.3f}s exceeds {defaults.slow_threshold_s}s slow threshold',
-    )
+    return pd.DataFrame({
+        'group': np.repeat(np.arange(len(frames)), [len(frame) for frame in frames]),
+        'value': np.concatenate([
+            frame[chart.value_column].to_numpy(dtype=float) for chart, frame in trends
+        ]),
+        'commit_hash': stacked('commit_hash'),
+        'date': pd.to_datetime(stacked('date')),
+        'test_name': stacked('test_name'),
+    })
 
 
-def _check_backlog(series: pd.DataFrame, chart: ChartTest, defaults: ChartDefaults) -> Optional[Violation]:
+def evaluate_performance_rules(
+    trends: List[tuple[ChartTest, pd.DataFrame]],
+    defaults: ChartDefaults,
+    regression_pcts: Optional[Sequence[float]] = None,
+) -> List[Violation]:
+    """Apply rules 2.1-2.3 to every chart's trend series in one grouped pass.
+
+    ``regression_pcts`` holds each chart's 2.1 threshold (from its noise model);
+    without it every chart uses ``defaults.regression_pct``. Violations come out
+    per chart in ``trends`` order: regression first, then backlog, or
+    slow-latest when the slowdown is not chronic.
+    """
+    if not trends:
+        return []
+    if regression_pcts is None:
+        regression_pcts = [defaults.regression_pct] * len(trends)
+    frame = _trend_batch(trends)
+    groups = frame.groupby('group', sort=False)
+    values = frame['value']
+    from_end = groups.cumcount(ascending=False)
+    sizes = groups['value'].transform('size')
+    is_last = from_end == 0
+
+    # 2.1: each of the last `needed` builds is >= regression_pct above its predecessor.
+    needed = defaults.regression_consecutive
+    threshold = 1.0 + np.asarray(regression_pcts, dtype=float)[frame['group'].to_numpy()]
+    previous = groups['value'].shift(1)
+    broken = (from_end < needed) & (values < previous * threshold)
+    regressed = (sizes >= needed + 1) & ~frame['group'].isin(frame.loc[broken, 'group'])
+    start_values = groups['value'].shift(needed)
+
+    # 2.3: at least backlog_slow_min_count slow builds among the last backlog_slow_of_last_n.
     n = defaults.backlog_slow_of_last_n
     min_slow = defaults.backlog_slow_min_count
-    tail = series.tail(n)
-    if len(tail) < min_slow:
-        return None
-    slow_count = int((tail[chart.value_column] > defaults.slow_threshold_s).sum())
-    if slow_count < min_slow:
-        return None
-    latest = series.iloc[-1]
-    test_name = latest['test_name']
-    return Violation(
-        rule='2.3 Backlog candidate',
-        test_id=chart.test_id,
-        variant=variant_name(test_name),
-        value=float(latest[chart.value_column]),
-        commit_hash=str(latest['commit_hash']),
-        date=latest['date'].strftime('%Y-%m-%d %H:%M'),
-        detail=(
-            f'Slow (>{defaults.slow_threshold_s}s) in {slow_count} of last {len(tail)} builds -- '
-            'consider a backlog ticket'
-        ),
+    slow = values > defaults.slow_threshold_s
+    slow_counts = (slow & (from_end < n)).groupby(frame['group'], sort=False).transform('sum')
+    tail_lengths = sizes.clip(upper=max(n, 0))
+    backlogged = (tail_lengths >= min_slow) & (slow_counts >= min_slow)
+
+    # 2.2: latest build above the slow threshold (not <=, so NaN still flags as before).
+    slow_latest = ~(values <= defaults.slow_threshold_s)
+
+    first_names = frame.loc[groups.cumcount() == 0, 'test_name'].tolist()
+    last = frame.loc[is_last].assign(
+        regressed=regressed[is_last],
+        start_value=start_values[is_last],
+        slow_count=slow_counts[is_last],
+        tail_length=tail_lengths[is_last],
+        backlogged=backlogged[is_last],
+        slow_latest=slow_latest[is_last],
+        date_text=frame.loc[is_last, 'date'].dt.strftime('%Y-%m-%d %H:%M'),
     )
 
+    violations: List[Violation] = []
+    for row in last.itertuples(index=False):
+        chart = trends[row.group][0]
+        if row.regressed:
+            violations.append(Violation(
+                rule='2.1 Regression',
+                test_id=chart.test_id,
+                variant=variant_name(first_names[row.group]),
+                value=row.value,
+                commit_hash=str(row.commit_hash),
+                date=row.date_text,
+                detail=(
+                    f'{needed} consecutive builds each '
+                    f'>={regression_pcts[row.group]:.0%} above previous '
+                    f'({row.start_value:.3f}s -> {row.value:.3f}s)'
+                ),
+            ))
+        # Escalate: chronic slowdowns go to Backlog only; one-off latest
+        # slowdowns stay under Slow builds.
+        if row.backlogged:
+            violations.append(Violation(
+                rule='2.3 Backlog candidate',
+                test_id=chart.test_id,
+                variant=variant_name(row.test_name),
+                value=row.value,
+                commit_hash=str(row.commit_hash),
+                date=row.date_text,
+                detail=(
+                    f'Slow (>{defaults.slow_threshold_s}s) in {int(row.slow_count)} of last '
+                    f'{int(row.tail_length)} builds -- consider a backlog ticket'
+                ),
+            ))
+        elif row.slow_latest:
+            violations.append(Violation(
+                rule='2.2 Slow build',
+                test_id=chart.test_id,
+                variant=variant_name(row.test_name),
+                value=row.value,
+                commit_hash=str(row.commit_hash),
+                date=row.date_text,
+                detail=(
+                    f'Latest value {row.value:.3f}s exceeds '
+                    f'{defaults.slow_threshold_s}s slow threshold'
+                ),
+            ))
+    return violations
+
+
+def evaluate_level_shifts(
+    trends: List[tuple[ChartTest, pd.DataFrame]],
+    defaults: ChartDefaults,
+) -> List[Violation]:
+    """Rule 2.4: the latest change point in each trend is a sustained slowdown.
+
+    Catches a one-off step that stays, which 2.1 misses unless every build
+    along the way is slower than the one before it.
+    """
+    violations: List[Violation] = []
+    for chart, series in trends:
+        values = series[chart.value_column].to_numpy(dtype=float)
+        shift = latest_level_shift(values, min_size=defaults.change_point_min_builds)
+        if shift is None or shift.before <= 0:
+            continue
+        relative = shift.magnitude / shift.before
+        if relative < defaults.change_point_min_pct:
+            continue
+        if shift.confidence < defaults.change_point_confidence:
+            continue
+        first = series.iloc[shift.index]
+        builds_since = len(values) - shift.index
+        violations.append(Violation(
+            rule='2.4 Level shift',
+            test_id=chart.test_id,
+            variant=variant_name(first['test_name']),
+            value=shift.after,
+            commit_hash=str(first['commit_hash']),
+            date=first['date'].strftime('%Y-%m-%d %H:%M'),
+            detail=(
+                f'Level shift {shift.before:.3f}s -> {shift.after:.3f}s '
+                f'({shift.magnitude:+.3f}s, {relative:+.0%}) from this build, '
+                f'held for {builds_since} builds; confidence {shift.confidence:.0%}'
+            ),
+        ))
+    return violations
+
+
+def _baseline_runs(
+    chart: ChartTest,
+    series: pd.DataFrame,
+    runs: dict[str, np.ndarray],
+    defaults: ChartDefaults,
+) -> tuple[np.ndarray, str]:
+    """Runs the latest build is tested against, and how to describe them."""
+    if defaults.significance_compare_to == 'reference':
+        reference_build = effective_reference_build(chart, defaults)
+        if reference_build is None:
+            return np.empty(0), ''
+        return runs.get(reference_build, np.empty(0)), f'reference {reference_build[:10]}'
+    window = series['commit_hash'].astype(str).iloc[:-1].tail(defaults.significance_window)
+    samples = [runs[commit_hash] for commit_hash in window if commit_hash in runs]
+    if not samples:
+        return np.empty(0), ''
+    return np.concatenate(samples), f'previous {len(samples)} builds'
+
+
+def _latest_run_comparison(
+    chart: ChartTest,
+    series: pd.DataFrame,
+    rows: Optional[pd.DataFrame],
+    defaults: ChartDefaults,
+) -> tuple[Optional[RunComparison], str]:
+    """Latest build's runs against its baseline runs; None without enough runs."""
+    runs = runs_by_build(rows)
+    latest_runs = runs.get(str(series['commit_hash'].iloc[-1]), np.empty(0))
+    baseline, baseline_label = _baseline_runs(chart, series, runs, defaults)
+    return compare_runs(latest_runs, baseline), baseline_label
+
+
+def drop_insignificant_regressions(
+    violations: List[Violation],
+    trends: List[tuple[ChartTest, pd.DataFrame]],
+    chart_rows: dict[str, pd.DataFrame],
+    defaults: ChartDefaults,
+) -> List[Violation]:
+    """Keep a 2.1 regression only if the latest build's runs back it up.
+
+    Rule 2.1 works on per-build averages, so one noisy run can complete the
+    consecutive-slowdown pattern. Where the chart has enough ``all_runs``
+    samples, the regression stands only if the latest runs are slower than
+    the baseline runs at ``significance_alpha``; without run data it stays.
+    """
+    series_by_test = {chart.test_id: (chart, series) for chart, series in trends}
+    kept: List[Violation] = []
+    for item in violations:
+        if item.rule == '2.1 Regression' and item.test_id in series_by_test:
+            chart, series = series_by_test[item.test_id]
+            comparison, _label = _latest_run_comparison(
+                chart, series, chart_rows.get(chart.test_id), defaults,
+            )
+            if comparison is not None and comparison.p_value >= defaults.significance_alpha:
+                continue
+        kept.append(item)
+    return kept
+
+
+def evaluate_run_significance(
+    trends: List[tuple[ChartTest, pd.DataFrame]],
+    chart_rows: dict[str, pd.DataFrame],
+    defaults: ChartDefaults,
+) -> List[Violation]:
+    """Rule 2.5: the latest build's individual runs are significantly slower.
+
+    Compares ``all_runs`` samples rather than per-build averages, so one slow
+    run that drags an average up is not enough to flag a build.
+    """
+    violations: List[Violation] = []
+    for chart, series in trends:
+        latest = series.iloc[-1]
+        comparison, baseline_label = _latest_run_comparison(
+            chart, series, chart_rows.get(chart.test_id), defaults,
+        )
+        if comparison is None or comparison.baseline_median <= 0:
+            continue
+        relative = comparison.shift / comparison.baseline_median
+        if (
+            comparison.p_value >= defaults.significance_alpha
+            or comparison.shift_low <= 0
+            or relative < defaults.significance_min_pct
+        ):
+            continue
+        violations.append(Violation(
+            rule='2.5 Significant regression',
+            test_id=chart.test_id,
+            variant=variant_name(latest['test_name']),
+            value=comparison.latest_median,
+            commit_hash=str(latest['commit_hash']),
+            date=latest['date'].strftime('%Y-%m-%d %H:%M'),
+            detail=(
+                f'Median of {comparison.latest_runs} runs {comparison.latest_median:.3f}s vs '
+                f'{comparison.baseline_median:.3f}s over {comparison.baseline_runs} runs of '
+                f'{baseline_label} ({relative:+.0%}, 95% CI '
+                f'{comparison.shift_low:+.3f}s to {comparison.shift_high:+.3f}s); '
+                f'Mann-Whitney p={comparison.p_value:.4f}'
+            ),
+        ))
+    return violations
+
+
+def format_violation_value(item: Violation) -> str:
+    return format_metric_value(item.value, item.unit)
+
+
+def _trend_slope(values: np.ndarray) -> float:
+    """Least-squares slope per build."""
+    positions = np.arange(len(values), dtype=float)
+    centered = positions - positions.mean()
+    return float(centered @ (values - values.mean()) / (centered @ centered))
+
+
+def _reference_value(
+    chart: ChartTest,
+    full_series: pd.DataFrame,
+    defaults: ChartDefaults,
+) -> tuple[Optional[str], Optional[float]]:
+    reference_build = effective_reference_build(chart, defaults)
+    if reference_build is None:
+        return None, None
+    rows = full_series[full_series['commit_hash'].astype(str) == reference_build]
+    if rows.empty:
+        return reference_build, None
+    return reference_build, float(rows[chart.value_column].iloc[0])
+
+
+def evaluate_resource_rules(
+    trends: List[tuple[ChartTest, pd.DataFrame]],
+    full_series: dict[str, pd.DataFrame],
+    chart_rows: dict[str, pd.DataFrame],
+    defaults: ChartDefaults,
+) -> List[Violation]:
+    """Rules 3.1-3.5 for CPU and RAM charts.
+
+    RAM: growth over the reference build, latest peak (max_ram_mb) above the
+    ceiling, and a rising slope over the last resource_slope_window builds.
+    CPU: a spike over the reference build and the same kind of slope.
+    """
+    violations: List[Violation] = []
+    for chart, series in trends:
+        is_ram = chart.metrics_kind == 'ram'
+        unit = 'MB' if is_ram else '%'
+        values = series[chart.value_column].to_numpy(dtype=float)
+        latest = series.iloc[-1]
+        value = float(values[-1])
+        commit_hash = str(latest['commit_hash'])
+
+        def flag(rule: str, detail: str, flagged_value: float = value) -> None:
+            violations.append(Violation(
+                rule=rule,
+                test_id=chart.test_id,
+                variant=variant_name(latest['test_name']),
+                value=flagged_value,
+                commit_hash=commit_hash,
+                date=latest['date'].strftime('%Y-%m-%d %H:%M'),
+                detail=detail,
+                unit=unit,
+            ))
+
+        reference_build, reference_value = _reference_value(
+            chart, full_series[chart.test_id], defaults,
+        )
+        if reference_value is not None:
+            growth = value - reference_value
+            if is_ram and growth >= defaults.ram_growth_mb:
+                flag('3.1 RAM growth', (
+                    f'{value:.0f} MB vs {reference_value:.0f} MB on reference '
+                    f'{reference_build[:10]} ({growth:+.0f} MB, '
+                    f'limit +{defaults.ram_growth_mb:.0f} MB)'
+                ))
+            if not is_ram and growth >= defaults.cpu_growth_pct:
+                flag('3.4 CPU spike', (
+                    f'{value:.1f}% vs {reference_value:.1f}% on reference '
+                    f'{reference_build[:10]} ({growth:+.1f} pts, '
+                    f'limit +{defaults.cpu_growth_pct:.0f} pts)'
+                ))
+
+        if is_ram:
+            rows = chart_rows.get(chart.test_id)
+            peak = value
+            if rows is not None and 'max_ram_mb' in rows:
+                latest_rows = rows[rows['commit_hash'].astype(str) == commit_hash]
+                peak = max(peak, float(latest_rows['max_ram_mb'].max()))
+            if peak > defaults.ram_ceiling_mb:
+                flag('3.2 Peak RAM', (
+                    f'Peak {peak:.0f} MB on the latest build exceeds the '
+                    f'{defaults.ram_ceiling_mb:.0f} MB ceiling'
+                ), peak)
+
+        window = values[-defaults.resource_slope_window:]
+        if len(window) >= RESOURCE_SLOPE_MIN_BUILDS and np.isfinite(window).all():
+            slope = _trend_slope(window)
+            limit = defaults.ram_slope_mb_per_build if is_ram else defaults.cpu_slope_pct_per_build
+            if slope >= limit:
+                per_unit = 'MB' if is_ram else 'pts'
+                flag('3.3 RAM trend' if is_ram else '3.5 CPU trend', (
+                    f'Rising {slope:+.1f} {per_unit} per build over the last '
+                    f'{len(window)} builds (limit {limit:g} {per_unit} per build)'
+                ))
+    return violations
+
 
 def _trend_only(series: pd.DataFrame, chart: ChartTest) -> pd.DataFrame:
     if not chart.baselines:
@@ -120,43 +413,125 @@ def _trend_only(series: pd.DataFrame, chart: ChartTest) -> pd.DataFrame:
     return filtered.reset_index(drop=True)
 
 
-def collect_violations(metrics: pd.DataFrame, config: BenchmarkConfig) -> List[Violation]:
-    violations: List[Violation] = []
-    defaults = config.defaults
+def collect_violations(
+    metrics: pd.DataFrame,
+    config: BenchmarkConfig,
+    *,
+    series_cache: Optional[ChartSeriesCache] = None,
+    resource_metrics: Optional[dict[str, Optional[pd.DataFrame]]] = None,
+) -> List[Violation]:
+    """Flags for every chart: rules 2.x on load times, 3.x on CPU and RAM.
+
+    CPU and RAM series come from ``series_cache``, or without one from
+    ``resource_metrics`` (metrics kind -> frame); with neither, rules 3.x are
+    not evaluated and a warning says so.
+    """
+    if series_cache is None and resource_metrics is None and any(
+        chart.metrics_kind in RESOURCE_KINDS for chart in config.charts
+    ):
+        print('Warning: No CPU/RAM metrics passed; rules 3.1-3.5 not evaluated')
     performance_charts = [c for c in config.charts if c.metrics_kind == 'performance']
-
+    trends: List[tuple[ChartTest, pd.DataFrame]] = []
+    chart_rows: dict[str, pd.DataFrame] = {}
+    noise_models: List[NoiseModel] = []
     for chart in performance_charts:
-        result = series_for_chart(metrics, chart)
+        result = (
+            series_cache.series(chart) if series_cache is not None
+            else series_for_chart(metrics, chart)
+        )
         if result is None:
             continue
-        series, _n_baselines = result
-        series = _trend_only(series, chart)
+        full_series, _n_baselines = result
+        series = _trend_only(full_series, chart)
         if series.empty:
             continue
-        regression = _check_regression(series, chart, defaults)
-        if regression:
-            violations.append(regression)
-        # Escalate: chronic slowdowns go to Backlog only; one-off latest
-        # slowdowns stay under Slow builds.
-        backlog = _check_backlog(series, chart, defaults)
-        if backlog:
-            violations.append(backlog)
+        trends.append((chart, series))
+        if series_cache is not None:
+            chart_rows[chart.test_id] = series_cache.chart_rows(chart)
+            noise_models.append(series_cache.noise_model(chart, config.defaults))
         else:
-            slow = _check_slow_latest(series, chart, defaults)
-            if slow:
-                violations.append(slow)
-    return violations
+            chart_rows[chart.test_id] = chart_rows_for(metrics, chart)
+            noise_models.append(chart_noise_model(
+                chart, config.defaults, chart_rows[chart.test_id], full_series,
+            ))
+    regression_pcts = [noise.regression_pct for noise in noise_models]
+
+    resource_trends: List[tuple[ChartTest, pd.DataFrame]] = []
+    resource_series: dict[str, pd.DataFrame] = {}
+    for chart in config.charts:
+        if chart.metrics_kind not in RESOURCE_KINDS:
+            continue
+        if series_cache is not None:
+            result = series_cache.series(chart)
+            rows = series_cache.chart_rows(chart)
+        else:
+            frame = (resource_metrics or {}).get(chart.metrics_kind)
+            if frame is None or frame.empty:
+                continue
+            result = series_for_chart(frame, chart)
+            rows = chart_rows_for(frame, chart)
+        if result is None:
+            continue
+        full_series, _n_baselines = result
+        series = _trend_only(full_series, chart)
+        if series.empty:
+            continue
+        resource_trends.append((chart, series))
+        resource_series[chart.test_id] = full_series
+        chart_rows[chart.test_id] = rows
+
+    performance = drop_insignificant_regressions(
+        evaluate_performance_rules(trends, config.defaults, regression_pcts),
+        trends, chart_rows, config.defaults,
+    )
+    return (
+        performance
+        + evaluate_level_shifts(trends, config.defaults)
+        + evaluate_run_significance(trends, chart_rows, config.defaults)
+        + evaluate_resource_rules(resource_trends, resource_series, chart_rows, config.defaults)
+    )
+
+
+def collect_bisect_hints(
+    violations: List[Violation],
+    config: BenchmarkConfig,
+    series_cache: ChartSeriesCache,
+    *,
+    test_ids: Optional[Sequence[str]] = None,
+) -> List[BisectHint]:
+    """Suspect build range for every flagged chart, plus the charts in ``test_ids``."""
+    charts = {chart.test_id: chart for chart in config.charts}
+    rules_by_test: dict[str, list[str]] = {}
+    for item in violations:
+        rules_by_test.setdefault(item.test_id, []).append(item.rule)
+    wanted = list(dict.fromkeys([*rules_by_test, *(test_ids or ())]))
+    hints = []
+    for test_id in wanted:
+        chart = charts.get(test_id)
+        result = series_cache.series(chart) if chart is not None else None
+        if result is None:
+            continue
+        trend = _trend_only(result[0], chart)
+        hint = bisect_hint(chart, trend, config.defaults, rules_by_test.get(test_id, ()))
+        if hint is not None:
+            hints.append(hint)
+    return hints
 
 
 def collect_scenario_summaries(
     metrics: dict[str, pd.DataFrame],
     config: BenchmarkConfig,
+    *,
+    series_cache: Optional[ChartSeriesCache] = None,
 ) -> dict[str, ScenarioSummary]:
     summaries: dict[str, ScenarioSummary] = {}
     defaults = config.defaults
     for chart in config.charts:
         frame = metrics.get(chart.metrics_kind)
-        result = series_for_chart(frame, chart) if frame is not None and not frame.empty else None
+        if series_cache is not None:
+            result = series_cache.series(chart)
+        else:
+            result = series_for_chart(frame, chart) if frame is not None and not frame.empty else None
         if result is None:
             summaries[chart.test_id] = ScenarioSummary(
                 test_id=chart.test_id,
@@ -186,6 +561,10 @@ def collect_scenario_summaries(
         latest = trend.iloc[-1]
         value = float(latest[chart.value_column])
         if chart.metrics_kind == 'performance':
+            noise = (
+                series_cache.noise_model(chart, defaults) if series_cache is not None
+                else chart_noise_model(chart, defaults, chart_rows_for(frame, chart), full_series)
+            )
             ok_warn_threshold = (
                 defaults.slow_threshold_s * (1 - defaults.ok_near_slow_ratio)
             )
@@ -216,13 +595,13 @@ def collect_scenario_summaries(
                 else:
                     reference_value = float(reference_rows[chart.value_column].iloc[0])
                     delta = value - reference_value
-                    if abs(delta) <= reference_value * defaults.regression_pct:
+                    if abs(delta) <= reference_value * noise.regression_pct:
                         vs_reference = 'parity'
                     else:
                         vs_reference = f'{delta:+.3f}s'
                     reference_detail = (
                         f'Latest {value:.3f}s vs reference {reference_value:.3f}s '
-                        f'({delta:+.3f}s); parity is within ±{defaults.regression_pct:.0%}.'
+                        f'({delta:+.3f}s); parity is within {noise.describe()}.'
                     )
             detail = (
                 f'Speed: {speed_status}; fast <{defaults.fast_threshold_s}s, '
@@ -253,10 +632,18 @@ def _ticket_markdown(item: Violation, config: BenchmarkConfig) -> str:
     return f'[#{ticket.issue}]({ticket.url})'
 
 
+def _suspect_range_markdown(item: Violation, hints: dict[str, BisectHint]) -> str:
+    hint = hints.get(item.test_id)
+    if hint is None:
+        return '—'
+    return f'`{hint.last_good_commit[:10]}..{hint.first_bad_commit[:10]}`'
+
+
 def _format_section(
     title: str,
     items: List[Violation],
     config: BenchmarkConfig,
+    hints: dict[str, BisectHint],
 ) -> List[str]:
     lines = [f'## {title}', '']
     if not items:
@@ -264,13 +651,14 @@ def _format_section(
         lines.append('')
         return lines
     lines.extend([
-        '| Test | Variant | Value | Commit | Date | Detail | Ticket |',
-        '|------|---------|-------|--------|------|--------|--------|',
+        '| Test | Variant | Value | Commit | Date | Detail | Suspect range | Ticket |',
+        '|------|---------|-------|--------|------|--------|---------------|--------|',
     ])
     for item in sorted(items, key=lambda entry: entry.value, reverse=True):
         lines.append(
-            f'| {item.test_id} | {item.variant} | {item.value:.3f}s '
+            f'| {item.test_id} | {item.variant} | {format_violation_value(item)} '
             f'| `{item.commit_hash[:10]}` | {item.date} | {item.detail} '
+            f'| {_suspect_range_markdown(item, hints)} '
             f'| {_ticket_markdown(item, config)} |'
         )
     lines.append('')
@@ -283,13 +671,34 @@ def write_regression_report(
     output_path: Path,
     *,
     violations: Optional[List[Violation]] = None,
+    series_cache: Optional[ChartSeriesCache] = None,
+    resource_metrics: Optional[dict[str, Optional[pd.DataFrame]]] = None,
+    bisect_hints: Optional[List[BisectHint]] = None,
 ) -> List[Violation]:
+    """Write the flags report; without a ``series_cache`` the CPU and RAM rules
+    read ``resource_metrics`` (metrics kind -> frame)."""
+    if series_cache is None:
+        series_cache = ChartSeriesCache(
+            {**(resource_metrics or {}), 'performance': metrics}, config.charts,
+        )
     if violations is None:
-        violations = collect_violations(metrics, config)
+        violations = collect_violations(metrics, config, series_cache=series_cache)
+    if bisect_hints is None:
+        bisect_hints = collect_bisect_hints(violations, config, series_cache)
+    hints = {hint.test_id: hint for hint in bisect_hints}
     by_rule = {
         'Regression': [v for v in violations if v.rule == '2.1 Regression'],
         'Slow builds': [v for v in violations if v.rule == '2.2 Slow build'],
         'Backlog candidates': [v for v in violations if v.rule == '2.3 Backlog candidate'],
+        'Level shifts': [v for v in violations if v.rule == '2.4 Level shift'],
+        'Significant regressions': [
+            v for v in violations if v.rule == '2.5 Significant regression'
+        ],
+        'RAM growth': [v for v in violations if v.rule == '3.1 RAM growth'],
+        'Peak RAM': [v for v in violations if v.rule == '3.2 Peak RAM'],
+        'RAM trends': [v for v in violations if v.rule == '3.3 RAM trend'],
+        'CPU spikes': [v for v in violations if v.rule == '3.4 CPU spike'],
+        'CPU trends': [v for v in violations if v.rule == '3.5 CPU trend'],
     }
 
     lines = [
@@ -301,7 +710,7 @@ def write_regression_report(
         '',
     ]
     for rule_title, items in by_rule.items():
-        lines.extend(_format_section(rule_title, items, config))
+        lines.extend(_format_section(rule_title, items, config, hints))
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text('\n'.join(lines), encoding='utf-8')
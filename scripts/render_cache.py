@@ -0,0 +1,68 @@
+"""Manifest of rendered chart assets keyed by a hash of everything that shapes them."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+RENDER_MANIFEST = 'render_manifest.json'
+
+
+def render_key(parts: Iterable[str]) -> str:
+    """SHA-256 over ``parts``, separated so adjacent values cannot run together."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """graph_filename -> render key of the PNG + HTML currently on disk."""
+
+    def __init__(self, output_dir: Path, keys: Optional[Dict[str, str]] = None):
+        self.output_dir = output_dir
+        self.keys: Dict[str, str] = dict(keys or {})
+
+    @classmethod
+    def load(cls, output_dir: Path) -> RenderCache:
+        path = output_dir / RENDER_MANIFEST
+        if not path.exists():
+            return cls(output_dir)
+        try:
+            payload = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as error:
+            print(f'Warning: ignoring unreadable {RENDER_MANIFEST}: {error}')
+            return cls(output_dir)
+        return cls(output_dir, payload.get('charts', {}))
+
+    def is_fresh(self, graph_filename: str, key: str, asset_filename: Optional[str] = None) -> bool:
+        """True when the stored key matches and the PNG (and charts/ asset, if any) still exist."""
+        if self.keys.get(graph_filename) != key:
+            return False
+        return (self.output_dir / graph_filename).exists() and (
+            asset_filename is None or (self.output_dir / 'charts' / asset_filename).exists()
+        )
+
+    def store(self, graph_filename: str, key: str) -> None:
+        self.keys[graph_filename] = key
+
+    def discard(self, graph_filename: str) -> None:
+        self.keys.pop(graph_filename, None)
+
+    def retain(self, graph_filenames: Iterable[str]) -> list[str]:
+        """Drop entries for charts no longer configured; return the dropped names."""
+        expected = set(graph_filenames)
+        dropped = sorted(name for name in self.keys if name not in expected)
+        for name in dropped:
+            del self.keys[name]
+        return dropped
+
+    def save(self) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        payload = {'charts': dict(sorted(self.keys.items()))}
+        (self.output_dir / RENDER_MANIFEST).write_text(
+            json.dumps(payload, indent=2) + '\n', encoding='utf-8',
+        )
@@ -0,0 +1,102 @@
+"""Ledger of processed benchmark runs so `parse` is idempotent across Jenkins retries."""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Mapping
+
+RUN_LEDGER_CSV = 'processed_runs.csv'
+RUN_LEDGER_FIELDS = ('commit_hash', 'date', 'bundle_hash', 'test_cases', 'device')
+
+
+@dataclass(frozen=True)
+class ProcessedRun:
+    commit_hash: str
+    date: str
+    bundle_hash: str
+    test_cases: int
+    # Devices the run wrote rows for, comma-separated (Android dumps); empty on desktop.
+    device: str = ''
+
+
+def bundle_content_hash(json_files: Iterable[Path]) -> str:
+    """SHA-256 over test-case file names and contents, independent of glob order."""
+    digest = hashlib.sha256()
+    for json_file in sorted(json_files, key=lambda path: path.name):
+        digest.update(json_file.name.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(json_file.read_bytes())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def bundle_digest(file_digests: Mapping[str, str]) -> str:
+    """SHA-256 over per-file name and digest pairs, independent of parse order."""
+    digest = hashlib.sha256()
+    for name in sorted(file_digests):
+        digest.update(f'{name}\0{file_digests[name]}\0'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_run_ledger(data_dir: Path) -> List[ProcessedRun]:
+    path = data_dir / RUN_LEDGER_CSV
+    if not path.exists():
+        return []
+    with open(path, newline='', encoding='utf-8') as handle:
+        return [
+            ProcessedRun(
+                commit_hash=row['commit_hash'],
+                date=row['date'],
+                bundle_hash=row['bundle_hash'],
+                test_cases=int(row.get('test_cases') or 0),
+                device=row.get('device') or '',
+            )
+            for row in csv.DictReader(handle)
+        ]
+
+
+def matching_runs(
+    ledger: Iterable[ProcessedRun],
+    commit_hash: str,
+    date: str,
+    bundle_hash: str,
+    device: str = '',
+) -> List[ProcessedRun]:
+    """Ledger entries this run supersedes: same commit and device, and same date or bundle."""
+    return [
+        entry for entry in ledger
+        if entry.commit_hash == commit_hash
+        and entry.device == device
+        and (entry.date == date or entry.bundle_hash == bundle_hash)
+    ]
+
+
+def record_processed_run(
+    data_dir: Path,
+    run: ProcessedRun,
+    *,
+    replaces: Iterable[ProcessedRun] = (),
+) -> None:
+    """Write the ledger with ``run`` added and any superseded entries dropped."""
+    superseded = set(replaces)
+    entries = [
+        entry for entry in load_run_ledger(data_dir)
+        if entry not in superseded and entry != run
+    ]
+    entries.append(run)
+
+    data_dir.mkdir(parents=True, exist_ok=True)
+    with open(data_dir / RUN_LEDGER_CSV, 'w', newline='', encoding='utf-8') as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(RUN_LEDGER_FIELDS))
+        writer.writeheader()
+        for entry in entries:
+            writer.writerow({
+                'commit_hash': entry.commit_hash,
+                'date': entry.date,
+                'bundle_hash': entry.bundle_hash,
+                'test_cases': entry.test_cases,
+                'device': entry.device,
+            })
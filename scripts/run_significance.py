@@ -0,0 +1,118 @@
+"""Significance tests on the individual runs stored in ``all_runs``.
+
+The latest build's runs are compared with a baseline sample (the runs of the
+reference build, or of the builds just before the latest) by a one-sided
+Mann-Whitney rank test, with a bootstrap confidence interval for the shift in
+median. Everything is NumPy; p-values come from exact enumeration when the
+number of rank assignments is small and from random permutations otherwise.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import combinations
+from math import comb
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+PERMUTATIONS = 10_000
+BOOTSTRAP_RESAMPLES = 2_000
+CONFIDENCE_LEVEL = 0.95
+MIN_RUNS = 3
+# Fixed so a report regenerated from the same data flags the same builds.
+RANDOM_SEED = 0
+
+
+@dataclass(frozen=True)
+class RunComparison:
+    latest_median: float
+    baseline_median: float
+    p_value: float
+    shift_low: float
+    shift_high: float
+    latest_runs: int
+    baseline_runs: int
+
+    @property
+    def shift(self) -> float:
+        return self.latest_median - self.baseline_median
+
+
+def runs_by_build(rows: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """commit_hash -> every run value of that build's rows, parsed from ``all_runs``."""
+    if rows is None or rows.empty or 'all_runs' not in rows:
+        return {}
+    runs = pd.DataFrame({
+        'commit_hash': rows['commit_hash'].astype(str).to_numpy(),
+        'run': rows['all_runs'].astype(str).str.split(',').to_numpy(),
+    }).explode('run')
+    runs['run'] = pd.to_numeric(runs['run'].str.strip(), errors='coerce')
+    runs = runs.dropna(subset=['run'])
+    return {
+        commit_hash: group.to_numpy(dtype=float)
+        for commit_hash, group in runs.groupby('commit_hash', sort=False)['run']
+    }
+
+
+def _midranks(values: np.ndarray) -> np.ndarray:
+    """1-based ranks with ties sharing their average rank."""
+    order = np.argsort(values, kind='mergesort')
+    sorted_values = values[order]
+    starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    ends = np.r_[starts[1:], len(values)]
+    ranks = np.empty(len(values))
+    ranks[order] = np.repeat((starts + ends + 1) / 2.0, ends - starts)
+    return ranks
+
+
+def mann_whitney_p_value(
+    latest: np.ndarray,
+    baseline: np.ndarray,
+    *,
+    permutations: int = PERMUTATIONS,
+) -> float:
+    """One-sided p-value that ``latest`` tends to be larger than ``baseline``."""
+    ranks = _midranks(np.concatenate((latest, baseline)))
+    size = len(latest)
+    observed = ranks[:size].sum()
+    if comb(len(ranks), size) <= permutations:
+        picks = np.array(list(combinations(range(len(ranks)), size)))
+        return float(np.mean(ranks[picks].sum(axis=1) >= observed - 1e-9))
+    rng = np.random.default_rng(RANDOM_SEED)
+    shuffled = rng.permuted(np.tile(ranks, (permutations, 1)), axis=1)
+    exceed = np.count_nonzero(shuffled[:, :size].sum(axis=1) >= observed - 1e-9)
+    return float((exceed + 1) / (permutations + 1))
+
+
+def bootstrap_median_shift(
+    latest: np.ndarray,
+    baseline: np.ndarray,
+    *,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    level: float = CONFIDENCE_LEVEL,
+) -> tuple[float, float]:
+    """Percentile interval for median(latest) - median(baseline)."""
+    rng = np.random.default_rng(RANDOM_SEED)
+    latest_medians = np.median(rng.choice(latest, (resamples, len(latest))), axis=1)
+    baseline_medians = np.median(rng.choice(baseline, (resamples, len(baseline))), axis=1)
+    tail = (1.0 - level) / 2.0
+    low, high = np.quantile(latest_medians - baseline_medians, [tail, 1.0 - tail])
+    return float(low), float(high)
+
+
+def compare_runs(latest: np.ndarray, baseline: np.ndarray) -> Optional[RunComparison]:
+    """Test and interval for one build against a baseline; None with too few runs."""
+    if len(latest) < MIN_RUNS or len(baseline) < MIN_RUNS:
+        return None
+    low, high = bootstrap_median_shift(latest, baseline)
+    return RunComparison(
+        latest_median=float(np.median(latest)),
+        baseline_median=float(np.median(baseline)),
+        p_value=mann_whitney_p_value(latest, baseline),
+        shift_low=low,
+        shift_high=high,
+        latest_runs=len(latest),
+        baseline_runs=len(baseline),
+    )
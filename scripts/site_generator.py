@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from html import escape
 from pathlib import Path
 from typing import Optional
@@ -10,15 +11,21 @@ import pandas as pd
 
 from benchmark_config import (
     CHART_WINDOW_DAYS,
+    LAYOUT_TEMPLATE_JSON,
     BenchmarkPage,
+    ChartDefaults,
     ChartEntry,
     ChartTest,
     FlagTicket,
 )
+from bisect_hint import BisectHint
 from environment_parser import RUN_ENVIRONMENT_FIELDS
-from regression_report import ScenarioSummary, Violation
+from regression_report import ScenarioSummary, Violation, format_violation_value
 
 CHARTS_DIR = 'charts'
+BUNDLES_DIR = 'bundles'
+CHART_RENDERER_JS = 'chart_renderer.js'
+CHART_ACTIVATION_JS = 'chart_activation.js'
 SITE_TITLE = 'Status App Benchmarks'
 MACHINE_FIELD_LABELS = {
     'hostname': 'Host',
@@ -46,11 +53,25 @@ FLAG_BADGE_BY_RULE = {
     '2.1 Regression': ('slow', '↗ Regression'),
     '2.2 Slow build': ('ok-warn', '⏱ Slow'),
     '2.3 Backlog candidate': ('backlog', 'Backlog'),
+    '2.4 Level shift': ('slow', '⤒ Level shift'),
+    '2.5 Significant regression': ('slow', '± Significant'),
+    '3.1 RAM growth': ('slow', '↗ RAM'),
+    '3.2 Peak RAM': ('slow', '⛔ Peak RAM'),
+    '3.3 RAM trend': ('ok-warn', '↗ RAM trend'),
+    '3.4 CPU spike': ('slow', '↗ CPU'),
+    '3.5 CPU trend': ('ok-warn', '↗ CPU trend'),
 }
 FLAG_BADGE_BY_SECTION = {
     'Regression': ('slow', '↗ Regression'),
     'Slow builds': ('ok-warn', '⏱ Slow'),
     'Backlog candidates': ('backlog', 'Backlog'),
+    'Level shifts': ('slow', '⤒ Level shift'),
+    'Significant regressions': ('slow', '± Significant'),
+    'RAM growth': ('slow', '↗ RAM'),
+    'Peak RAM': ('slow', '⛔ Peak RAM'),
+    'RAM trends': ('ok-warn', '↗ RAM trend'),
+    'CPU spikes': ('slow', '↗ CPU'),
+    'CPU trends': ('ok-warn', '↗ CPU trend'),
 }
 
 
@@ -396,7 +417,9 @@ def _page_styles() -> str:
       padding: 1rem 1.25rem 1.25rem;
       margin-bottom: 1.5rem;
     }
-    section.chart iframe {
+    section.chart iframe,
+    section.chart .chart-canvas,
+    section.chart .chart-preview {
       width: 100%;
       height: 600px;
       border: 0;
@@ -404,6 +427,16 @@ def _page_styles() -> str:
       background: #fff;
       display: block;
     }
+    section.chart .chart-preview {
+      padding: 0;
+      cursor: pointer;
+    }
+    section.chart .chart-preview img {
+      width: 100%;
+      height: 100%;
+      object-fit: contain;
+      display: block;
+    }
     .chart-footnote {
       color: var(--muted);
       font-size: 0.85rem;
@@ -469,16 +502,29 @@ def _page_styles() -> str:
     """
 
 
-def _layout(title: str, body: str) -> str:
+def _layout(
+    title: str,
+    body: str,
+    *,
+    chart_bundle: str = '',
+    scripts: tuple[str, ...] = (),
+) -> str:
+    body_attrs = ''
+    if chart_bundle:
+        scripts = (*scripts, CHART_RENDERER_JS)
+        body_attrs = f' data-chart-bundle="{escape(chart_bundle, quote=True)}"'
+    renderer = ''.join(
+        f'\n  <script src="{escape(script, quote=True)}" defer></script>' for script in scripts
+    )
     return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="utf-8">
   <meta name="viewport" content="width=device-width, initial-scale=1">
   <title>{escape(title)} — {SITE_TITLE}</title>
-  <style>{_page_styles()}</style>
+  <style>{_page_styles()}</style>{renderer}
 </head>
-<body>
+<body{body_attrs}>
   <header><a href="index.html">{SITE_TITLE}</a></header>
   <main>{body}</main>
 </body>
@@ -583,14 +629,165 @@ def _placeholder_section(title: str) -> str:
 
 
 def _chart_section(chart: ChartEntry) -> str:
+    """Static PNG preview; chart_activation.js swaps in the interactive iframe."""
     chart_path = f'{CHARTS_DIR}/{chart.html_filename}'
+    png_path = Path(chart.html_filename).with_suffix('.png').name
     return (
-        '<section class="chart">'
-        f'{_chart_iframe(chart_path, chart.display_name)}'
+        f'<section class="chart" data-chart-src="{escape(chart_path, quote=True)}" '
+        f'data-chart-title="{escape(chart.display_name, quote=True)}">'
+        '<button type="button" class="chart-preview" title="Open the interactive chart">'
+        f'<img src="{escape(png_path, quote=True)}" '
+        f'alt="{escape(chart.display_name, quote=True)}" loading="lazy" decoding="async">'
+        '</button>'
+        f'<noscript>{_chart_iframe(chart_path, chart.display_name)}</noscript>'
         '</section>'
     )
 
 
+# Shared by iframe-mode pages. A chart becomes interactive when its preview is
+# clicked or stays at least half visible for DWELL_MS, and drops back to the PNG
+# once it is more than UNLOAD_MARGIN off-screen, so only the charts being looked
+# at keep a Plotly document alive.
+_CHART_ACTIVATION_SCRIPT = """(() => {
+  const DWELL_MS = 1200;
+  const UNLOAD_MARGIN = '1500px 0px';
+  const sections = document.querySelectorAll('section.chart[data-chart-src]');
+  if (!sections.length) return;
+
+  const previews = new Map();
+  const timers = new Map();
+
+  const activate = (section) => {
+    if (previews.has(section)) return;
+    const frame = document.createElement('iframe');
+    frame.src = section.dataset.chartSrc;
+    frame.title = section.dataset.chartTitle || '';
+    frame.setAttribute('scrolling', 'no');
+    const preview = section.querySelector('.chart-preview');
+    previews.set(section, preview);
+    preview.replaceWith(frame);
+  };
+  const deactivate = (section) => {
+    const preview = previews.get(section);
+    if (!preview) return;
+    previews.delete(section);
+    section.querySelector('iframe').replaceWith(preview);
+  };
+
+  sections.forEach((section) => {
+    section.querySelector('.chart-preview').addEventListener('click', () => activate(section));
+  });
+  if (!('IntersectionObserver' in window)) return;
+
+  const dwell = new IntersectionObserver((entries) => {
+    for (const entry of entries) {
+      const section = entry.target;
+      if (entry.isIntersecting) {
+        if (!timers.has(section)) {
+          timers.set(section, setTimeout(() => {
+            timers.delete(section);
+            activate(section);
+          }, DWELL_MS));
+        }
+      } else {
+        clearTimeout(timers.get(section));
+        timers.delete(section);
+      }
+    }
+  }, { threshold: 0.5 });
+  const unload = new IntersectionObserver((entries) => {
+    for (const entry of entries) {
+      if (!entry.isIntersecting) deactivate(entry.target);
+    }
+  }, { rootMargin: UNLOAD_MARGIN });
+  sections.forEach((section) => {
+    dwell.observe(section);
+    unload.observe(section);
+  });
+})();
+"""
+
+
+def _chart_canvas_section(test_id: str, chart: ChartEntry) -> str:
+    return (
+        f'<section class="chart" data-chart="{escape(test_id, quote=True)}">'
+        f'<div class="chart-canvas" role="img" aria-label="{escape(chart.display_name, quote=True)}">'
+        '</div>'
+        '</section>'
+    )
+
+
+# Shared by every bundle-mode page: fetches the page's JSON bundle and loads Plotly
+# once, then draws each chart only when it scrolls near the viewport.
+_CHART_RENDERER_SCRIPT = """(() => {
+  const bundleUrl = document.body.dataset.chartBundle;
+  const sections = document.querySelectorAll('section.chart[data-chart]');
+  if (!bundleUrl || !sections.length) return;
+
+  let bundle = null;
+  let plotly = null;
+  const loadBundle = () => bundle || (bundle = fetch(bundleUrl).then((response) => response.json()));
+  const loadPlotly = () => plotly || (plotly = new Promise((resolve, reject) => {
+    const script = document.createElement('script');
+    script.src = '%(charts_dir)s/plotly.min.js';
+    script.onload = () => resolve(window.Plotly);
+    script.onerror = reject;
+    document.head.appendChild(script);
+  }));
+
+  const draw = (section) => Promise.all([loadBundle(), loadPlotly()]).then(([data, Plotly]) => {
+    const figure = data.charts[section.dataset.chart];
+    if (!figure) return;
+    const layout = Object.assign({}, figure.layout, { template: data.template });
+    Plotly.newPlot(section.querySelector('.chart-canvas'), figure.data, layout, { responsive: true });
+  });
+
+  if (!('IntersectionObserver' in window)) {
+    sections.forEach(draw);
+    return;
+  }
+  const observer = new IntersectionObserver((entries) => {
+    for (const entry of entries) {
+      if (!entry.isIntersecting) continue;
+      observer.unobserve(entry.target);
+      draw(entry.target);
+    }
+  }, { rootMargin: '300px 0px' });
+  sections.forEach((section) => observer.observe(section));
+})();
+""" % {'charts_dir': CHARTS_DIR}
+
+
+def _write_chart_bundle(
+    output_dir: Path,
+    slug: str,
+    charts: list[tuple[str, ChartEntry]],
+) -> str:
+    """Write one page's figures (without the shared template) as a single JSON file."""
+    charts_dir = output_dir / CHARTS_DIR
+    template_path = charts_dir / LAYOUT_TEMPLATE_JSON
+    template = (
+        json.loads(template_path.read_text(encoding='utf-8'))
+        if template_path.exists() else {}
+    )
+    figures = {}
+    for test_id, chart in charts:
+        figure_path = charts_dir / chart.data_filename
+        if not figure_path.exists():
+            print(f'Warning: missing chart data {CHARTS_DIR}/{chart.data_filename}')
+            continue
+        figures[test_id] = json.loads(figure_path.read_text(encoding='utf-8'))
+
+    bundles_dir = output_dir / BUNDLES_DIR
+    bundles_dir.mkdir(parents=True, exist_ok=True)
+    bundle_name = f'{BUNDLES_DIR}/{slug}.json'
+    (output_dir / bundle_name).write_text(
+        json.dumps({'template': template, 'charts': figures}, separators=(',', ':')),
+        encoding='utf-8',
+    )
+    return bundle_name
+
+
 def _is_zero_stat(value: str) -> bool:
     normalized = value.strip().lower()
     return normalized in ('0', 'tbd', '—', '-', '')
@@ -944,14 +1141,25 @@ def _ticket_cell_html(
     )
 
 
+def _suspect_range_cell_html(item: Violation, bisect_hints: dict[str, BisectHint]) -> str:
+    hint = bisect_hints.get(item.test_id)
+    if hint is None:
+        return '—'
+    return (
+        f'<code title="{escape(hint.describe(), quote=True)}">'
+        f'{escape(hint.last_good_commit[:10])}..{escape(hint.first_bad_commit[:10])}</code>'
+    )
+
+
 def _regression_violation_row(
     item: Violation,
     flag_tickets: dict[str, FlagTicket],
+    bisect_hints: dict[str, BisectHint],
 ) -> str:
     commit = escape(item.commit_hash[:10])
     value_cell = (
         '<div class="load-time-cell">'
-        f'<span class="metric-value">{item.value:.3f}s</span>'
+        f'<span class="metric-value">{format_violation_value(item)}</span>'
         f'{_flag_badge_for_rule(item.rule)}'
         '</div>'
     )
@@ -963,6 +1171,7 @@ def _regression_violation_row(
         f'<td data-label="Commit"><code>{commit}</code></td>'
         f'<td data-label="Date">{escape(item.date)}</td>'
         f'<td data-label="Detail">{escape(item.detail)}</td>'
+        f'<td data-label="Suspect range">{_suspect_range_cell_html(item, bisect_hints)}</td>'
         f'<td data-label="Ticket">{_ticket_cell_html(item, flag_tickets)}</td>'
         '</tr>'
     )
@@ -972,6 +1181,7 @@ def _regression_section(
     title: str,
     items: list[Violation],
     flag_tickets: dict[str, FlagTicket],
+    bisect_hints: dict[str, BisectHint],
 ) -> str:
     heading = _section_heading(title, len(items))
     if not items:
@@ -981,46 +1191,100 @@ def _regression_section(
         )
     sorted_items = sorted(items, key=lambda item: item.value, reverse=True)
     rows = ''.join(
-        _regression_violation_row(item, flag_tickets) for item in sorted_items
+        _regression_violation_row(item, flag_tickets, bisect_hints) for item in sorted_items
     )
     return (
         f'<section class="summary-profile">{heading}'
         '<table class="summary-table"><thead><tr>'
         '<th>Test</th><th>Variant</th><th>Value</th><th>Commit</th>'
-        '<th>Date</th><th>Detail</th><th>Ticket</th>'
+        '<th>Date</th><th>Detail</th><th>Suspect range</th><th>Ticket</th>'
         f'</tr></thead><tbody>{rows}</tbody></table></section>'
     )
 
 
+def _flag_legend_html(defaults: ChartDefaults) -> str:
+    """One legend item per flag rule, with the thresholds from ``[defaults]``."""
+    if defaults.significance_compare_to == 'reference':
+        significance_baseline = 'the reference build\'s runs'
+    else:
+        significance_baseline = f'the previous {defaults.significance_window} builds\' runs'
+    if defaults.adaptive_thresholds:
+        regression_threshold = (
+            f'the chart\'s noise-sized threshold ({defaults.regression_pct_min * 100:g}–'
+            f'{defaults.regression_pct_max:.0%}, {defaults.regression_pct:.0%} without run data)'
+        )
+    else:
+        regression_threshold = f'{defaults.regression_pct:.0%}'
+    return (
+        '<p class="subtitle regression-legend">'
+        '<span class="regression-legend-item">'
+        f'{_flag_badge("slow", "↗ Regression")}'
+        f'{defaults.regression_consecutive} consecutive builds each slower than the previous by '
+        f'{regression_threshold}, with the latest runs '
+        f'significantly slower (p<{defaults.significance_alpha:g}) where run data exists.</span>'
+        '<span class="regression-legend-item">'
+        f'{_flag_badge("ok-warn", "⏱ Slow")}'
+        f'latest value exceeds {defaults.slow_threshold_s}s slow threshold '
+        '(and not yet a backlog candidate).</span>'
+        '<span class="regression-legend-item">'
+        f'{_flag_badge("backlog", "Backlog")}'
+        f'slow in {defaults.backlog_slow_min_count} of the last {defaults.backlog_slow_of_last_n} '
+        'builds (listed here instead of Slow).</span>'
+        '<span class="regression-legend-item">'
+        f'{_flag_badge("slow", "⤒ Level shift")}'
+        f'trend stepped up ≥{defaults.change_point_min_pct:.0%} and stayed for '
+        f'{defaults.change_point_min_builds}+ builds (change-point detection).</span>'
+        '<span class="regression-legend-item">'
+        f'{_flag_badge("slow", "± Significant")}'
+        f'latest build\'s runs ≥{defaults.significance_min_pct:.0%} slower than '
+        f'{significance_baseline} (Mann-Whitney p<{defaults.significance_alpha:g}).</span>'
+        '<span class="regression-legend-item">'
+        f'{_flag_badge("slow", "↗ RAM")}'
+        f'RAM ≥{defaults.ram_growth_mb:g} MB above the reference build; '
+        f'{_flag_badge("slow", "⛔ Peak RAM")} peak above {defaults.ram_ceiling_mb:g} MB.</span>'
+        '<span class="regression-legend-item">'
+        f'{_flag_badge("slow", "↗ CPU")}'
+        f'CPU ≥{defaults.cpu_growth_pct:g} points above the reference build.</span>'
+        '<span class="regression-legend-item">'
+        f'{_flag_badge("ok-warn", "↗ RAM trend")}{_flag_badge("ok-warn", "↗ CPU trend")}'
+        f'rising ≥{defaults.ram_slope_mb_per_build:g} MB or ≥{defaults.cpu_slope_pct_per_build:g} '
+        f'CPU points per build over the last {defaults.resource_slope_window} builds.</span>'
+        '</p>'
+    )
+
+
 def _regression_page(
     violations: list[Violation],
     flag_tickets: dict[str, FlagTicket] | None = None,
+    bisect_hints: list[BisectHint] | None = None,
+    defaults: ChartDefaults | None = None,
 ) -> str:
     tickets = flag_tickets or {}
+    hints = {hint.test_id: hint for hint in bisect_hints or []}
+    defaults = defaults or ChartDefaults()
     by_rule = {
         'Regression': [v for v in violations if v.rule == '2.1 Regression'],
         'Slow builds': [v for v in violations if v.rule == '2.2 Slow build'],
         'Backlog candidates': [v for v in violations if v.rule == '2.3 Backlog candidate'],
+        'Level shifts': [v for v in violations if v.rule == '2.4 Level shift'],
+        'Significant regressions': [
+            v for v in violations if v.rule == '2.5 Significant regression'
+        ],
+        'RAM growth': [v for v in violations if v.rule == '3.1 RAM growth'],
+        'Peak RAM': [v for v in violations if v.rule == '3.2 Peak RAM'],
+        'RAM trends': [v for v in violations if v.rule == '3.3 RAM trend'],
+        'CPU spikes': [v for v in violations if v.rule == '3.4 CPU spike'],
+        'CPU trends': [v for v in violations if v.rule == '3.5 CPU trend'],
     }
     sections = ''.join(
-        _regression_section(title, items, tickets)
+        _regression_section(title, items, tickets, hints)
         for title, items in by_rule.items()
     )
     return (
         '<nav class="back"><a href="index.html">← Dashboard</a></nav>'
         '<h1>Flags</h1>'
         '<p class="subtitle">Automated flags from nightly performance data.</p>'
-        '<p class="subtitle regression-legend">'
-        '<span class="regression-legend-item">'
-        f'{_flag_badge("slow", "↗ Regression")}'
-        '3 consecutive builds each ≥15% slower than the previous.</span>'
-        '<span class="regression-legend-item">'
-        f'{_flag_badge("ok-warn", "⏱ Slow")}'
-        'latest value exceeds 1.0s slow threshold (and not yet a backlog candidate).</span>'
-        '<span class="regression-legend-item">'
-        f'{_flag_badge("backlog", "Backlog")}'
-        'slow in 3 of the last 5 builds (listed here instead of Slow).</span>'
-        '</p>'
+        f'{_flag_legend_html(defaults)}'
         f'<p class="subtitle"><strong>Total flags:</strong> {len(violations)}</p>'
         f'{sections}'
     )
@@ -1048,6 +1312,9 @@ def write_site(
     run_environment: pd.DataFrame | None = None,
     violations: list[Violation] | None = None,
     flag_tickets: dict[str, FlagTicket] | None = None,
+    bisect_hints: list[BisectHint] | None = None,
+    defaults: ChartDefaults | None = None,
+    site_mode: str = 'iframe',
 ) -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
     env_frame = run_environment if run_environment is not None else pd.DataFrame()
@@ -1088,13 +1355,22 @@ def write_site(
     print('Generated summary.html')
 
     (output_dir / 'regression_report.html').write_text(
-        _layout('Flags', _regression_page(regression_violations, tickets)),
+        _layout('Flags', _regression_page(
+            regression_violations, tickets, bisect_hints, defaults,
+        )),
         encoding='utf-8',
     )
     print('Generated regression_report.html')
 
     expected_pages = {f'{page.slug}.html' for page in pages} | {'summary.html', 'regression_report.html'}
+    bundled = site_mode == 'bundle'
+    if bundled:
+        (output_dir / CHART_RENDERER_JS).write_text(_CHART_RENDERER_SCRIPT, encoding='utf-8')
+    any_previews = False
+    written_bundles: set[str] = set()
     for page in pages:
+        bundle_charts: list[tuple[str, ChartEntry]] = []
+        has_previews = False
         area_sections = []
         for area, area_label in PRODUCT_AREAS:
             test_ids = [
@@ -1107,7 +1383,11 @@ def write_site(
                 sections = []
                 for test_id in test_ids:
                     chart = charts_by_test_id.get(test_id)
-                    if chart is not None:
+                    if chart is not None and bundled and chart.data_filename:
+                        bundle_charts.append((test_id, chart))
+                        sections.append(_chart_canvas_section(test_id, chart))
+                    elif chart is not None:
+                        has_previews = True
                         sections.append(_chart_section(chart))
                     else:
                         sections.append(_placeholder_section(charts_by_id[test_id].display_name))
@@ -1122,16 +1402,35 @@ def write_site(
             f'{_profile_details(page)}'
             f'{"".join(area_sections)}'
         )
+        chart_bundle = (
+            _write_chart_bundle(output_dir, page.slug, bundle_charts) if bundle_charts else ''
+        )
+        if chart_bundle:
+            written_bundles.add(Path(chart_bundle).name)
         (output_dir / f'{page.slug}.html').write_text(
-            _layout(page.title, page_body),
+            _layout(
+                page.title, page_body,
+                chart_bundle=chart_bundle,
+                scripts=(CHART_ACTIVATION_JS,) if has_previews else (),
+            ),
             encoding='utf-8',
         )
+        any_previews = any_previews or has_previews
         print(f'Generated {page.slug}.html')
+    if any_previews:
+        (output_dir / CHART_ACTIVATION_JS).write_text(_CHART_ACTIVATION_SCRIPT, encoding='utf-8')
 
     for stale_page in output_dir.glob('*.html'):
         if stale_page.name != 'index.html' and stale_page.name not in expected_pages:
             stale_page.unlink()
             print(f'Removed stale page: {stale_page.name}')
+    # A page with no bundled charts left loads no bundle, so its old one is stale too.
+    for stale_bundle in (output_dir / BUNDLES_DIR).glob('*.json'):
+        if stale_bundle.name not in written_bundles:
+            stale_bundle.unlink()
+            print(f'Removed stale bundle: {BUNDLES_DIR}/{stale_bundle.name}')
+    if not bundled and (output_dir / CHART_RENDERER_JS).exists():
+        (output_dir / CHART_RENDERER_JS).unlink()
 
     write_github_readme(
         output_dir, pages, charts_by_test_id,
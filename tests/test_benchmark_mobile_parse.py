@@ -0,0 +1,52 @@
+import csv
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))
+
+from benchmark_mobile import PERFORMANCE_CSV, process_android_run  # noqa: E402
+
+COMMIT = 'abc'
+DATE = '2026-08-04T12:00:00'
+
+
+def _write_dump(path: Path, device: str, values) -> Path:
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['test_name', 'metric', 'unit', 'device', 'value'])
+        for value in values:
+            writer.writerow(['test_android_settings_response_time', 'response_time', 's', device, value])
+    return path
+
+
+def _rows(data_dir: Path):
+    with open(data_dir / PERFORMANCE_CSV, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def test_two_devices_same_commit_and_date_keep_both(tmp_path):
+    data_dir = tmp_path / 'data'
+    first = _write_dump(tmp_path / 'sm.csv', 'SM-A366B', ['1.1', '1.2'])
+    second = _write_dump(tmp_path / 'moto.csv', 'moto_g55_5G', ['2.1', '2.2'])
+
+    assert process_android_run([first], data_dir, COMMIT, DATE)
+    assert process_android_run([second], data_dir, COMMIT, DATE)
+
+    assert sorted(row['device'] for row in _rows(data_dir)) == ['SM-A366B', 'moto_g55_5G']
+
+
+def test_reparse_replaces_only_that_devices_rows(tmp_path):
+    data_dir = tmp_path / 'data'
+    first = _write_dump(tmp_path / 'sm.csv', 'SM-A366B', ['1.1', '1.2'])
+    second = _write_dump(tmp_path / 'moto.csv', 'moto_g55_5G', ['2.1', '2.2'])
+    assert process_android_run([first], data_dir, COMMIT, DATE)
+    assert process_android_run([second], data_dir, COMMIT, DATE)
+
+    # Unchanged dumps are skipped; corrected dumps replace that device's rows only.
+    assert process_android_run([first], data_dir, COMMIT, DATE)
+    assert len(_rows(data_dir)) == 2
+    _write_dump(first, 'SM-A366B', ['1.3', '1.4'])
+    assert process_android_run([first], data_dir, COMMIT, DATE)
+
+    by_device = {row['device']: row['all_runs'] for row in _rows(data_dir)}
+    assert by_device == {'SM-A366B': '1.3,1.4', 'moto_g55_5G': '2.1,2.2'}